@@ -2,17 +2,18 @@
 
 """Main ADKAgent implementation for bridging AG-UI Protocol with Google ADK."""
 
-from typing import Optional, Dict, Callable, Any, AsyncGenerator, List
-import time
+from typing import Optional, Dict, Callable, Any, AsyncGenerator, List, Set, Mapping, Tuple, NamedTuple
 import json
 import asyncio
 import inspect
-from datetime import datetime
+from functools import lru_cache
+from collections import OrderedDict, deque
+from types import MappingProxyType
 
 from ag_ui.core import (
     RunAgentInput, BaseEvent, EventType,
     RunStartedEvent, RunFinishedEvent, RunErrorEvent,
-    ToolCallEndEvent, SystemMessage,ToolCallResultEvent
+    SystemMessage
 )
 
 from google.adk import Runner
@@ -27,13 +28,78 @@ from google.genai import types
 
 from .event_translator import EventTranslator
 from .session_manager import SessionManager
-from .execution_state import ExecutionState
+from .execution_state import ExecutionState, EventQueue
 from .client_proxy_toolset import ClientProxyToolset
+from .utils.serialization import json_loads
 
 import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _format_thread_user(thread_id: str) -> str:
+    """Build the default user ID for a thread."""
+    return f"thread_user_{thread_id}"
+
+
+# Queue marker signalling that an execution exceeded its timeout
+_EXECUTION_TIMEOUT = object()
+
+# Upper bound on cached session_id -> metadata entries
+_SESSION_LOOKUP_CACHE_SIZE = 10_000
+
+# Upper bound on cached agent copies with a SystemMessage appended
+_AGENT_COPY_CACHE_SIZE = 64
+
+# Upper bound on cached base-agent runners (one per app name)
+_RUNNER_CACHE_SIZE = 32
+
+# Upper bound on idle event translators kept for reuse
+_TRANSLATOR_POOL_SIZE = 32
+
+# Tool result payloads common enough to skip the JSON parser; containers are
+# built fresh per result since ADK may hold on to them
+_TRIVIAL_JSON_RESULTS: Dict[str, Callable[[], Any]] = {
+    "null": lambda: None,
+    "true": lambda: True,
+    "false": lambda: False,
+    "{}": dict,
+    "[]": list,
+}
+
+
+class ToolResult(NamedTuple):
+    """A tool message submitted by the client, paired with the called tool's name."""
+    tool_name: str
+    message: Any
+
+
+class _InstructionAppender:
+    """Instruction provider that appends a SystemMessage to a sync provider's output."""
+
+    __slots__ = ('_provider', '_system_content')
+
+    def __init__(self, provider: Callable[..., Any], system_content: str):
+        self._provider = provider
+        self._system_content = system_content
+
+    def _append(self, original_instructions: Optional[str]) -> str:
+        if original_instructions:
+            return f"{original_instructions}\n\n{self._system_content}"
+        return self._system_content
+
+    def __call__(self, *args, **kwargs) -> str:
+        return self._append(self._provider(*args, **kwargs))
+
+
+class _AsyncInstructionAppender(_InstructionAppender):
+    """Instruction provider that appends a SystemMessage to an async provider's output."""
+
+    __slots__ = ()
+
+    async def __call__(self, *args, **kwargs) -> str:
+        return self._append(await self._provider(*args, **kwargs))
+
 
 class ADKAgent:
     """Middleware to bridge AG-UI Protocol with Google ADK agents.
@@ -101,6 +167,7 @@ class ADKAgent:
             raise ValueError("Cannot specify both 'user_id' and 'user_id_extractor'")
         
         self._adk_agent = adk_agent
+        self._agent_name = self._resolve_agent_name(adk_agent)
         self._static_app_name = app_name
         self._app_name_extractor = app_name_extractor
         self._static_user_id = user_id
@@ -138,45 +205,85 @@ class ADKAgent:
         self._execution_timeout = execution_timeout_seconds
         self._tool_timeout = tool_timeout_seconds
         self._max_concurrent = max_concurrent_executions
-        self._execution_lock = asyncio.Lock()
+        # Runners for the unmodified base agent, keyed by app_name, least recently used first
+        self._runner_cache: "OrderedDict[str, Runner]" = OrderedDict()
+        # Runs currently using each runner, so eviction never closes one mid-run
+        self._runner_leases: Dict[Runner, int] = {}
+        # Evicted runners with no run in flight, closed by the next run
+        self._evicted_runners: List[Runner] = []
+        # Finished execution states (and their queues) kept for reuse
+        self._execution_pool: List[ExecutionState] = []
+        self._execution_pool_size = max_concurrent_executions * 2
+        # Periodic stale execution sweep, started with the first execution
+        self._sweep_task: Optional[asyncio.Task] = None
+        # Agent copies with a SystemMessage appended, keyed by (base instruction, system content)
+        self._agent_copy_cache: "OrderedDict[Tuple[Any, str], BaseAgent]" = OrderedDict()
 
         # Session lookup cache for efficient session ID to metadata mapping
-        # Maps session_id -> {"app_name": str, "user_id": str}
-        self._session_lookup_cache: Dict[str, Dict[str, str]] = {}
+        # Maps session_id -> {"app_name": str, "user_id": str}, least recently used first
+        self._session_lookup_cache: "OrderedDict[str, Mapping[str, str]]" = OrderedDict()
+        # Shared read-only metadata per (app_name, user_id) pair
+        self._metadata_flyweights: Dict[Tuple[str, str], Mapping[str, str]] = {}
+        self._session_lookup_cache_size = _SESSION_LOOKUP_CACHE_SIZE
+        self._session_manager.on_session_expire(self._on_session_expire)
         
-        # Event translator will be created per-session for thread safety
+        # Idle event translators, reset after each run and reused by the next
+        self._translator_pool: "deque[EventTranslator]" = deque(maxlen=_TRANSLATOR_POOL_SIZE)
         
         # Cleanup is managed by the session manager
         # Will start when first async operation runs
 
-    def _get_session_metadata(self, session_id: str) -> Optional[Dict[str, str]]:
+    def _get_session_metadata(self, session_id: str) -> Optional[Mapping[str, str]]:
         """Get session metadata (app_name, user_id) for a session ID efficiently.
 
         Args:
             session_id: The session ID to lookup
 
         Returns:
-            Dictionary with app_name and user_id, or None if not found
+            Read-only mapping with app_name and user_id, or None if not found
         """
         # Try cache first for O(1) lookup
-        if session_id in self._session_lookup_cache:
-            return self._session_lookup_cache[session_id]
+        metadata = self._session_lookup_cache.get(session_id)
+        if metadata is not None:
+            self._session_lookup_cache.move_to_end(session_id)
+            return metadata
+
+        # Fall back to the session manager's reverse index for sessions
+        # created outside this agent (e.g. by another agent sharing the manager)
+        owner = self._session_manager.get_session_owner(session_id)
+        if owner is None:
+            return None
 
-        # Fallback to linear search if not in cache (for existing sessions)
-        # This maintains backward compatibility
-        try:
-            for uid, keys in self._session_manager._user_sessions.items():
-                for key in keys:
-                    if key.endswith(f":{session_id}"):
-                        app_name = key.split(':', 1)[0]
-                        metadata = {"app_name": app_name, "user_id": uid}
-                        # Cache for future lookups
-                        self._session_lookup_cache[session_id] = metadata
-                        return metadata
-        except Exception as e:
-            logger.error(f"Error during session metadata lookup for {session_id}: {e}")
+        return self._cache_session_metadata(session_id, *owner)
 
-        return None
+    def _cache_session_metadata(self, session_id: str, app_name: str, user_id: str) -> Mapping[str, str]:
+        """Store session metadata, evicting the least recently used entry when full.
+
+        Sessions owned by the same (app_name, user_id) pair share one read-only
+        metadata mapping. The shared mappings are bounded like the cache itself:
+        once there are more owners than cache slots they are dropped and rebuilt
+        on demand.
+        """
+        key = (app_name, user_id)
+        flyweights = self._metadata_flyweights
+        metadata = flyweights.get(key)
+        if metadata is None:
+            if len(flyweights) >= self._session_lookup_cache_size:
+                flyweights.clear()
+            metadata = MappingProxyType({"app_name": app_name, "user_id": user_id})
+            flyweights[key] = metadata
+        cache = self._session_lookup_cache
+        cache[session_id] = metadata
+        cache.move_to_end(session_id)
+        if len(cache) > self._session_lookup_cache_size:
+            cache.popitem(last=False)
+        return metadata
+
+    def _on_session_expire(self, session_id: str, app_name: str, user_id: str) -> None:
+        """Drop cached metadata for a session the session manager no longer tracks."""
+        metadata = self._session_lookup_cache.get(session_id)
+        if metadata is not None and metadata["app_name"] == app_name:
+            del self._session_lookup_cache[session_id]
     
     def _get_app_name(self, input: RunAgentInput) -> str:
         """Resolve app name with clear precedence."""
@@ -189,9 +296,14 @@ class ADKAgent:
     
     def _default_app_extractor(self, input: RunAgentInput) -> str:
         """Default app extraction logic - use agent name directly."""
-        # Use the ADK agent's name as app name
+        # Use the ADK agent's name as app name (resolved once at construction)
+        return self._agent_name
+
+    @staticmethod
+    def _resolve_agent_name(adk_agent: BaseAgent) -> str:
+        """Resolve the ADK agent's name, falling back to a default."""
         try:
-            return self._adk_agent.name
+            return adk_agent.name
         except Exception as e:
             logger.warning(f"Could not get agent name for app_name, using default: {e}")
             return "AG-UI ADK Agent"
@@ -208,7 +320,7 @@ class ADKAgent:
     def _default_user_extractor(self, input: RunAgentInput) -> str:
         """Default user extraction logic."""
         # Use thread_id as default (assumes thread per user)
-        return f"thread_user_{input.thread_id}"
+        return _format_thread_user(input.thread_id)
     
     async def _add_pending_tool_call_with_context(self, session_id: str, tool_call_id: str, app_name: str, user_id: str):
         """Add a tool call to the session's pending list for HITL tracking.
@@ -219,78 +331,87 @@ class ADKAgent:
             app_name: App name (for session lookup)
             user_id: User ID (for session lookup)
         """
-        logger.debug(f"Adding pending tool call {tool_call_id} for session {session_id}, app_name={app_name}, user_id={user_id}")
+        await self._add_pending_tool_calls_with_context(session_id, [tool_call_id], app_name, user_id)
+
+    async def _add_pending_tool_calls_with_context(
+        self, session_id: str, tool_call_ids: List[str], app_name: str, user_id: str
+    ):
+        """Add a batch of tool calls to the session's pending list in one state update.
+
+        Args:
+            session_id: The session ID (thread_id)
+            tool_call_ids: The tool call IDs to track, in order
+            app_name: App name (for session lookup)
+            user_id: User ID (for session lookup)
+        """
+        logger.debug("Adding pending tool calls %s for session %s, app_name=%s, user_id=%s", tool_call_ids, session_id, app_name, user_id)
         try:
-            # Get current pending calls using SessionManager
-            pending_calls = await self._session_manager.get_state_value(
+            added: List[str] = []
+
+            def add_calls(pending_calls):
+                # Session state stays a JSON-friendly list; membership uses a set
+                pending = set(pending_calls)
+                for tool_call_id in tool_call_ids:
+                    if tool_call_id not in pending:
+                        pending.add(tool_call_id)
+                        added.append(tool_call_id)
+                return [*pending_calls, *added] if added else pending_calls
+
+            await self._session_manager.mutate_state_value(
                 session_id=session_id,
                 app_name=app_name,
                 user_id=user_id,
                 key="pending_tool_calls",
+                mutator=add_calls,
                 default=[]
             )
-            
-            # Add new tool call if not already present
-            if tool_call_id not in pending_calls:
-                pending_calls.append(tool_call_id)
-                
-                # Update the state using SessionManager
-                success = await self._session_manager.set_state_value(
-                    session_id=session_id,
-                    app_name=app_name,
-                    user_id=user_id,
-                    key="pending_tool_calls",
-                    value=pending_calls
-                )
-                
-                if success:
-                    logger.info(f"Added tool call {tool_call_id} to session {session_id} pending list")
+
+            for tool_call_id in added:
+                logger.info(f"Added tool call {tool_call_id} to session {session_id} pending list")
         except Exception as e:
-            logger.error(f"Failed to add pending tool call {tool_call_id} to session {session_id}: {e}")
+            logger.error(f"Failed to add pending tool calls {tool_call_ids} to session {session_id}: {e}")
     
-    async def _remove_pending_tool_call(self, session_id: str, tool_call_id: str):
-        """Remove a tool call from the session's pending list.
+    async def _remove_pending_tool_calls(self, session_id: str, tool_call_ids: Set[str]) -> Set[str]:
+        """Remove a batch of tool calls from the session's pending list.
 
-        Uses efficient session lookup to find the session without needing explicit app_name/user_id.
+        Uses efficient session lookup to find the session without needing explicit app_name/user_id,
+        and a single read-modify-write of the session state for the whole batch.
 
         Args:
             session_id: The session ID (thread_id)
-            tool_call_id: The tool call ID to remove
+            tool_call_ids: The tool call IDs to remove
+
+        Returns:
+            The subset of tool_call_ids that were pending and have been removed
         """
+        removed: Set[str] = set()
         try:
             # Use efficient session metadata lookup
             metadata = self._get_session_metadata(session_id)
 
             if metadata:
-                app_name = metadata["app_name"]
-                user_id = metadata["user_id"]
-
-                # Get current pending calls using SessionManager
-                pending_calls = await self._session_manager.get_state_value(
+                def remove_resolved(pending_calls):
+                    pending = set(pending_calls)
+                    removed.update(pending & tool_call_ids)
+                    if not removed:
+                        return pending_calls
+                    return [call_id for call_id in pending_calls if call_id not in removed]
+
+                await self._session_manager.mutate_state_value(
                     session_id=session_id,
-                    app_name=app_name,
-                    user_id=user_id,
+                    app_name=metadata["app_name"],
+                    user_id=metadata["user_id"],
                     key="pending_tool_calls",
+                    mutator=remove_resolved,
                     default=[]
                 )
 
-                # Remove tool call if present
-                if tool_call_id in pending_calls:
-                    pending_calls.remove(tool_call_id)
-
-                    # Update the state using SessionManager
-                    success = await self._session_manager.set_state_value(
-                        session_id=session_id,
-                        app_name=app_name,
-                        user_id=user_id,
-                        key="pending_tool_calls",
-                        value=pending_calls
-                    )
-                    
-                    if success:
-                        logger.info(f"Removed tool call {tool_call_id} from session {session_id} pending list")
+                if removed:
+                    logger.info(f"Removed tool calls {sorted(removed)} from session {session_id} pending list")
         except Exception as e:
-            logger.error(f"Failed to remove pending tool call {tool_call_id} from session {session_id}: {e}")
+            logger.error(f"Failed to remove pending tool calls {sorted(tool_call_ids)} from session {session_id}: {e}")
+
+        return removed
     
     async def _has_pending_tool_calls(self, session_id: str) -> bool:
         """Check if session has pending tool calls (HITL scenario).
@@ -333,6 +454,52 @@ class ADKAgent:
     
     
     def _create_runner(self, adk_agent: BaseAgent, user_id: str, app_name: str) -> Runner:
+        """Get a runner for the agent.
+
+        Runners for the unmodified base agent are cached per app (bounded,
+        least recently used evicted) and reused across runs. Agent copies
+        carrying per-request tools or instructions get a fresh runner that is
+        closed when the run ends.
+        """
+        if adk_agent is not self._adk_agent:
+            return self._build_runner(adk_agent, app_name)
+
+        cache = self._runner_cache
+        runner = cache.get(app_name)
+        if runner is not None:
+            cache.move_to_end(app_name)
+        else:
+            runner = self._build_runner(adk_agent, app_name)
+            cache[app_name] = runner
+            if len(cache) > _RUNNER_CACHE_SIZE:
+                _, evicted = cache.popitem(last=False)
+                # A runner still in use is closed by its run's _release_runner
+                if not self._runner_leases.get(evicted):
+                    self._evicted_runners.append(evicted)
+        self._runner_leases[runner] = self._runner_leases.get(runner, 0) + 1
+        return runner
+
+    async def _release_runner(self, runner: Runner, app_name: str, thread_id: Optional[str] = None):
+        """Finish a run's use of a runner, closing it unless it is still cached.
+
+        Per-run runners and cached runners evicted while in use are closed
+        once their last run releases them.
+        """
+        leases = self._runner_leases.get(runner, 0) - 1
+        if leases > 0:
+            self._runner_leases[runner] = leases
+            return
+        self._runner_leases.pop(runner, None)
+        if self._runner_cache.get(app_name) is not runner:
+            await self._close_runner(runner, thread_id)
+
+    async def _close_evicted_runners(self):
+        """Close cached runners evicted while no run was using them."""
+        evicted, self._evicted_runners = self._evicted_runners, []
+        for runner in evicted:
+            await self._close_runner(runner)
+
+    def _build_runner(self, adk_agent: BaseAgent, app_name: str) -> Runner:
         """Create a new runner instance."""
         return Runner(
             app_name=app_name,
@@ -356,55 +523,66 @@ class ADKAgent:
         Yields:
             AG-UI protocol events
         """
-        unseen_messages = await self._get_unseen_messages(input)
+        # Resolve app/user once per request and thread them through the helpers
+        app_name = self._get_app_name(input)
+        user_id = self._get_user_id(input)
+
+        unseen_messages = await self._get_unseen_messages(input, app_name=app_name)
 
         if not unseen_messages:
             # No unseen messages – fall through to normal execution handling
-            async for event in self._start_new_execution(input):
+            async for event in self._start_new_execution(
+                input, app_name=app_name, user_id=user_id
+            ):
                 yield event
             return
 
-        index = 0
-        total_unseen = len(unseen_messages)
-        app_name = self._get_app_name(input)
+        pending = deque(unseen_messages)
+        popleft = pending.popleft
+        mark_messages_processed = self._session_manager.mark_messages_processed
         skip_tool_message_batch = False
+        # Built lazily on the first tool batch and shared by all batches
+        tool_call_map: Optional[Dict[str, str]] = None
 
-        while index < total_unseen:
-            current = unseen_messages[index]
-            role = getattr(current, "role", None)
-
-            if role == "tool":
+        while pending:
+            if pending[0].role == "tool":
                 tool_batch: List[Any] = []
-                while index < total_unseen and getattr(unseen_messages[index], "role", None) == "tool":
-                    tool_batch.append(unseen_messages[index])
-                    index += 1
+                while pending and pending[0].role == "tool":
+                    tool_batch.append(popleft())
+
+                if tool_call_map is None:
+                    tool_call_map = self._build_tool_call_map(input)
 
                 async for event in self._handle_tool_result_submission(
                     input,
                     tool_messages=tool_batch,
                     include_message_batch=not skip_tool_message_batch,
+                    app_name=app_name,
+                    user_id=user_id,
+                    tool_call_map=tool_call_map,
                 ):
                     yield event
                 skip_tool_message_batch = False
             else:
                 message_batch: List[Any] = []
                 assistant_message_ids: List[str] = []
+                latest_user_message: Optional[Any] = None
 
-                while index < total_unseen and getattr(unseen_messages[index], "role", None) != "tool":
-                    candidate = unseen_messages[index]
-                    candidate_role = getattr(candidate, "role", None)
+                while pending and pending[0].role != "tool":
+                    candidate = popleft()
+                    role = candidate.role
 
-                    if candidate_role == "assistant":
+                    if role == "assistant":
                         message_id = getattr(candidate, "id", None)
                         if message_id:
                             assistant_message_ids.append(message_id)
                     else:
                         message_batch.append(candidate)
-
-                    index += 1
+                        if role == "user" and getattr(candidate, "content", None):
+                            latest_user_message = candidate
 
                 if assistant_message_ids:
-                    self._session_manager.mark_messages_processed(
+                    mark_messages_processed(
                         app_name,
                         input.thread_id,
                         assistant_message_ids,
@@ -417,7 +595,13 @@ class ADKAgent:
                 else:
                     skip_tool_message_batch = False
 
-                async for event in self._start_new_execution(input, message_batch=message_batch):
+                async for event in self._start_new_execution(
+                    input,
+                    message_batch=message_batch,
+                    latest_user_message=latest_user_message,
+                    app_name=app_name,
+                    user_id=user_id,
+                ):
                     yield event
     
     async def _ensure_session_exists(self, app_name: str, user_id: str, session_id: str, initial_state: dict):
@@ -432,12 +616,9 @@ class ADKAgent:
             )
 
             # Update session lookup cache for efficient session ID to metadata mapping
-            self._session_lookup_cache[session_id] = {
-                "app_name": app_name,
-                "user_id": user_id
-            }
+            self._cache_session_metadata(session_id, app_name, user_id)
 
-            logger.debug(f"Session ready: {session_id} for user: {user_id}")
+            logger.debug("Session ready: %s for user: %s", session_id, user_id)
             return adk_session
         except Exception as e:
             logger.error(f"Failed to ensure session {session_id}: {e}")
@@ -447,8 +628,20 @@ class ADKAgent:
         self,
         input: RunAgentInput,
         messages: Optional[List[Any]] = None,
+        *,
+        latest_user_message: Optional[Any] = None,
     ) -> Optional[types.Content]:
-        """Convert the latest user message to ADK Content format."""
+        """Convert the latest user message to ADK Content format.
+
+        When the caller already knows the latest user message it is passed as
+        latest_user_message and the reverse scan is skipped.
+        """
+        if latest_user_message is not None:
+            return types.Content(
+                role="user",
+                parts=[types.Part(text=latest_user_message.content)]
+            )
+
         target_messages = messages if messages is not None else input.messages
 
         if not target_messages:
@@ -465,23 +658,58 @@ class ADKAgent:
         return None
     
     
-    async def _get_unseen_messages(self, input: RunAgentInput) -> List[Any]:
+    async def _get_unseen_messages(
+        self,
+        input: RunAgentInput,
+        *,
+        app_name: Optional[str] = None,
+    ) -> List[Any]:
         """Return messages that have not yet been processed for this session."""
         if not input.messages:
             return []
 
-        app_name = self._get_app_name(input)
+        if app_name is None:
+            app_name = self._get_app_name(input)
         session_id = input.thread_id
-        processed_ids = self._session_manager.get_processed_message_ids(app_name, session_id)
+        session_manager = self._session_manager
+        messages = input.messages
+
+        # Fast path: nothing new if the latest message is the last one we processed
+        last_message_id = getattr(messages[-1], "id", None)
+        if last_message_id and last_message_id == session_manager.get_last_processed_message_id(
+            app_name, session_id
+        ):
+            return []
+
+        # Append-only path: if the message that ended the previous request is
+        # still at the same index and was processed, only the tail after it
+        # needs checking. Everything at or before it is already seen.
+        bound = -1
+        hint = session_manager.get_message_tail_hint(app_name, session_id)
+        if hint is not None:
+            hint_index, hint_id = hint
+            if (
+                hint_index < len(messages)
+                and getattr(messages[hint_index], "id", None) == hint_id
+                and session_manager.is_message_processed(app_name, session_id, hint_id)
+            ):
+                bound = hint_index
+
+        def is_processed(message_id: str) -> bool:
+            return session_manager.is_message_processed(app_name, session_id, message_id)
 
         unseen_reversed: List[Any] = []
 
-        for message in reversed(input.messages):
+        for index in range(len(messages) - 1, bound, -1):
+            message = messages[index]
             message_id = getattr(message, "id", None)
-            if message_id and message_id in processed_ids:
+            if message_id and is_processed(message_id):
                 break
             unseen_reversed.append(message)
 
+        if last_message_id:
+            session_manager.set_message_tail_hint(app_name, session_id, len(messages) - 1, last_message_id)
+
         unseen_reversed.reverse()
         return unseen_reversed
 
@@ -492,19 +720,17 @@ class ADKAgent:
     async def _is_tool_result_submission(
         self,
         input: RunAgentInput,
-        unseen_messages: Optional[List[Any]] = None,
+        unseen_messages: List[Any],
     ) -> bool:
         """Check if this request contains tool results.
 
         Args:
             input: The run input
-            unseen_messages: Optional list of unseen messages to inspect
+            unseen_messages: Unseen messages already computed by the caller
 
         Returns:
             True if all unseen messages are tool results
         """
-        unseen_messages = unseen_messages if unseen_messages is not None else await self._get_unseen_messages(input)
-
         if not unseen_messages:
             return False
 
@@ -515,24 +741,35 @@ class ADKAgent:
         self,
         input: RunAgentInput,
         *,
-        tool_messages: Optional[List[Any]] = None,
+        tool_messages: List[Any],
         include_message_batch: bool = True,
+        app_name: Optional[str] = None,
+        user_id: Optional[str] = None,
+        tool_call_map: Optional[Dict[str, str]] = None,
     ) -> AsyncGenerator[BaseEvent, None]:
         """Handle tool result submission for existing execution.
         
         Args:
             input: The run input containing tool results
-            tool_messages: Optional pre-filtered tool messages to consider
+            tool_messages: Unseen tool messages to submit
             include_message_batch: Whether to forward the candidate messages to the execution
+            app_name: Pre-resolved app name (resolved from input if omitted)
+            user_id: Pre-resolved user ID (resolved from input if omitted)
+            tool_call_map: Pre-built tool_call_id -> tool name map (built from input if omitted)
             
         Yields:
             AG-UI events from continued execution
         """
         thread_id = input.thread_id
+        if app_name is None:
+            app_name = self._get_app_name(input)
+        if user_id is None:
+            user_id = self._get_user_id(input)
         
         # Extract tool results that are sent by the frontend
-        candidate_messages = tool_messages if tool_messages is not None else await self._get_unseen_messages(input)
-        tool_results = await self._extract_tool_results(input, candidate_messages)
+        tool_results = await self._extract_tool_results(
+            input, tool_messages, tool_call_map=tool_call_map
+        )
         
         # if the tool results are not sent by the fronted then call the tool function
         if not tool_results:
@@ -545,29 +782,24 @@ class ADKAgent:
             return
         
         try:
-            # Check if tool result matches any pending tool calls for better debugging
-            for tool_result in tool_results:
-                tool_call_id = tool_result['message'].tool_call_id
-                has_pending = await self._has_pending_tool_calls(thread_id)
-                
-                if has_pending:
-                    # Could add more specific check here for the exact tool_call_id
-                    # but for now just log that we're processing a tool result while tools are pending
-                    logger.debug(f"Processing tool result {tool_call_id} for thread {thread_id} with pending tools")
-                    # Remove from pending tool calls now that we're processing it
-                    await self._remove_pending_tool_call(thread_id, tool_call_id)
-                else:
-                    # No pending tools - this could be a stale result or from a different session
-                    logger.warning(f"No pending tool calls found for tool result {tool_call_id} in thread {thread_id}")
+            # Remove all submitted results from the pending tool calls in one batch
+            tool_call_ids = {tool_result.message.tool_call_id for tool_result in tool_results}
+            removed_ids = await self._remove_pending_tool_calls(thread_id, tool_call_ids)
+
+            for tool_call_id in tool_call_ids - removed_ids:
+                # Not pending - this could be a stale result or from a different session
+                logger.warning(f"No pending tool call found for tool result {tool_call_id} in thread {thread_id}")
             
             # Since all tools are long-running, all tool results are standalone
             # and should start new executions with the tool results
             logger.info(f"Starting new execution for tool result in thread {thread_id}")
-            message_batch = candidate_messages if include_message_batch else None
+            message_batch = tool_messages if include_message_batch else None
             async for event in self._start_new_execution(
                 input,
                 tool_results=tool_results,
                 message_batch=message_batch,
+                app_name=app_name,
+                user_id=user_id,
             ):
                 yield event
                 
@@ -579,46 +811,52 @@ class ADKAgent:
                 code="TOOL_RESULT_PROCESSING_ERROR"
             )
     
+    def _build_tool_call_map(self, input: RunAgentInput) -> Dict[str, str]:
+        """Map every tool_call_id in the input messages to its tool name."""
+        tool_call_map = {}
+        for message in input.messages:
+            tool_calls = getattr(message, 'tool_calls', None)
+            if tool_calls:
+                for tool_call in tool_calls:
+                    tool_call_map[tool_call.id] = tool_call.function.name
+        return tool_call_map
+
     async def _extract_tool_results(
         self,
         input: RunAgentInput,
-        candidate_messages: Optional[List[Any]] = None,
-    ) -> List[Dict]:
+        candidate_messages: List[Any],
+        *,
+        tool_call_map: Optional[Dict[str, str]] = None,
+    ) -> List[ToolResult]:
         """Extract tool messages with their names from input.
 
-        Only extracts tool messages provided in candidate_messages. When no
-        candidates are supplied, all messages are considered.
+        Only extracts tool messages provided in candidate_messages.
 
         Args:
             input: The run input
-            candidate_messages: Optional subset of messages to inspect
+            candidate_messages: Messages to inspect, typically the unseen messages
+            tool_call_map: Pre-built tool_call_id -> tool name map (built from input if omitted)
 
         Returns:
-            List of dicts containing tool name and message ordered chronologically
+            List of ToolResult (tool name and message) ordered chronologically
         """
-        # Create a mapping of tool_call_id to tool name
-        tool_call_map = {}
-        for message in input.messages:
-            if hasattr(message, 'tool_calls') and message.tool_calls:
-                for tool_call in message.tool_calls:
-                    tool_call_map[tool_call.id] = tool_call.function.name
+        if tool_call_map is None:
+            tool_call_map = self._build_tool_call_map(input)
 
-        messages_to_check = candidate_messages or input.messages
-        extracted_results: List[Dict] = []
+        extracted_results: List[ToolResult] = []
 
-        for message in messages_to_check:
-            if hasattr(message, 'role') and message.role == "tool":
-                tool_name = tool_call_map.get(getattr(message, 'tool_call_id', None), "unknown")
+        for message in candidate_messages:
+            role = getattr(message, 'role', None)
+            if role == "tool":
+                tool_call_id = getattr(message, 'tool_call_id', None)
+                tool_name = tool_call_map.get(tool_call_id, "unknown")
                 logger.debug(
                     "Extracted ToolMessage: role=%s, tool_call_id=%s, content='%s'",
-                    getattr(message, 'role', None),
-                    getattr(message, 'tool_call_id', None),
+                    role,
+                    tool_call_id,
                     getattr(message, 'content', None),
                 )
-                extracted_results.append({
-                    'tool_name': tool_name,
-                    'message': message
-                })
+                extracted_results.append(ToolResult(tool_name, message))
 
         return extracted_results
 
@@ -628,165 +866,187 @@ class ADKAgent:
     ) -> AsyncGenerator[BaseEvent, None]:
         """Stream events from execution queue.
         
+        Completion is signalled by a None sentinel, which the background task
+        enqueues itself and which is also enqueued when the task finishes, so
+        the consumer never needs to poll. An execution timeout is scheduled
+        once and surfaces through the queue as a timeout marker. Events that
+        are already queued are drained without awaiting.
+        
         Args:
             execution: The execution state
             
         Yields:
             AG-UI events from the queue
         """
-        logger.debug(f"Starting _stream_events for thread {execution.thread_id}, queue ID: {id(execution.event_queue)}")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("Starting _stream_events for thread %s, queue ID: %s", execution.thread_id, id(execution.event_queue))
+        event_queue = execution.event_queue
+        queue_get = event_queue.get
+        queue_get_nowait = event_queue.get_nowait
         event_count = 0
-        timeout_count = 0
-        
-        while True:
-            try:
-                logger.debug(f"Waiting for event from queue (thread {execution.thread_id}, queue size: {execution.event_queue.qsize()})")
-                
-                # Wait for event with timeout
-                event = await asyncio.wait_for(
-                    execution.event_queue.get(),
-                    timeout=1.0  # Check every second
-                )
-                
-                event_count += 1
-                logger.debug(f"Got event #{event_count} from queue: {type(event).__name__ if event else 'None'} (thread {execution.thread_id})")
-                
-                if event is None:
-                    # Execution complete
-                    execution.is_complete = True
-                    logger.debug(f"Execution complete for thread {execution.thread_id} after {event_count} events")
-                    break
-                
-                logger.debug(f"Streaming event #{event_count}: {type(event).__name__} (thread {execution.thread_id})")
-                yield event
-                
-            except asyncio.TimeoutError:
-                timeout_count += 1
-                logger.debug(f"Timeout #{timeout_count} waiting for events (thread {execution.thread_id}, task done: {execution.task.done()}, queue size: {execution.event_queue.qsize()})")
-                
-                # Check if execution is stale
-                if execution.is_stale(self._execution_timeout):
-                    logger.error(f"Execution timed out for thread {execution.thread_id}")
-                    yield RunErrorEvent(
-                        type=EventType.RUN_ERROR,
-                        message="Execution timed out",
-                        code="EXECUTION_TIMEOUT"
-                    )
-                    break
-                
-                # Check if task is done
-                if execution.task.done():
-                    # Task completed but didn't send None
-                    execution.is_complete = True
+
+        # Guarantee a completion sentinel even if the task exits without sending one.
+        # Skip it once the state has been recycled so a pooled queue stays clean.
+        def _signal_task_done(task: asyncio.Task) -> None:
+            if execution.task is task:
+                event_queue.put_nowait(None)
+
+        execution.task.add_done_callback(_signal_task_done)
+
+        remaining = max(self._execution_timeout - execution.get_execution_time(), 0)
+        timeout_handle = asyncio.get_running_loop().call_later(
+            remaining, event_queue.put_nowait, _EXECUTION_TIMEOUT
+        )
+
+        try:
+            while True:
+                # Wait for one event, then drain whatever else is already queued
+                # without going back through the scheduler
+                event = await queue_get()
+                while True:
+                    if event is _EXECUTION_TIMEOUT:
+                        logger.error(f"Execution timed out for thread {execution.thread_id}")
+                        yield RunErrorEvent(
+                            type=EventType.RUN_ERROR,
+                            message="Execution timed out",
+                            code="EXECUTION_TIMEOUT"
+                        )
+                        return
+
+                    event_count += 1
+                    if debug_enabled:
+                        logger.debug("Got event #%d from queue: %s (thread %s)", event_count, type(event).__name__ if event else 'None', execution.thread_id)
+
+                    if event is None:
+                        # Execution complete
+                        execution.is_complete = True
+                        if debug_enabled:
+                            logger.debug("Execution complete for thread %s after %d events", execution.thread_id, event_count)
+                        return
+
+                    if debug_enabled:
+                        logger.debug("Streaming event #%d: %s (thread %s)", event_count, type(event).__name__, execution.thread_id)
+                    yield event
+
                     try:
-                        task_result = execution.task.result()
-                        logger.debug(f"Task completed with result: {task_result} (thread {execution.thread_id})")
-                    except Exception as e:
-                        logger.debug(f"Task completed with exception: {e} (thread {execution.thread_id})")
-                    
-                    # Wait a bit more in case there are events still coming
-                    logger.debug(f"Task done but no None signal - checking queue one more time (thread {execution.thread_id}, queue size: {execution.event_queue.qsize()})")
-                    if execution.event_queue.qsize() > 0:
-                        logger.debug(f"Found {execution.event_queue.qsize()} events in queue after task completion, continuing...")
-                        continue
-                    
-                    logger.debug(f"Task completed without sending None signal (thread {execution.thread_id})")
-                    break
+                        event = queue_get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+        finally:
+            timeout_handle.cancel()
     
     async def _start_new_execution(
         self,
         input: RunAgentInput,
         *,
-        tool_results: Optional[List[Dict]] = None,
+        tool_results: Optional[List[ToolResult]] = None,
         message_batch: Optional[List[Any]] = None,
+        latest_user_message: Optional[Any] = None,
+        app_name: Optional[str] = None,
+        user_id: Optional[str] = None,
     ) -> AsyncGenerator[BaseEvent, None]:
         """Start a new ADK execution with tool support.
         
         Args:
             input: The run input
+            latest_user_message: Latest user message in message_batch, if already known
+            app_name: Pre-resolved app name (resolved from input if omitted)
+            user_id: Pre-resolved user ID (resolved from input if omitted)
             
         Yields:
             AG-UI events from the execution
         """
+        if app_name is None:
+            app_name = self._get_app_name(input)
+        if user_id is None:
+            user_id = self._get_user_id(input)
+
+        started_execution: Optional[ExecutionState] = None
         try:
             # Emit RUN_STARTED
-            logger.debug(f"Emitting RUN_STARTED for thread {input.thread_id}, run {input.run_id}")
+            logger.debug("Emitting RUN_STARTED for thread %s, run %s", input.thread_id, input.run_id)
             yield RunStartedEvent(
                 type=EventType.RUN_STARTED,
                 thread_id=input.thread_id,
                 run_id=input.run_id
             )
             
-            # Check concurrent execution limit
-            async with self._execution_lock:
-                if len(self._active_executions) >= self._max_concurrent:
-                    # Clean up stale executions
-                    await self._cleanup_stale_executions()
-                    
-                    if len(self._active_executions) >= self._max_concurrent:
-                        raise RuntimeError(
-                            f"Maximum concurrent executions ({self._max_concurrent}) reached"
-                        )
+            if self._sweep_task is None:
+                self._start_sweep_task()
+
+            # Check concurrent execution limit; the background sweep normally frees
+            # stale slots, so this scan only runs when the limit is actually hit
+            if len(self._active_executions) >= self._max_concurrent:
+                # Clean up stale executions
+                await self._cleanup_stale_executions()
                 
-                # Check if there's an existing execution for this thread and wait for it
-                existing_execution = self._active_executions.get(input.thread_id)
+                if len(self._active_executions) >= self._max_concurrent:
+                    raise RuntimeError(
+                        f"Maximum concurrent executions ({self._max_concurrent}) reached"
+                    )
+            
+            # Check if there's an existing execution for this thread and wait for it
+            existing_execution = self._active_executions.get(input.thread_id)
 
             # If there was an existing execution, wait for it to complete
             if existing_execution and not existing_execution.is_complete:
-                logger.debug(f"Waiting for existing execution to complete for thread {input.thread_id}")
+                logger.debug("Waiting for existing execution to complete for thread %s", input.thread_id)
                 try:
                     await existing_execution.task
                 except Exception as e:
-                    logger.debug(f"Previous execution completed with error: {e}")
+                    logger.debug("Previous execution completed with error: %s", e)
             
             # Start background execution
             execution = await self._start_background_execution(
                 input,
                 tool_results=tool_results,
                 message_batch=message_batch,
+                latest_user_message=latest_user_message,
+                app_name=app_name,
+                user_id=user_id,
             )
+            started_execution = execution
             
-            # Store execution (replacing any previous one)
-            async with self._execution_lock:
-                self._active_executions[input.thread_id] = execution
+            # Store execution (replacing any previous one); a single dict
+            # assignment cannot interleave with other coroutines
+            self._active_executions[input.thread_id] = execution
             
             # Stream events and track tool calls
-            logger.debug(f"Starting to stream events for execution {execution.thread_id}")
-            has_tool_calls = False
-            tool_call_ids = []
+            logger.debug("Starting to stream events for execution %s", execution.thread_id)
+            # Insertion-ordered set of client tool calls still awaiting results
+            tool_call_ids: Dict[str, None] = {}
             
-            logger.debug(f"About to iterate over _stream_events for execution {execution.thread_id}")
+            logger.debug("About to iterate over _stream_events for execution %s", execution.thread_id)
             async for event in self._stream_events(execution):
-                # Track tool calls for HITL scenarios
-                if isinstance(event, ToolCallEndEvent):
-                    logger.info(f"Detected ToolCallEndEvent with id: {event.tool_call_id}")
-                    has_tool_calls = True
-                    tool_call_ids.append(event.tool_call_id)
+                # Track tool calls for HITL scenarios; dispatch on the event type
+                # enum, a single comparison instead of an isinstance MRO walk
+                event_type = event.type
+                if event_type == EventType.TOOL_CALL_END:
+                    logger.info("Detected ToolCallEndEvent with id: %s", event.tool_call_id)
+                    tool_call_ids[event.tool_call_id] = None
 
                 # backend tools will always emit ToolCallResultEvent
                 # If it is a backend tool then we don't need to add the tool_id in pending_tools
-                if isinstance(event, ToolCallResultEvent) and event.tool_call_id in tool_call_ids:
-                    logger.info(f"Detected ToolCallResultEvent with id: {event.tool_call_id}")
-                    tool_call_ids.remove(event.tool_call_id)
+                elif event_type == EventType.TOOL_CALL_RESULT and event.tool_call_id in tool_call_ids:
+                    logger.info("Detected ToolCallResultEvent with id: %s", event.tool_call_id)
+                    del tool_call_ids[event.tool_call_id]
                 
                 
-                logger.debug(f"Yielding event: {type(event).__name__}")
+                logger.debug("Yielding event: %s", type(event).__name__)
                 yield event
                 
-            logger.debug(f"Finished iterating over _stream_events for execution {execution.thread_id}")
+            logger.debug("Finished iterating over _stream_events for execution %s", execution.thread_id)
             
-            # If we found tool calls, add them to session state BEFORE cleanup
-            if has_tool_calls:
-                app_name = self._get_app_name(input)
-                user_id = self._get_user_id(input)
-                for tool_call_id in tool_call_ids:
-                    await self._add_pending_tool_call_with_context(
-                        execution.thread_id, tool_call_id, app_name, user_id
-                    )
-            logger.debug(f"Finished streaming events for execution {execution.thread_id}")
+            # If we found client tool calls, add them to session state BEFORE cleanup
+            if tool_call_ids:
+                await self._add_pending_tool_calls_with_context(
+                    execution.thread_id, list(tool_call_ids), app_name, user_id
+                )
+            logger.debug("Finished streaming events for execution %s", execution.thread_id)
             
             # Emit RUN_FINISHED
-            logger.debug(f"Emitting RUN_FINISHED for thread {input.thread_id}, run {input.run_id}")
+            logger.debug("Emitting RUN_FINISHED for thread %s, run %s", input.thread_id, input.run_id)
             yield RunFinishedEvent(
                 type=EventType.RUN_FINISHED,
                 thread_id=input.thread_id,
@@ -802,84 +1062,104 @@ class ADKAgent:
             )
         finally:
             # Clean up execution if complete and no pending tool calls (HITL scenarios)
-            async with self._execution_lock:
-                if input.thread_id in self._active_executions:
-                    execution = self._active_executions[input.thread_id]
-                    execution.is_complete = True
-                    
-                    # Check if session has pending tool calls before cleanup
-                    has_pending = await self._has_pending_tool_calls(input.thread_id)
-                    if not has_pending:
+            execution = self._active_executions.get(input.thread_id)
+            if execution is not None:
+                execution.is_complete = True
+                
+                # Check if session has pending tool calls before cleanup
+                has_pending = await self._has_pending_tool_calls(input.thread_id)
+                if not has_pending:
+                    # A newer execution may have replaced this one while we awaited
+                    if self._active_executions.get(input.thread_id) is execution:
                         del self._active_executions[input.thread_id]
-                        logger.debug(f"Cleaned up execution for thread {input.thread_id}")
-                    else:
-                        logger.info(f"Preserving execution for thread {input.thread_id} - has pending tool calls (HITL scenario)")
+                        logger.debug("Cleaned up execution for thread %s", input.thread_id)
+                        # Only recycle the state this run owns
+                        if execution is started_execution:
+                            self._release_execution(execution)
+                else:
+                    logger.info(f"Preserving execution for thread {input.thread_id} - has pending tool calls (HITL scenario)")
     
+    def _get_instructed_agent(self, adk_agent: BaseAgent, system_content: str) -> BaseAgent:
+        """Get a copy of the agent with a SystemMessage appended to its instruction.
+
+        Copies are cached per (base instruction, system content), so a client that
+        resends the same system prompt on every turn reuses one copy.
+
+        Args:
+            adk_agent: The agent whose instruction is extended
+            system_content: Content of the leading SystemMessage
+
+        Returns:
+            The cached or newly created agent copy
+        """
+        current_instruction = getattr(adk_agent, 'instruction', '') or ''
+        cache_key = (current_instruction, system_content)
+        cache = self._agent_copy_cache
+        cached_agent = cache.get(cache_key)
+        if cached_agent is not None:
+            cache.move_to_end(cache_key)
+            return cached_agent
+
+        if callable(current_instruction):
+            # Handle instructions provider
+            if inspect.iscoroutinefunction(current_instruction):
+                new_instruction = _AsyncInstructionAppender(current_instruction, system_content)
+            else:
+                new_instruction = _InstructionAppender(current_instruction, system_content)
+
+            logger.debug("Will wrap callable InstructionProvider and append SystemMessage: '%s...'", system_content[:100])
+        else:
+            # Handle string instructions
+            if current_instruction:
+                new_instruction = f"{current_instruction}\n\n{system_content}"
+            else:
+                new_instruction = system_content
+            logger.debug("Will append SystemMessage to string instructions: '%s...'", system_content[:100])
+
+        instructed_agent = adk_agent.model_copy(update={'instruction': new_instruction})
+        cache[cache_key] = instructed_agent
+        if len(cache) > _AGENT_COPY_CACHE_SIZE:
+            cache.popitem(last=False)
+        return instructed_agent
+
     async def _start_background_execution(
         self,
         input: RunAgentInput,
         *,
-        tool_results: Optional[List[Dict]] = None,
+        tool_results: Optional[List[ToolResult]] = None,
         message_batch: Optional[List[Any]] = None,
+        latest_user_message: Optional[Any] = None,
+        app_name: Optional[str] = None,
+        user_id: Optional[str] = None,
     ) -> ExecutionState:
         """Start ADK execution in background with tool support.
         
         Args:
             input: The run input
+            latest_user_message: Latest user message in message_batch, if already known
+            app_name: Pre-resolved app name (resolved from input if omitted)
+            user_id: Pre-resolved user ID (resolved from input if omitted)
             
         Returns:
             ExecutionState tracking the background execution
         """
-        event_queue = asyncio.Queue()
-        logger.debug(f"Created event queue {id(event_queue)} for thread {input.thread_id}")
+        execution = self._execution_pool.pop() if self._execution_pool else None
+        event_queue = execution.event_queue if execution is not None else EventQueue()
+        logger.debug("Using event queue %s for thread %s", id(event_queue), input.thread_id)
         # Extract necessary information
-        user_id = self._get_user_id(input)
-        app_name = self._get_app_name(input)
+        if user_id is None:
+            user_id = self._get_user_id(input)
+        if app_name is None:
+            app_name = self._get_app_name(input)
         
         # Use the ADK agent directly
         adk_agent = self._adk_agent
         
-        # Prepare agent modifications (SystemMessage and tools)
-        agent_updates = {}
-        
         # Handle SystemMessage if it's the first message - append to agent instructions
         if input.messages and isinstance(input.messages[0], SystemMessage):
             system_content = input.messages[0].content
             if system_content:
-                current_instruction = getattr(adk_agent, 'instruction', '') or ''
-
-                if callable(current_instruction):
-                    # Handle instructions provider
-                    if inspect.iscoroutinefunction(current_instruction):
-                        # Async instruction provider
-                        async def instruction_provider_wrapper_async(*args, **kwargs):
-                            instructions = system_content
-                            original_instructions = await current_instruction(*args, **kwargs) or ''
-                            if original_instructions:
-                                instructions = f"{original_instructions}\n\n{instructions}"
-                            return instructions
-                        new_instruction = instruction_provider_wrapper_async
-                    else:
-                        # Sync instruction provider
-                        def instruction_provider_wrapper_sync(*args, **kwargs):
-                            instructions = system_content
-                            original_instructions = current_instruction(*args, **kwargs) or ''
-                            if original_instructions:
-                                instructions = f"{original_instructions}\n\n{instructions}"
-                            return instructions
-                        new_instruction = instruction_provider_wrapper_sync
-
-                    logger.debug(
-                        f"Will wrap callable InstructionProvider and append SystemMessage: '{system_content[:100]}...'")
-                else:
-                    # Handle string instructions
-                    if current_instruction:
-                        new_instruction = f"{current_instruction}\n\n{system_content}"
-                    else:
-                        new_instruction = system_content
-                    logger.debug(f"Will append SystemMessage to string instructions: '{system_content[:100]}...'")
-
-                agent_updates['instruction'] = new_instruction
+                adk_agent = self._get_instructed_agent(adk_agent, system_content)
 
         # Create dynamic toolset if tools provided and prepare tool updates
         toolset = None
@@ -887,35 +1167,29 @@ class ADKAgent:
             
             # Get existing tools from the agent
             existing_tools = []
-            if hasattr(adk_agent, 'tools') and adk_agent.tools:
-                existing_tools = list(adk_agent.tools) if isinstance(adk_agent.tools, (list, tuple)) else [adk_agent.tools]
+            agent_tools = getattr(adk_agent, 'tools', None)
+            if agent_tools:
+                existing_tools = list(agent_tools) if isinstance(agent_tools, (list, tuple)) else [agent_tools]
             
             # if same tool is defined in frontend and backend then agent will only use the backend tool
-            input_tools = []
-            for input_tool in input.tools:
-                # Check if this input tool's name matches any existing tool
-                # Also exclude this specific tool call "transfer_to_agent" which is used internally by the adk to handoff to other agents
-                if (not any(hasattr(existing_tool, '__name__') and input_tool.name == existing_tool.__name__
-                        for existing_tool in existing_tools) and input_tool.name != 'transfer_to_agent'):
-                    input_tools.append(input_tool)
-                        
+            # Also exclude "transfer_to_agent" which is used internally by the adk to handoff to other agents
+            excluded_names = {getattr(existing_tool, '__name__', None) for existing_tool in existing_tools}
+            excluded_names.add('transfer_to_agent')
+            input_tools = [input_tool for input_tool in input.tools if input_tool.name not in excluded_names]
+
             toolset = ClientProxyToolset(
                 ag_ui_tools=input_tools,
                 event_queue=event_queue
             )
 
-            # Combine existing tools with our proxy toolset
+            # Combine existing tools with our proxy toolset. The toolset is bound to
+            # this execution's queue, so this copy is made per run.
             combined_tools = existing_tools + [toolset]
-            agent_updates['tools'] = combined_tools
-            logger.debug(f"Will combine {len(existing_tools)} existing tools with proxy toolset")
-        
-        # Create a single copy of the agent with all updates if any modifications needed
-        if agent_updates:
-            adk_agent = adk_agent.model_copy(update=agent_updates)
-            logger.debug(f"Created modified agent copy with updates: {list(agent_updates.keys())}")
+            adk_agent = adk_agent.model_copy(update={'tools': combined_tools})
+            logger.debug("Combined %d existing tools with proxy toolset", len(existing_tools))
         
         # Create background task
-        logger.debug(f"Creating background task for thread {input.thread_id}")
+        logger.debug("Creating background task for thread %s", input.thread_id)
         run_kwargs = {
             "input": input,
             "adk_agent": adk_agent,
@@ -930,24 +1204,75 @@ class ADKAgent:
         if message_batch is not None:
             run_kwargs["message_batch"] = message_batch
 
+        if latest_user_message is not None:
+            run_kwargs["latest_user_message"] = latest_user_message
+
         task = asyncio.create_task(self._run_adk_in_background(**run_kwargs))
-        logger.debug(f"Background task created for thread {input.thread_id}: {task}")
+        logger.debug("Background task created for thread %s: %s", input.thread_id, task)
         
+        if execution is not None:
+            execution.reuse(task=task, thread_id=input.thread_id)
+            return execution
+
         return ExecutionState(
             task=task,
             thread_id=input.thread_id,
             event_queue=event_queue
         )
+
+    def _release_execution(self, execution: ExecutionState) -> None:
+        """Return a finished execution state to the pool for reuse.
+
+        Only states whose task has finished are pooled; the pool is capped at
+        twice the concurrency limit.
+
+        Args:
+            execution: The finished execution state
+        """
+        if not execution.task.done() or len(self._execution_pool) >= self._execution_pool_size:
+            return
+        execution.reset()
+        self._execution_pool.append(execution)
     
+    @staticmethod
+    def _parse_tool_result_content(tool_call_id: str, content: Optional[str]) -> Any:
+        """Parse a tool message's JSON content into a function response payload.
+
+        Empty content becomes an empty success result and invalid JSON becomes
+        a detailed error result, so a bad tool reply never aborts the run.
+        """
+        # Debug: Log the actual tool message content we received
+        logger.debug("Received tool result for call %s: content='%s', type=%s", tool_call_id, content, type(content))
+
+        try:
+            if content and not content.isspace():
+                trivial_result = _TRIVIAL_JSON_RESULTS.get(content)
+                return trivial_result() if trivial_result is not None else json_loads(content)
+
+            # Handle empty content as a success with empty result
+            logger.warning(f"Empty tool result content for tool call {tool_call_id}, using empty success result")
+            return {"success": True, "result": None}
+        except json.JSONDecodeError as json_error:
+            # Handle invalid JSON by providing detailed error result
+            logger.error(f"Invalid JSON in tool result for call {tool_call_id}: {json_error} at line {getattr(json_error, 'lineno', '?')}, column {getattr(json_error, 'colno', '?')}")
+            return {
+                "error": f"Invalid JSON in tool result: {str(json_error)}",
+                "raw_content": content,
+                "error_type": "JSON_DECODE_ERROR",
+                "line": getattr(json_error, 'lineno', None),
+                "column": getattr(json_error, 'colno', None)
+            }
+
     async def _run_adk_in_background(
         self,
         input: RunAgentInput,
         adk_agent: BaseAgent,
         user_id: str,
         app_name: str,
-        event_queue: asyncio.Queue,
-        tool_results: Optional[List[Dict]] = None,
+        event_queue: EventQueue,
+        tool_results: Optional[List[ToolResult]] = None,
         message_batch: Optional[List[Any]] = None,
+        latest_user_message: Optional[Any] = None,
     ):
         """Run ADK agent in background, emitting events to queue.
         
@@ -957,8 +1282,10 @@ class ADKAgent:
             user_id: User ID
             app_name: App name
             event_queue: Queue for emitting events
+            latest_user_message: Latest user message in message_batch, if already known
         """
         runner: Optional[Runner] = None
+        event_translator: Optional[EventTranslator] = None
         try:
             # Agent is already prepared with tools and SystemMessage instructions (if any)
             # from _start_background_execution, so no additional agent copying needed here
@@ -969,29 +1296,39 @@ class ADKAgent:
                 user_id=user_id,
                 app_name=app_name
             )
+            if self._evicted_runners:
+                await self._close_evicted_runners()
 
             # Create RunConfig
             run_config = self._run_config_factory(input)
 
             # Ensure session exists
-            await self._ensure_session_exists(
+            adk_session = await self._ensure_session_exists(
                 app_name, user_id, input.thread_id, input.state
             )
 
             # this will always update the backend states with the frontend states
             # Recipe Demo Example: if there is a state "salt" in the ingredients state and in frontend user remove this salt state using UI from the ingredients list then our backend should also update these state changes as well to sync both the states
-            await self._session_manager.update_session_state(input.thread_id,app_name,user_id,input.state)
-            
-            
+            # The session was just fetched, so it is passed along instead of being fetched again
+            if input.state:
+                await self._session_manager.update_session_state(
+                    input.thread_id, app_name, user_id, input.state, session=adk_session
+                )
+
             # Convert messages
-            unseen_messages = message_batch if message_batch is not None else await self._get_unseen_messages(input)
+            unseen_messages = (
+                message_batch if message_batch is not None
+                else await self._get_unseen_messages(input, app_name=app_name)
+            )
 
-            active_tool_results: Optional[List[Dict]] = tool_results
-            if active_tool_results is None and await self._is_tool_result_submission(input, unseen_messages):
+            active_tool_results: Optional[List[ToolResult]] = tool_results
+            if active_tool_results is None and await self._is_tool_result_submission(
+                input, unseen_messages
+            ):
                 active_tool_results = await self._extract_tool_results(input, unseen_messages)
 
             if active_tool_results:
-                tool_messages = [result["message"] for result in active_tool_results]
+                tool_messages = [result.message for result in active_tool_results]
                 message_ids = self._collect_message_ids(tool_messages)
                 if message_ids:
                     self._session_manager.mark_messages_processed(app_name, input.thread_id, message_ids)
@@ -1000,53 +1337,35 @@ class ADKAgent:
                 if message_ids:
                     self._session_manager.mark_messages_processed(app_name, input.thread_id, message_ids)
 
-            # only use this new_message if there is no tool response from the user
-            new_message = await self._convert_latest_message(input, unseen_messages if message_batch is not None else None)
-
             # if there is a tool response submission by the user then we need to only pass the tool response to the adk runner
-            if active_tool_results:
-                parts = []
-                for tool_msg in active_tool_results:
-                    tool_call_id = tool_msg['message'].tool_call_id
-                    content = tool_msg['message'].content
-
-                    # Debug: Log the actual tool message content we received
-                    logger.debug(f"Received tool result for call {tool_call_id}: content='{content}', type={type(content)}")
-
-                    # Parse JSON content, handling empty or invalid JSON gracefully
-                    try:
-                        if content and content.strip():
-                            result = json.loads(content)
-                        else:
-                            # Handle empty content as a success with empty result
-                            result = {"success": True, "result": None}
-                            logger.warning(f"Empty tool result content for tool call {tool_call_id}, using empty success result")
-                    except json.JSONDecodeError as json_error:
-                        # Handle invalid JSON by providing detailed error result
-                        result = {
-                            "error": f"Invalid JSON in tool result: {str(json_error)}",
-                            "raw_content": content,
-                            "error_type": "JSON_DECODE_ERROR",
-                            "line": getattr(json_error, 'lineno', None),
-                            "column": getattr(json_error, 'colno', None)
-                        }
-                        logger.error(f"Invalid JSON in tool result for call {tool_call_id}: {json_error} at line {getattr(json_error, 'lineno', '?')}, column {getattr(json_error, 'colno', '?')}")
-
-                    updated_function_response_part = types.Part(
-                        function_response=types.FunctionResponse(
-                            id=tool_call_id,
-                            name=tool_msg["tool_name"],
-                            response=result,
+            if not active_tool_results:
+                new_message = await self._convert_latest_message(
+                    input,
+                    unseen_messages if message_batch is not None else None,
+                    latest_user_message=latest_user_message,
+                )
+            else:
+                new_message = types.Content(
+                    parts=[
+                        types.Part(
+                            function_response=types.FunctionResponse(
+                                id=tool_msg.message.tool_call_id,
+                                name=tool_msg.tool_name,
+                                response=self._parse_tool_result_content(
+                                    tool_msg.message.tool_call_id, tool_msg.message.content
+                                ),
+                            )
                         )
-                    )
-                    parts.append(updated_function_response_part)
-                new_message = types.Content(parts=parts, role='function')
+                        for tool_msg in active_tool_results
+                    ],
+                    role='function'
+                )
 
-            # Create event translator
-            event_translator = EventTranslator()
+            # Take an event translator from the pool, or create one
+            event_translator = self._translator_pool.pop() if self._translator_pool else EventTranslator()
             
             # Run ADK agent
-            is_long_running_tool = False
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             async for adk_event in runner.run_async(
                 user_id=user_id,
                 session_id=input.thread_id,
@@ -1055,7 +1374,7 @@ class ADKAgent:
             ):
 
                 final_response = adk_event.is_final_response()
-                has_content = adk_event.content and hasattr(adk_event.content, 'parts') and adk_event.content.parts
+                has_content = adk_event.content and getattr(adk_event.content, 'parts', None)
 
                 # Check if this is a streaming chunk that needs regular processing
                 is_streaming_chunk = (
@@ -1065,18 +1384,16 @@ class ADKAgent:
                 )
 
                 # Prefer LRO routing when a long-running tool call is present
-                has_lro_function_call = False
+                # (ADK already provides the IDs as a set, so no copy is needed)
+                lro_ids = getattr(adk_event, 'long_running_tool_ids', None)
                 try:
-                    lro_ids = set(getattr(adk_event, 'long_running_tool_ids', []) or [])
-                    if lro_ids and adk_event.content and getattr(adk_event.content, 'parts', None):
-                        for part in adk_event.content.parts:
-                            func = getattr(part, 'function_call', None)
-                            func_id = getattr(func, 'id', None) if func else None
-                            if func_id and func_id in lro_ids:
-                                has_lro_function_call = True
-                                break
-                except Exception:
-                    # Be conservative: if detection fails, do not block streaming path
+                    has_lro_function_call = bool(lro_ids) and bool(has_content) and any(
+                        (func := getattr(part, 'function_call', None)) is not None
+                        and getattr(func, 'id', None) in lro_ids
+                        for part in adk_event.content.parts
+                    )
+                except TypeError:
+                    # Be conservative: if the IDs are not a container, do not block streaming path
                     has_lro_function_call = False
 
                 # Process as streaming if it's a chunk OR if it has content but no finish_reason,
@@ -1089,90 +1406,146 @@ class ADKAgent:
                         input.run_id
                     ):
 
-                        logger.debug(f"Emitting event to queue: {type(ag_ui_event).__name__} (thread {input.thread_id}, queue size before: {event_queue.qsize()})")
-                        await event_queue.put(ag_ui_event)
-                        logger.debug(f"Event queued: {type(ag_ui_event).__name__} (thread {input.thread_id}, queue size after: {event_queue.qsize()})")
+                        if debug_enabled:
+                            logger.debug("Emitting event to queue: %s (thread %s, queue size before: %d)", type(ag_ui_event).__name__, input.thread_id, event_queue.qsize())
+                        event_queue.put_nowait(ag_ui_event)
+                        if debug_enabled:
+                            logger.debug("Event queued: %s (thread %s, queue size after: %d)", type(ag_ui_event).__name__, input.thread_id, event_queue.qsize())
                 else:
                     # LongRunning Tool events are usually emitted in final response
                     # Ensure any active streaming text message is closed BEFORE tool calls
-                    async for end_event in event_translator.force_close_streaming_message():
-                        await event_queue.put(end_event)
-                        logger.debug(f"Event queued (forced close): {type(end_event).__name__} (thread {input.thread_id}, queue size after: {event_queue.qsize()})")
+                    if event_translator._needs_close():
+                        async for end_event in event_translator.force_close_streaming_message():
+                            event_queue.put_nowait(end_event)
+                            if debug_enabled:
+                                logger.debug("Event queued (forced close): %s (thread %s, queue size after: %d)", type(end_event).__name__, input.thread_id, event_queue.qsize())
 
                     async for ag_ui_event in event_translator.translate_lro_function_calls(
                         adk_event
                     ):
-                        await event_queue.put(ag_ui_event)
-                        if ag_ui_event.type == EventType.TOOL_CALL_END:
-                            is_long_running_tool = True
-                        logger.debug(f"Event queued: {type(ag_ui_event).__name__} (thread {input.thread_id}, queue size after: {event_queue.qsize()})")
-                    # hard stop the execution if we find any long running tool
-                    if is_long_running_tool:
+                        event_queue.put_nowait(ag_ui_event)
+                        if debug_enabled:
+                            logger.debug("Event queued: %s (thread %s, queue size after: %d)", type(ag_ui_event).__name__, input.thread_id, event_queue.qsize())
+                    # hard stop the execution if we find any long running tool; the
+                    # translator records each one it emits (and starts each run reset)
+                    if event_translator.long_running_tool_ids:
                         return
             # Force close any streaming messages
-            async for ag_ui_event in event_translator.force_close_streaming_message():
-                await event_queue.put(ag_ui_event)
+            if event_translator._needs_close():
+                async for ag_ui_event in event_translator.force_close_streaming_message():
+                    event_queue.put_nowait(ag_ui_event)
             # moving states snapshot events after the text event clousure to avoid this error https://github.com/Contextable/ag-ui/issues/28
             final_state = await self._session_manager.get_session_state(input.thread_id,app_name,user_id)
             if final_state:
                 ag_ui_event =  event_translator._create_state_snapshot_event(final_state)                    
-                await event_queue.put(ag_ui_event)
+                event_queue.put_nowait(ag_ui_event)
             # Signal completion - ADK execution is done
-            logger.debug(f"Background task sending completion signal for thread {input.thread_id}")
-            await event_queue.put(None)
-            logger.debug(f"Background task completion signal sent for thread {input.thread_id}")
+            logger.debug("Background task sending completion signal for thread %s", input.thread_id)
+            event_queue.put_nowait(None)
+            logger.debug("Background task completion signal sent for thread %s", input.thread_id)
             
         except Exception as e:
             logger.error(f"Background execution error: {e}", exc_info=True)
             # Put error in queue
-            await event_queue.put(
+            event_queue.put_nowait(
                 RunErrorEvent(
                     type=EventType.RUN_ERROR,
                     message=str(e),
                     code="BACKGROUND_EXECUTION_ERROR"
                 )
             )
-            await event_queue.put(None)
+            event_queue.put_nowait(None)
         finally:
             # Background task cleanup completed
-            # Ensure the ADK runner releases any resources (e.g. toolsets)
+            # Ensure per-run ADK runners release any resources (e.g. toolsets);
+            # cached runners stay open until evicted or close()
             if runner is not None:
-                close_method = getattr(runner, "close", None)
-                if close_method is not None:
-                    try:
-                        close_result = close_method()
-                        if inspect.isawaitable(close_result):
-                            await close_result
-                    except Exception as close_error:
-                        logger.warning(
-                            "Error while closing ADK runner for thread %s: %s",
-                            input.thread_id,
-                            close_error,
-                        )
+                await self._release_runner(runner, app_name, input.thread_id)
+            # Return the translator to the pool with clean state
+            if event_translator is not None:
+                event_translator.reset()
+                self._translator_pool.append(event_translator)
+
+    async def _close_runner(self, runner: Runner, thread_id: Optional[str] = None):
+        """Close an ADK runner, logging rather than raising on failure."""
+        close_method = getattr(runner, "close", None)
+        if close_method is not None:
+            try:
+                close_result = close_method()
+                if inspect.isawaitable(close_result):
+                    await close_result
+            except Exception as close_error:
+                logger.warning(
+                    "Error while closing ADK runner for thread %s: %s",
+                    thread_id,
+                    close_error,
+                )
     
+    def _start_sweep_task(self):
+        """Start the periodic stale execution sweep."""
+        self._sweep_task = asyncio.get_running_loop().create_task(self._sweep_loop())
+        logger.debug("Started stale execution sweep task %s", id(self._sweep_task))
+
+    async def _sweep_loop(self):
+        """Periodically clean up stale executions, off the request path."""
+        interval = max(self._execution_timeout / 2, 1)
+        while True:
+            try:
+                await asyncio.sleep(interval)
+                await self._cleanup_stale_executions()
+            except asyncio.CancelledError:
+                logger.debug("Stale execution sweep cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Stale execution sweep error: {e}", exc_info=True)
+
     async def _cleanup_stale_executions(self):
         """Clean up stale executions."""
-        stale_threads = []
+        stale_executions = [
+            (thread_id, execution)
+            for thread_id, execution in self._active_executions.items()
+            if execution.is_stale(self._execution_timeout)
+        ]
         
-        for thread_id, execution in self._active_executions.items():
-            if execution.is_stale(self._execution_timeout):
-                stale_threads.append(thread_id)
+        # Unregister everything before awaiting so a concurrent caller never
+        # tries to remove the same execution twice
+        for thread_id, _ in stale_executions:
+            self._active_executions.pop(thread_id, None)
         
-        for thread_id in stale_threads:
-            execution = self._active_executions.pop(thread_id)
+        for thread_id, execution in stale_executions:
             await execution.cancel()
             logger.info(f"Cleaned up stale execution for thread {thread_id}")
 
     async def close(self):
         """Clean up resources including active executions."""
-        # Cancel all active executions
-        async with self._execution_lock:
-            for execution in self._active_executions.values():
-                await execution.cancel()
-            self._active_executions.clear()
+        # Stop the stale execution sweep
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+
+        # Cancel all active executions (snapshot, since cancelling awaits)
+        executions = list(self._active_executions.values())
+        self._active_executions.clear()
+        for execution in executions:
+            await execution.cancel()
+
+        # Close cached runners
+        runners = list(self._runner_cache.values())
+        self._runner_cache.clear()
+        self._runner_leases.clear()
+        for runner in runners:
+            await self._close_runner(runner)
+        await self._close_evicted_runners()
 
-        # Clear session lookup cache
+        # Clear session lookup and agent copy caches
         self._session_lookup_cache.clear()
+        self._metadata_flyweights.clear()
+        self._agent_copy_cache.clear()
+        self._session_manager.remove_session_expire_callback(self._on_session_expire)
 
         # Stop session manager cleanup task
         await self._session_manager.stop_cleanup_task()
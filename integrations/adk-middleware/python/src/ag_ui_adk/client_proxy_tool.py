@@ -97,8 +97,8 @@ class ClientProxyTool(BaseTool):
         the ADK's automatic function calling has difficulty parsing our
         dynamically created function signature without proper type annotations.
         """
-        logger.debug(f"_get_declaration called for {self.name}")
-        logger.debug(f"AG-UI tool parameters: {self.ag_ui_tool.parameters}")
+        logger.debug("_get_declaration called for %s", self.name)
+        logger.debug("AG-UI tool parameters: %s", self.ag_ui_tool.parameters)
 
         # Convert AG-UI parameters (JSON Schema) to ADK format
         parameters = self.ag_ui_tool.parameters
@@ -115,7 +115,7 @@ class ClientProxyTool(BaseTool):
             description=self.description,
             parameters=types.Schema.model_validate(parameters)
         )
-        logger.debug(f"Created FunctionDeclaration for {self.name}: {function_declaration}")
+        logger.debug("Created FunctionDeclaration for %s: %s", self.name, function_declaration)
         return function_declaration
 
     async def run_async(
@@ -150,15 +150,15 @@ class ClientProxyTool(BaseTool):
         Returns:
             None for long-running tools
         """
-        logger.debug(f"Proxy tool execution: {self.ag_ui_tool.name}")
-        logger.debug(f"Arguments received: {args}")
-        logger.debug(f"Tool context type: {type(tool_context)}")
+        logger.debug("Proxy tool execution: %s", self.ag_ui_tool.name)
+        logger.debug("Arguments received: %s", args)
+        logger.debug("Tool context type: %s", type(tool_context))
 
         # Extract ADK-generated function call ID if available
         adk_function_call_id = None
         if tool_context and hasattr(tool_context, 'function_call_id'):
             adk_function_call_id = tool_context.function_call_id
-            logger.debug(f"Using ADK function_call_id: {adk_function_call_id}")
+            logger.debug("Using ADK function_call_id: %s", adk_function_call_id)
 
         # Use ADK ID if available, otherwise fall back to generated ID
         tool_call_id = adk_function_call_id or f"call_{uuid.uuid4().hex[:8]}"
@@ -173,7 +173,7 @@ class ClientProxyTool(BaseTool):
                 tool_call_name=self.ag_ui_tool.name
             )
             await self.event_queue.put(start_event)
-            logger.debug(f"Emitted TOOL_CALL_START for {tool_call_id}")
+            logger.debug("Emitted TOOL_CALL_START for %s", tool_call_id)
 
             # Emit TOOL_CALL_ARGS event
             args_json = json.dumps(args)
@@ -183,7 +183,7 @@ class ClientProxyTool(BaseTool):
                 delta=args_json
             )
             await self.event_queue.put(args_event)
-            logger.debug(f"Emitted TOOL_CALL_ARGS for {tool_call_id}")
+            logger.debug("Emitted TOOL_CALL_ARGS for %s", tool_call_id)
 
             # Emit TOOL_CALL_END event
             end_event = ToolCallEndEvent(
@@ -191,10 +191,10 @@ class ClientProxyTool(BaseTool):
                 tool_call_id=tool_call_id
             )
             await self.event_queue.put(end_event)
-            logger.debug(f"Emitted TOOL_CALL_END for {tool_call_id}")
+            logger.debug("Emitted TOOL_CALL_END for %s", tool_call_id)
 
             # Return None for long-running tools - client handles the actual execution
-            logger.debug(f"Returning None for long-running tool {tool_call_id}")
+            logger.debug("Returning None for long-running tool %s", tool_call_id)
             return None
 
         except Exception as e:
@@ -65,7 +65,7 @@ class ClientProxyToolset(BaseToolset):
                     event_queue=self.event_queue
                 )
                 proxy_tools.append(proxy_tool)
-                logger.debug(f"Created proxy tool for '{ag_ui_tool.name}' (long-running)")
+                logger.debug("Created proxy tool for '%s' (long-running)", ag_ui_tool.name)
 
             except Exception as e:
                 logger.error(f"Failed to create proxy tool for '{ag_ui_tool.name}': {e}")
@@ -4,8 +4,9 @@
 
 import dataclasses
 from collections.abc import Iterable, Mapping
-from typing import AsyncGenerator, Optional, Dict, Any , List
+from typing import AsyncGenerator, Optional, Dict, Any , List, Set
 import uuid
+import weakref
 
 from google.genai import types
 
@@ -19,12 +20,49 @@ from ag_ui.core import (
 import json
 from google.adk.events import Event as ADKEvent
 
+from .utils.converters import state_key_to_json_pointer
+from .utils.serialization import json_dumps
+
 import logging
 logger = logging.getLogger(__name__)
 
 
-def _coerce_tool_response(value: Any, _visited: Optional[set[int]] = None) -> Any:
-    """Recursively convert arbitrary tool responses into JSON-serializable structures."""
+# Bound once; called for every tool result
+_json_dumps = json.dumps
+
+# Event type members bound once; they are read for every emitted event
+_TEXT_MESSAGE_START = EventType.TEXT_MESSAGE_START
+_TEXT_MESSAGE_CONTENT = EventType.TEXT_MESSAGE_CONTENT
+_TEXT_MESSAGE_END = EventType.TEXT_MESSAGE_END
+_TOOL_CALL_START = EventType.TOOL_CALL_START
+_TOOL_CALL_ARGS = EventType.TOOL_CALL_ARGS
+_TOOL_CALL_END = EventType.TOOL_CALL_END
+_TOOL_CALL_RESULT = EventType.TOOL_CALL_RESULT
+_STATE_DELTA = EventType.STATE_DELTA
+_STATE_SNAPSHOT = EventType.STATE_SNAPSHOT
+_CUSTOM = EventType.CUSTOM
+
+
+# Shared stand-in for events without long-running tool ids
+_EMPTY_FROZENSET: frozenset = frozenset()
+
+# Exact types that are already JSON leaves; checked by type() before the isinstance ladder
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Markers for the work items of the _coerce_tool_response worklist
+_COERCE_ENTER = 0
+_COERCE_EXIT = 1
+# Returned by _coerce_leaf for values that have to be descended into
+_NOT_A_LEAF = object()
+# Field names per dataclass type; weak keys so locally defined classes can still be collected
+_DATACLASS_FIELD_NAMES: "weakref.WeakKeyDictionary[type, tuple[str, ...]]" = weakref.WeakKeyDictionary()
+
+
+def _coerce_leaf(value: Any) -> Any:
+    """Coerce a value that is never descended into; return _NOT_A_LEAF otherwise."""
+
+    if type(value) in _JSON_SCALAR_TYPES:
+        return value
 
     if isinstance(value, (str, int, float, bool)) or value is None:
         return value
@@ -35,92 +73,167 @@ def _coerce_tool_response(value: Any, _visited: Optional[set[int]] = None) -> An
         except Exception:
             return list(value)
 
-    if _visited is None:
-        _visited = set()
+    return _NOT_A_LEAF
 
-    obj_id = id(value)
-    if obj_id in _visited:
-        return str(value)
 
-    _visited.add(obj_id)
-    try:
-        if dataclasses.is_dataclass(value) and not isinstance(value, type):
-            return {
-                field.name: _coerce_tool_response(getattr(value, field.name), _visited)
-                for field in dataclasses.fields(value)
-            }
+def _expand_tool_response(value: Any) -> tuple[Any, Any]:
+    """Work out how a non-leaf value is coerced.
 
-        if hasattr(value, "_asdict") and callable(getattr(value, "_asdict")):
-            try:
-                return {
-                    str(k): _coerce_tool_response(v, _visited)
-                    for k, v in value._asdict().items()  # type: ignore[attr-defined]
-                }
-            except Exception:
-                pass
+    Returns:
+        ``(container, items)`` where ``container`` is the empty dict or list to
+        fill and ``items`` the ``(key, child)`` pairs to coerce into it;
+        ``(None, replacement)`` when the value is coerced as ``replacement``
+        instead (e.g. the result of ``model_dump``); or ``(str(value), None)``
+        when it is rendered as a string.
+    """
 
-        for method_name in ("model_dump", "to_dict"):
-            method = getattr(value, method_name, None)
-            if callable(method):
-                try:
-                    dumped = method()
-                except TypeError:
-                    try:
-                        dumped = method(exclude_none=False)
-                    except Exception:
-                        continue
-                except Exception:
-                    continue
+    value_type = type(value)
+
+    # Plain dicts and lists make up nearly all tool responses; skip the probes below
+    if value_type is dict:
+        return {}, [(str(k), v) for k, v in value.items()]
 
-                return _coerce_tool_response(dumped, _visited)
+    if value_type is list or value_type is tuple:
+        return [], list(enumerate(value))
 
-        if isinstance(value, Mapping):
-            return {
-                str(k): _coerce_tool_response(v, _visited)
-                for k, v in value.items()
-            }
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        names = _DATACLASS_FIELD_NAMES.get(value_type)
+        if names is None:
+            names = tuple(field.name for field in dataclasses.fields(value))
+            _DATACLASS_FIELD_NAMES[value_type] = names
+        return {}, [(name, getattr(value, name)) for name in names]
 
-        if isinstance(value, (list, tuple, set, frozenset)):
-            return [_coerce_tool_response(item, _visited) for item in value]
+    if hasattr(value, "_asdict") and callable(getattr(value, "_asdict")):
+        try:
+            return {}, [(str(k), v) for k, v in value._asdict().items()]  # type: ignore[attr-defined]
+        except Exception:
+            pass
 
-        if isinstance(value, Iterable):
+    for method_name in ("model_dump", "to_dict"):
+        method = getattr(value, method_name, None)
+        if callable(method):
             try:
-                return [_coerce_tool_response(item, _visited) for item in list(value)]
+                dumped = method()
             except TypeError:
-                pass
+                try:
+                    dumped = method(exclude_none=False)
+                except Exception:
+                    continue
+            except Exception:
+                continue
+
+            return None, dumped
+
+    if isinstance(value, Mapping):
+        return {}, [(str(k), v) for k, v in value.items()]
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [], list(enumerate(value))
 
+    if isinstance(value, Iterable):
         try:
-            obj_vars = vars(value)
+            return [], list(enumerate(list(value)))
         except TypeError:
-            obj_vars = None
+            pass
 
-        if obj_vars:
-            coerced = {
-                key: _coerce_tool_response(val, _visited)
-                for key, val in obj_vars.items()
-                if not key.startswith("_")
-            }
-            if coerced:
-                return coerced
+    try:
+        obj_vars = vars(value)
+    except TypeError:
+        obj_vars = None
+
+    if obj_vars:
+        items = [(key, val) for key, val in obj_vars.items() if not key.startswith("_")]
+        if items:
+            return {}, items
+
+    return str(value), None
 
-        return str(value)
-    finally:
-        _visited.discard(obj_id)
+
+def _coerce_tool_response(value: Any) -> Any:
+    """Convert arbitrary tool responses into JSON-serializable structures.
+
+    Walks the response with an explicit worklist instead of recursion. A
+    value that refers back to one of its own ancestors is rendered with
+    ``str()`` to break the cycle.
+    """
+
+    leaf = _coerce_leaf(value)
+    if leaf is not _NOT_A_LEAF:
+        return leaf
+
+    root: list[Any] = [None]
+    # Object ids on the current path from the root; only containers are tracked
+    visited: set[int] = set()
+    # Work items: (_COERCE_ENTER, value, target, key) or (_COERCE_EXIT, obj_id, None, None)
+    stack: list[tuple[int, Any, Any, Any]] = [(_COERCE_ENTER, value, root, 0)]
+
+    while stack:
+        action, item, target, key = stack.pop()
+        if action is _COERCE_EXIT:
+            visited.discard(item)
+            continue
+
+        leaf = _coerce_leaf(item)
+        if leaf is not _NOT_A_LEAF:
+            target[key] = leaf
+            continue
+
+        obj_id = id(item)
+        if obj_id in visited:
+            target[key] = str(item)
+            continue
+
+        container, items = _expand_tool_response(item)
+        if container is None:
+            # Coerce the replacement in place of the value, still inside its cycle guard
+            visited.add(obj_id)
+            stack.append((_COERCE_EXIT, obj_id, None, None))
+            stack.append((_COERCE_ENTER, items, target, key))
+            continue
+
+        if items is None:
+            target[key] = container
+            continue
+
+        visited.add(obj_id)
+        stack.append((_COERCE_EXIT, obj_id, None, None))
+        if type(container) is list:
+            container.extend([None] * len(items))
+        target[key] = container
+        for child_key, child in reversed(items):
+            stack.append((_COERCE_ENTER, child, container, child_key))
+
+    return root[0]
 
 
 def _serialize_tool_response(response: Any) -> str:
     """Serialize a tool response into a JSON string."""
 
+    # Most responses are already plain JSON data; only walk them when the encoder refuses
+    try:
+        return _json_dumps(response, ensure_ascii=False)
+    except (TypeError, ValueError, RecursionError):
+        pass
+
     try:
         coerced = _coerce_tool_response(response)
-        return json.dumps(coerced, ensure_ascii=False)
+        return _json_dumps(coerced, ensure_ascii=False)
     except Exception as exc:
         logger.warning("Failed to coerce tool response to JSON: %s", exc, exc_info=True)
         try:
-            return json.dumps(str(response), ensure_ascii=False)
+            return _json_dumps(str(response), ensure_ascii=False)
         except Exception:
             logger.warning("Failed to stringify tool response; returning empty string.")
-            return json.dumps("", ensure_ascii=False)
+            return '""'
+
+
+def _resolve_is_final_response(adk_event: Any) -> bool:
+    """Resolve is_final_response, which ADK exposes as a method and tests often as a plain flag."""
+
+    is_final_response = getattr(adk_event, 'is_final_response', False)
+    if callable(is_final_response):
+        return bool(is_final_response())
+    return bool(is_final_response)
 
 
 class EventTranslator:
@@ -140,7 +253,19 @@ class EventTranslator:
         self._current_stream_text: str = ""  # Accumulates text for the active stream
         self._last_streamed_text: Optional[str] = None  # Snapshot of most recently streamed text
         self._last_streamed_run_id: Optional[str] = None  # Run identifier for the last streamed text
-        self.long_running_tool_ids: List[str] = []  # Track the long running tool IDs
+        self.long_running_tool_ids: Set[str] = set()  # Track the long running tool IDs
+        # Generated IDs are a random per-run prefix plus a counter, so only one uuid4 is drawn per run
+        self._id_prefix: str = uuid.uuid4().hex[:12]
+        self._id_counter: int = 0
+    
+    def _next_id(self) -> str:
+        """Generate an ID for a message or tool call that has none.
+
+        Returns:
+            An ID unique to this translator run
+        """
+        self._id_counter += 1
+        return f"{self._id_prefix}-{self._id_counter}"
     
     async def translate(
         self, 
@@ -159,63 +284,73 @@ class EventTranslator:
             One or more AG-UI protocol events
         """
         try:
+            # Skip user events (already in the conversation) before resolving anything else
+            if getattr(adk_event, 'author', None) == "user":
+                logger.debug("Skipping user event")
+                return
+            
             # Check ADK streaming state using proper methods
             is_partial = getattr(adk_event, 'partial', False)
             turn_complete = getattr(adk_event, 'turn_complete', False)
             
             # Check if this is the final response (contains complete message - skip to avoid duplication)
-            is_final_response = False
-            if hasattr(adk_event, 'is_final_response') and callable(adk_event.is_final_response):
-                is_final_response = adk_event.is_final_response()
-            elif hasattr(adk_event, 'is_final_response'):
-                is_final_response = adk_event.is_final_response
+            is_final_response = _resolve_is_final_response(adk_event)
             
             # Determine action based on ADK streaming pattern
             should_send_end = turn_complete and not is_partial
             
-            logger.debug(f"📥 ADK Event: partial={is_partial}, turn_complete={turn_complete}, "
-                       f"is_final_response={is_final_response}, should_send_end={should_send_end}")
-            
-            # Skip user events (already in the conversation)
-            if hasattr(adk_event, 'author') and adk_event.author == "user":
-                logger.debug("Skipping user event")
-                return
+            logger.debug("📥 ADK Event: partial=%s, turn_complete=%s, is_final_response=%s, should_send_end=%s",
+                         is_partial, turn_complete, is_final_response, should_send_end)
             
             # Handle text content
             # --- THIS IS THE RESTORED LINE ---
-            if adk_event.content and hasattr(adk_event.content, 'parts') and adk_event.content.parts:
+            content = adk_event.content
+            parts = getattr(content, 'parts', None) if content else None
+            # Pure function-call events carry no text; only a final response needs handling then
+            if parts and (is_final_response or any(part.text for part in parts)):
                 async for event in self._translate_text_content(
-                    adk_event, thread_id, run_id
+                    adk_event, thread_id, run_id,
+                    is_partial=is_partial,
+                    turn_complete=turn_complete,
+                    is_final_response=is_final_response,
                 ):
                     yield event
             
             # call _translate_function_calls function to yield Tool Events
-            if hasattr(adk_event, 'get_function_calls'):               
-                function_calls = adk_event.get_function_calls()
+            get_function_calls = getattr(adk_event, 'get_function_calls', None)
+            if get_function_calls is not None:
+                function_calls = get_function_calls()
                 if function_calls:
                     # Filter out long-running tool calls; those are handled by translate_lro_function_calls
-                    try:
-                        lro_ids = set(getattr(adk_event, 'long_running_tool_ids', []) or [])
-                    except Exception:
-                        lro_ids = set()
+                    # ADK already provides a set; only other iterables are copied
+                    lro_ids = getattr(adk_event, 'long_running_tool_ids', None)
+                    if not lro_ids:
+                        lro_ids = _EMPTY_FROZENSET
+                    elif not isinstance(lro_ids, (set, frozenset)):
+                        try:
+                            lro_ids = frozenset(lro_ids)
+                        except TypeError:
+                            lro_ids = _EMPTY_FROZENSET
 
                     non_lro_calls = [fc for fc in function_calls if getattr(fc, 'id', None) not in lro_ids]
 
                     if non_lro_calls:
-                        logger.debug(f"ADK function calls detected (non-LRO): {len(non_lro_calls)} of {len(function_calls)} total")
+                        logger.debug("ADK function calls detected (non-LRO): %d of %d total", len(non_lro_calls), len(function_calls))
                         # CRITICAL FIX: End any active text message stream before starting tool calls
                         # Per AG-UI protocol: TEXT_MESSAGE_END must be sent before TOOL_CALL_START
-                        async for event in self.force_close_streaming_message():
-                            yield event
+                        if self._needs_close():
+                            async for event in self.force_close_streaming_message():
+                                yield event
                         
                         # Yield only non-LRO function call events
-                        async for event in self._translate_function_calls(non_lro_calls):
+                        for event in self._translate_function_calls(non_lro_calls):
                             yield event
                         
             # Handle function responses and yield the tool response event
             # this is essential for scenerios when user has to render function response at frontend
-            if hasattr(adk_event, 'get_function_responses'):
-                function_responses = adk_event.get_function_responses()
+            get_function_responses = getattr(adk_event, 'get_function_responses', None)
+            if get_function_responses is not None:
+                function_responses = get_function_responses()
                 if function_responses:
                     # Function responses should be emmitted to frontend so it can render the response as well
                     async for event in self._translate_function_response(function_responses):
@@ -223,24 +358,26 @@ class EventTranslator:
                     
             
             # Handle state changes
-            if hasattr(adk_event, 'actions') and adk_event.actions:
-                if hasattr(adk_event.actions, 'state_delta') and adk_event.actions.state_delta:
+            actions = getattr(adk_event, 'actions', None)
+            if actions:
+                state_delta = getattr(actions, 'state_delta', None)
+                if state_delta:
                     yield self._create_state_delta_event(
-                        adk_event.actions.state_delta, thread_id, run_id
+                        state_delta, thread_id, run_id
                     )
 
-                if hasattr(adk_event.actions, 'state_snapshot'):
-                    state_snapshot = adk_event.actions.state_snapshot
-                    if state_snapshot is not None:
-                        yield self._create_state_snapshot_event(state_snapshot)
+                state_snapshot = getattr(actions, 'state_snapshot', None)
+                if state_snapshot is not None:
+                    yield self._create_state_snapshot_event(state_snapshot)
                 
             
             # Handle custom events or metadata
-            if hasattr(adk_event, 'custom_data') and adk_event.custom_data:
+            custom_data = getattr(adk_event, 'custom_data', None)
+            if custom_data:
                 yield CustomEvent(
-                    type=EventType.CUSTOM,
+                    type=_CUSTOM,
                     name="adk_metadata",
-                    value=adk_event.custom_data
+                    value=custom_data
                 )
                 
         except Exception as e:
@@ -251,7 +388,11 @@ class EventTranslator:
         self,
         adk_event: ADKEvent,
         thread_id: str,
-        run_id: str
+        run_id: str,
+        *,
+        is_partial: bool,
+        turn_complete: bool,
+        is_final_response: bool
     ) -> AsyncGenerator[BaseEvent, None]:
         """Translate text content from ADK event to AG-UI text message events.
         
@@ -259,39 +400,36 @@ class EventTranslator:
             adk_event: The ADK event containing text content
             thread_id: The AG-UI thread ID
             run_id: The AG-UI run ID
+            is_partial: The event's partial flag, as resolved by translate()
+            turn_complete: The event's turn_complete flag, as resolved by translate()
+            is_final_response: Whether the event is a final response, as resolved by translate()
             
         Yields:
             Text message events (START, CONTENT, END)
         """
         
-        # Check for is_final_response *before* checking for text.
+        # is_final_response is checked *before* checking for text.
         # An empty final response is a valid stream-closing signal.
-        is_final_response = False
-        if hasattr(adk_event, 'is_final_response') and callable(adk_event.is_final_response):
-            is_final_response = adk_event.is_final_response()
-        elif hasattr(adk_event, 'is_final_response'):
-            is_final_response = adk_event.is_final_response
         
         # Extract text from all parts
-        text_parts = []
         # The check for adk_event.content.parts happens in the main translate method
-        for part in adk_event.content.parts:
-            if part.text: # Note: part.text == "" is False
-                text_parts.append(part.text)
+        parts = adk_event.content.parts
+        if len(parts) == 1:
+            # Streaming chunks almost always carry a single part; skip the list and join
+            combined_text = parts[0].text or ""  # Note: part.text == "" is False
+        else:
+            text_parts = []
+            for part in parts:
+                text = part.text
+                if text:
+                    text_parts.append(text)
+            combined_text = "".join(text_parts)
         
         # If no text AND it's not a final response, we can safely skip.
         # Otherwise, we must continue to process the final_response signal.
-        if not text_parts and not is_final_response:
+        if not combined_text and not is_final_response:
             return
 
-        combined_text = "".join(text_parts)
-
-        # Use proper ADK streaming detection (handle None values)
-        is_partial = getattr(adk_event, 'partial', False)
-        turn_complete = getattr(adk_event, 'turn_complete', False)
-        
-        # (is_final_response is already calculated above)
-        
         # Handle None values: if a turn is complete or a final chunk arrives, end streaming
         has_finish_reason = bool(getattr(adk_event, 'finish_reason', None))
         should_send_end = (
@@ -300,9 +438,12 @@ class EventTranslator:
             or (has_finish_reason and self._is_streaming)
         )
 
-        logger.info(f"📥 Text event - partial={is_partial}, turn_complete={turn_complete}, "
-                    f"is_final_response={is_final_response}, has_finish_reason={has_finish_reason}, "
-                    f"should_send_end={should_send_end}, currently_streaming={self._is_streaming}")
+        # Serializing events for the log is skipped entirely when INFO is off
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        logger.info("📥 Text event - partial=%s, turn_complete=%s, is_final_response=%s, "
+                    "has_finish_reason=%s, should_send_end=%s, currently_streaming=%s",
+                    is_partial, turn_complete, is_final_response, has_finish_reason,
+                    should_send_end, self._is_streaming)
 
         if is_final_response:
             # This is the final, complete message event.
@@ -317,11 +458,12 @@ class EventTranslator:
                     self._last_streamed_run_id = run_id
                 self._current_stream_text = ""
 
-                end_event = TextMessageEndEvent(
-                    type=EventType.TEXT_MESSAGE_END,
+                end_event = TextMessageEndEvent.model_construct(
+                    type=_TEXT_MESSAGE_END,
                     message_id=self._streaming_message_id
                 )
-                logger.info(f"📤 TEXT_MESSAGE_END (from final response): {end_event.model_dump_json()}")
+                if info_enabled:
+                    logger.info("📤 TEXT_MESSAGE_END (from final response): %s", end_event.model_dump_json())
                 yield end_event
 
                 self._streaming_message_id = None
@@ -351,17 +493,17 @@ class EventTranslator:
                 )
                 message_events = [
                     TextMessageStartEvent(
-                        type=EventType.TEXT_MESSAGE_START,
+                        type=_TEXT_MESSAGE_START,
                         message_id=adk_event.id, # Use event ID for non-streamed
                         role="assistant",
                     ),
                     TextMessageContentEvent(
-                        type=EventType.TEXT_MESSAGE_CONTENT,
+                        type=_TEXT_MESSAGE_CONTENT,
                         message_id=adk_event.id,
                         delta=combined_text,
                     ),
                     TextMessageEndEvent(
-                        type=EventType.TEXT_MESSAGE_END,
+                        type=_TEXT_MESSAGE_END,
                         message_id=adk_event.id,
                     ),
                 ]
@@ -376,38 +518,43 @@ class EventTranslator:
 
         
         # Handle streaming logic (if not is_final_response)
+        # Streaming events are built with model_construct: the message id comes from
+        # _next_id() and the delta is non-empty text, so validation adds nothing per chunk
         if not self._is_streaming:
             # Start of new message - emit START event
-            self._streaming_message_id = str(uuid.uuid4())
+            self._streaming_message_id = self._next_id()
             self._is_streaming = True
             self._current_stream_text = ""
 
-            start_event = TextMessageStartEvent(
-                type=EventType.TEXT_MESSAGE_START,
+            start_event = TextMessageStartEvent.model_construct(
+                type=_TEXT_MESSAGE_START,
                 message_id=self._streaming_message_id,
                 role="assistant"
             )
-            logger.info(f"📤 TEXT_MESSAGE_START: {start_event.model_dump_json()}")
+            if info_enabled:
+                logger.info("📤 TEXT_MESSAGE_START: %s", start_event.model_dump_json())
             yield start_event
         
         # Always emit content (unless empty)
         if combined_text:
             self._current_stream_text += combined_text
-            content_event = TextMessageContentEvent(
-                type=EventType.TEXT_MESSAGE_CONTENT,
+            content_event = TextMessageContentEvent.model_construct(
+                type=_TEXT_MESSAGE_CONTENT,
                 message_id=self._streaming_message_id,
                 delta=combined_text
             )
-            logger.info(f"📤 TEXT_MESSAGE_CONTENT: {content_event.model_dump_json()}")
+            if info_enabled:
+                logger.info("📤 TEXT_MESSAGE_CONTENT: %s", content_event.model_dump_json())
             yield content_event
         
         # If turn is complete and not partial, emit END event
         if should_send_end:
-            end_event = TextMessageEndEvent(
-                type=EventType.TEXT_MESSAGE_END,
+            end_event = TextMessageEndEvent.model_construct(
+                type=_TEXT_MESSAGE_END,
                 message_id=self._streaming_message_id
             )
-            logger.info(f"📤 TEXT_MESSAGE_END: {end_event.model_dump_json()}")
+            if info_enabled:
+                logger.info("📤 TEXT_MESSAGE_END: %s", end_event.model_dump_json())
             yield end_event
 
             # Reset streaming state
@@ -436,85 +583,81 @@ class EventTranslator:
                         adk_event.long_running_tool_ids or []
                     ):
                         long_running_function_call = part.function_call
-                        self.long_running_tool_ids.append(long_running_function_call.id)
+                        self.long_running_tool_ids.add(long_running_function_call.id)
                         yield ToolCallStartEvent(
-                            type=EventType.TOOL_CALL_START,
+                            type=_TOOL_CALL_START,
                             tool_call_id=long_running_function_call.id,
                             tool_call_name=long_running_function_call.name,
                             parent_message_id=None
                         )
-                        if hasattr(long_running_function_call, 'args') and long_running_function_call.args:
+                        args = getattr(long_running_function_call, 'args', None)
+                        if args:
                             # Convert args to string (JSON format)
-                            import json
-                            args_str = json.dumps(long_running_function_call.args) if isinstance(long_running_function_call.args, dict) else str(long_running_function_call.args)
+                            args_str = json_dumps(args) if isinstance(args, dict) else str(args)
                             yield ToolCallArgsEvent(
-                                type=EventType.TOOL_CALL_ARGS,
+                                type=_TOOL_CALL_ARGS,
                                 tool_call_id=long_running_function_call.id,
                                 delta=args_str
                             )
                         
                         # Emit TOOL_CALL_END
                         yield ToolCallEndEvent(
-                            type=EventType.TOOL_CALL_END,
+                            type=_TOOL_CALL_END,
                             tool_call_id=long_running_function_call.id
                         )                       
                         
                         # Clean up tracking
                         self._active_tool_calls.pop(long_running_function_call.id, None)   
     
-    async def _translate_function_calls(
+    def _translate_function_calls(
         self,
         function_calls: list[types.FunctionCall],
-    ) -> AsyncGenerator[BaseEvent, None]:
+    ) -> List[BaseEvent]:
         """Translate function calls from ADK event to AG-UI tool call events.
         
+        The arguments of each call are already complete, so the events are
+        built in one pass and returned together rather than yielded one by one.
+        
         Args:
-            adk_event: The ADK event containing function calls
             function_calls: List of function calls from the event
-            thread_id: The AG-UI thread ID
-            run_id: The AG-UI run ID
             
-        Yields:
-            Tool call events (START, ARGS, END)
+        Returns:
+            Tool call events (START, ARGS, END) for each call, in order
         """
         # Since we're not tracking streaming messages, use None for parent message
         parent_message_id = None
+        events: List[BaseEvent] = []
         
         for func_call in function_calls:
-            tool_call_id = getattr(func_call, 'id', str(uuid.uuid4()))
-            
-            # Track the tool call
-            self._active_tool_calls[tool_call_id] = tool_call_id
+            tool_call_id = getattr(func_call, 'id', None) or self._next_id()
             
             # Emit TOOL_CALL_START
-            yield ToolCallStartEvent(
-                type=EventType.TOOL_CALL_START,
+            events.append(ToolCallStartEvent(
+                type=_TOOL_CALL_START,
                 tool_call_id=tool_call_id,
                 tool_call_name=func_call.name,
                 parent_message_id=parent_message_id
-            )
+            ))
             
             # Emit TOOL_CALL_ARGS if we have arguments
-            if hasattr(func_call, 'args') and func_call.args:
+            args = getattr(func_call, 'args', None)
+            if args:
                 # Convert args to string (JSON format)
-                import json
-                args_str = json.dumps(func_call.args) if isinstance(func_call.args, dict) else str(func_call.args)
+                args_str = json_dumps(args) if isinstance(args, dict) else str(args)
                 
-                yield ToolCallArgsEvent(
-                    type=EventType.TOOL_CALL_ARGS,
+                events.append(ToolCallArgsEvent(
+                    type=_TOOL_CALL_ARGS,
                     tool_call_id=tool_call_id,
                     delta=args_str
-                )
+                ))
             
             # Emit TOOL_CALL_END
-            yield ToolCallEndEvent(
-                type=EventType.TOOL_CALL_END,
+            events.append(ToolCallEndEvent(
+                type=_TOOL_CALL_END,
                 tool_call_id=tool_call_id
-            )
-            
-            # Clean up tracking
-            self._active_tool_calls.pop(tool_call_id, None)
-    
+            ))
+        
+        return events
 
     async def _translate_function_response(
         self,
@@ -532,18 +675,18 @@ class EventTranslator:
         
         for func_response in function_response:
             
-            tool_call_id = getattr(func_response, 'id', str(uuid.uuid4()))
+            tool_call_id = func_response.id if hasattr(func_response, 'id') else self._next_id()
             # Only emit ToolCallResultEvent for tool_call_ids which are not long_running_tool
             # this is because long running tools are handle by the frontend
             if tool_call_id not in self.long_running_tool_ids:
                 yield ToolCallResultEvent(
-                    message_id=str(uuid.uuid4()),
-                    type=EventType.TOOL_CALL_RESULT,
+                    message_id=self._next_id(),
+                    type=_TOOL_CALL_RESULT,
                     tool_call_id=tool_call_id,
                     content=_serialize_tool_response(func_response.response)
                 )
             else:
-                logger.debug(f"Skipping ToolCallResultEvent for long-running tool: {tool_call_id}")
+                logger.debug("Skipping ToolCallResultEvent for long-running tool: %s", tool_call_id)
   
     def _create_state_delta_event(
         self,
@@ -563,16 +706,13 @@ class EventTranslator:
         """
         # Convert to JSON Patch format (RFC 6902)
         # Use "add" operation which works for both new and existing paths
-        patches = []
-        for key, value in state_delta.items():
-            patches.append({
-                "op": "add",
-                "path": f"/{key}",
-                "value": value
-            })
+        patches = [
+            {"op": "add", "path": state_key_to_json_pointer(key), "value": value}
+            for key, value in state_delta.items()
+        ]
         
         return StateDeltaEvent(
-            type=EventType.STATE_DELTA,
+            type=_STATE_DELTA,
             delta=patches
         )
     
@@ -590,10 +730,18 @@ class EventTranslator:
         """
  
         return StateSnapshotEvent(
-            type=EventType.STATE_SNAPSHOT,
+            type=_STATE_SNAPSHOT,
             snapshot=state_snapshot
         )
     
+    def _needs_close(self) -> bool:
+        """Check whether a streaming message is open and must be closed.
+
+        Callers check this before force_close_streaming_message() so the
+        common case, with no open stream, creates no async generator.
+        """
+        return self._is_streaming and self._streaming_message_id is not None
+
     async def force_close_streaming_message(self) -> AsyncGenerator[BaseEvent, None]:
         """Force close any open streaming message.
         
@@ -605,11 +753,12 @@ class EventTranslator:
         if self._is_streaming and self._streaming_message_id:
             logger.warning(f"🚨 Force-closing unterminated streaming message: {self._streaming_message_id}")
 
-            end_event = TextMessageEndEvent(
-                type=EventType.TEXT_MESSAGE_END,
+            end_event = TextMessageEndEvent.model_construct(
+                type=_TEXT_MESSAGE_END,
                 message_id=self._streaming_message_id
             )
-            logger.info(f"📤 TEXT_MESSAGE_END (forced): {end_event.model_dump_json()}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📤 TEXT_MESSAGE_END (forced): %s", end_event.model_dump_json())
             yield end_event
 
             # Reset streaming state
@@ -631,5 +780,7 @@ class EventTranslator:
         self._last_streamed_text = None
         self._last_streamed_run_id = None
         self.long_running_tool_ids.clear()
+        self._id_prefix = uuid.uuid4().hex[:12]
+        self._id_counter = 0
         logger.debug("Reset EventTranslator state (including streaming state)")
         
\ No newline at end of file
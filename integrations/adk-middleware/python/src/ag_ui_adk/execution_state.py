@@ -4,12 +4,62 @@
 
 import asyncio
 import time
-from typing import Optional, Set
+from collections import deque
+from typing import Any, Optional, Set
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class EventQueue:
+    """Single-consumer event queue for streaming results to the client.
+
+    A deque paired with an asyncio.Event. Unlike asyncio.Queue, putting and
+    getting events does not allocate futures unless the consumer actually
+    has to wait. Exposes the subset of the asyncio.Queue API used here.
+    """
+
+    def __init__(self):
+        """Initialize an empty event queue."""
+        self._events: deque = deque()
+        self._signal = asyncio.Event()
+
+    def put_nowait(self, event: Any):
+        """Append an event and wake the consumer."""
+        self._events.append(event)
+        self._signal.set()
+
+    async def put(self, event: Any):
+        """Append an event and wake the consumer (never blocks)."""
+        self.put_nowait(event)
+
+    def get_nowait(self) -> Any:
+        """Remove and return the next event.
+
+        Raises:
+            asyncio.QueueEmpty: If no event is queued
+        """
+        if not self._events:
+            raise asyncio.QueueEmpty
+        return self._events.popleft()
+
+    async def get(self) -> Any:
+        """Remove and return the next event, waiting until one is queued."""
+        events = self._events
+        while not events:
+            self._signal.clear()
+            await self._signal.wait()
+        return events.popleft()
+
+    def qsize(self) -> int:
+        """Number of queued events."""
+        return len(self._events)
+
+    def empty(self) -> bool:
+        """Whether no events are queued."""
+        return not self._events
+
+
 class ExecutionState:
     """Manages the state of a background ADK execution.
 
@@ -23,7 +73,7 @@ class ExecutionState:
         self,
         task: asyncio.Task,
         thread_id: str,
-        event_queue: asyncio.Queue
+        event_queue: EventQueue
     ):
         """Initialize execution state.
 
@@ -39,7 +89,7 @@ class ExecutionState:
         self.is_complete = False
         self.pending_tool_calls: Set[str] = set()  # Track outstanding tool call IDs for HITL
 
-        logger.debug(f"Created execution state for thread {thread_id}")
+        logger.debug("Created execution state for thread %s", thread_id)
 
     def is_stale(self, timeout_seconds: int) -> bool:
         """Check if this execution has been running too long.
@@ -74,6 +124,32 @@ class ExecutionState:
         """
         return time.time() - self.start_time
 
+    def reset(self):
+        """Clear this execution state so it can be pooled and reused.
+
+        Detaches the finished task and drains any events left in the queue.
+        """
+        self.task = None
+        self.thread_id = None
+        self.is_complete = False
+        self.pending_tool_calls.clear()
+        while not self.event_queue.empty():
+            self.event_queue.get_nowait()
+
+    def reuse(self, task: asyncio.Task, thread_id: str):
+        """Bind a reset execution state to a new background task.
+
+        Args:
+            task: The asyncio task running the ADK agent
+            thread_id: The thread ID for this execution
+        """
+        self.task = task
+        self.thread_id = thread_id
+        self.start_time = time.time()
+        self.is_complete = False
+
+        logger.debug("Reused execution state for thread %s", thread_id)
+
     def add_pending_tool_call(self, tool_call_id: str):
         """Add a tool call ID to the pending set.
 
@@ -81,7 +157,7 @@ class ExecutionState:
             tool_call_id: The tool call ID to track
         """
         self.pending_tool_calls.add(tool_call_id)
-        logger.debug(f"Added pending tool call {tool_call_id} to thread {self.thread_id}")
+        logger.debug("Added pending tool call %s to thread %s", tool_call_id, self.thread_id)
 
     def remove_pending_tool_call(self, tool_call_id: str):
         """Remove a tool call ID from the pending set.
@@ -90,7 +166,7 @@ class ExecutionState:
             tool_call_id: The tool call ID to remove
         """
         self.pending_tool_calls.discard(tool_call_id)
-        logger.debug(f"Removed pending tool call {tool_call_id} from thread {self.thread_id}")
+        logger.debug("Removed pending tool call %s from thread %s", tool_call_id, self.thread_id)
 
     def has_pending_tool_calls(self) -> bool:
         """Check if there are outstanding tool calls waiting for responses.
@@ -111,6 +187,8 @@ class ExecutionState:
                 return "complete_awaiting_tools"
             else:
                 return "complete"
+        elif self.task is None:
+            return "idle"  # reset and waiting in the pool
         elif self.task.done():
             return "task_done"
         else:
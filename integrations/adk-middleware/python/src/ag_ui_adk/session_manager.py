@@ -2,13 +2,24 @@
 
 """Session manager that adds production features to ADK's native session service."""
 
-from typing import Dict, Optional, Set, Any, Union, Iterable
+from typing import Dict, FrozenSet, List, Optional, Set, Any, Union, Iterable, Tuple, Callable
 import asyncio
+import heapq
+import itertools
+from collections import OrderedDict
 import logging
+import threading
 import time
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of concurrent session service calls made by cleanup and bulk operations
+_MAX_CONCURRENT_SESSION_CALLS = 32
+
+# Default number of processed message IDs remembered per session
+_DEFAULT_MAX_PROCESSED_MESSAGE_IDS = 4096
+
 
 class SessionManager:
     """Session manager that wraps ADK's session service.
@@ -24,11 +35,15 @@ class SessionManager:
     
     _instance = None
     _initialized = False
+    # Guards first construction; the fast path checks without taking it
+    _init_lock = threading.Lock()
     
     def __new__(cls, session_service=None, **kwargs):
         """Ensure singleton instance."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            with cls._init_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
         return cls._instance
     
     def __init__(
@@ -38,7 +53,8 @@ class SessionManager:
         session_timeout_seconds: int = 1200,  # 20 minutes default
         cleanup_interval_seconds: int = 300,  # 5 minutes
         max_sessions_per_user: Optional[int] = None,
-        auto_cleanup: bool = True
+        auto_cleanup: bool = True,
+        max_processed_message_ids: int = _DEFAULT_MAX_PROCESSED_MESSAGE_IDS
     ):
         """Initialize the session manager.
         
@@ -49,10 +65,35 @@ class SessionManager:
             cleanup_interval_seconds: Interval between cleanup cycles
             max_sessions_per_user: Maximum concurrent sessions per user (None = unlimited)
             auto_cleanup: Enable automatic session cleanup task
+            max_processed_message_ids: Processed message IDs remembered per session;
+                the least recently marked IDs are forgotten first
         """
         if self._initialized:
             return
-            
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._initialize(
+                session_service,
+                memory_service,
+                session_timeout_seconds,
+                cleanup_interval_seconds,
+                max_sessions_per_user,
+                auto_cleanup,
+                max_processed_message_ids,
+            )
+
+    def _initialize(
+        self,
+        session_service,
+        memory_service,
+        session_timeout_seconds: int,
+        cleanup_interval_seconds: int,
+        max_sessions_per_user: Optional[int],
+        auto_cleanup: bool,
+        max_processed_message_ids: int,
+    ) -> None:
+        """Set up the singleton's state; called once under the init lock."""
         if session_service is None:
             from google.adk.sessions import InMemorySessionService
             session_service = InMemorySessionService()
@@ -63,11 +104,25 @@ class SessionManager:
         self._cleanup_interval = cleanup_interval_seconds
         self._max_per_user = max_sessions_per_user
         self._auto_cleanup = auto_cleanup
+        self._max_processed_ids = max_processed_message_ids
         
         # Minimal tracking: just keys and user counts
         self._session_keys: Set[str] = set()  # "app_name:session_id" keys
         self._user_sessions: Dict[str, Set[str]] = {}  # user_id -> set of session_keys
-        self._processed_message_ids: Dict[str, Set[str]] = {}
+        self._user_app_sessions: Dict[Tuple[str, str], Set[str]] = {}  # (user_id, app_name) -> session_keys
+        self._session_users: Dict[str, str] = {}  # session_key -> user_id (reverse of _user_sessions)
+        self._session_key_parts: Dict[str, Tuple[str, str]] = {}  # session_key -> (app_name, session_id)
+        self._last_seen: Dict[str, float] = {}  # session_key -> newest last_update_time observed
+        # Min-heap of (deadline, session_key); stale entries are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # session_key -> processed IDs in marking order, bounded by max_processed_message_ids
+        self._processed_message_ids: Dict[str, "OrderedDict[str, None]"] = {}
+        self._last_processed_message_id: Dict[str, str] = {}  # session_key -> most recently marked ID
+        self._message_tail_hints: Dict[str, Tuple[int, str]] = {}  # session_key -> (index, ID) of last message seen
+        self._session_owners: Dict[str, Tuple[str, str]] = {}  # session_id -> (app_name, user_id)
+        # Zero-argument refs resolving to the callback, or None once its owner is collected
+        self._expire_callbacks: List[Callable[[], Optional[Callable[[str, str, str], None]]]] = []
+        self._state_update_seq = itertools.count()  # numbers state-delta invocation IDs
         
         self._cleanup_task: Optional[asyncio.Task] = None
         self._initialized = True
@@ -95,8 +150,9 @@ class SessionManager:
                     task.cancel()
                 except RuntimeError:
                     pass
-        cls._instance = None
-        cls._initialized = False
+        with cls._init_lock:
+            cls._instance = None
+            cls._initialized = False
     
     async def get_or_create_session(
         self,
@@ -119,11 +175,19 @@ class SessionManager:
                 await self._remove_oldest_user_session(user_id)
         
         # Get or create via ADK
-        session = await self._session_service.get_session(
-            session_id=session_id,
-            app_name=app_name,
-            user_id=user_id
-        )
+        session = await self._get_session(session_id, app_name, user_id)
+        
+        # Expire on access: a tracked session past its timeout is replaced now instead
+        # of being resumed until the next cleanup cycle happens to remove it
+        if (
+            session
+            and self._auto_cleanup
+            and session_key in self._session_keys
+            and self._is_expired(session_key, session)
+        ):
+            logger.info("Session %s expired before access, starting a new one", session_key)
+            await self._delete_session(session)
+            session = None
         
         if not session:
             session = await self._session_service.create_session(
@@ -132,15 +196,17 @@ class SessionManager:
                 app_name=app_name,
                 state=initial_state or {}
             )
-            logger.info(f"Created new session: {session_key}")
+            logger.info("Created new session: %s", session_key)
         else:
-            logger.debug(f"Retrieved existing session: {session_key}")
+            logger.debug("Retrieved existing session: %s", session_key)
         
         # Track the session key
         self._track_session(session_key, user_id)
+        self._session_owners[session_id] = (app_name, user_id)
+        self._note_last_seen(session_key, session)
         
         # Start cleanup if needed
-        if self._auto_cleanup and not self._cleanup_task:
+        if self._auto_cleanup:
             self._start_cleanup_task()
         
         return session
@@ -153,7 +219,8 @@ class SessionManager:
         app_name: str,
         user_id: str,
         state_updates: Dict[str, Any],
-        merge: bool = True
+        merge: bool = True,
+        session: Optional[Any] = None
     ) -> bool:
         """Update session state with new values.
         
@@ -163,27 +230,22 @@ class SessionManager:
             user_id: User identifier
             state_updates: Dictionary of state key-value pairs to update
             merge: If True, merge with existing state; if False, replace completely
+            session: Already-fetched ADK session, to skip fetching it again
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            session = await self._session_service.get_session(
-                session_id=session_id,
-                app_name=app_name,
-                user_id=user_id
-            )
-            
-            if not session:
-                logger.debug(f"Session not found for update: {app_name}:{session_id} - this may be normal if session is still being created")
-                return False
-            
             if not state_updates:
-                logger.debug(f"No state updates provided for session: {app_name}:{session_id}")
+                logger.debug("No state updates provided for session: %s:%s", app_name, session_id)
                 return False
             
-            # Apply state updates using EventActions
-            from google.adk.events import Event, EventActions
+            if session is None:
+                session = await self._get_session(session_id, app_name, user_id)
+            
+            if not session:
+                logger.debug("Session not found for update: %s:%s - this may be normal if session is still being created", app_name, session_id)
+                return False
             
             # Prepare state delta
             if merge:
@@ -195,20 +257,11 @@ class SessionManager:
                 # Note: Complete replacement might need clearing existing keys
                 # This depends on ADK's behavior - may need to explicitly clear
             
-            # Create event with state changes
-            actions = EventActions(state_delta=state_delta)
-            event = Event(
-                invocation_id=f"state_update_{int(time.time())}",
-                author="system",
-                actions=actions,
-                timestamp=time.time()
-            )
-            
-            # Apply changes through ADK's event system
-            await self._session_service.append_event(session, event)
+            await self._apply_state_delta(session, state_delta)
+            self._note_last_seen(self._make_session_key(app_name, session_id), session)
             
-            logger.info(f"Updated state for session {app_name}:{session_id}")
-            logger.debug(f"State updates: {state_updates}")
+            logger.info("Updated state for session %s:%s", app_name, session_id)
+            logger.debug("State updates: %s", state_updates)
             
             return True
             
@@ -216,6 +269,40 @@ class SessionManager:
             logger.error(f"Failed to update session state: {e}", exc_info=True)
             return False
     
+    async def _get_session(self, session_id: str, app_name: str, user_id: str) -> Optional[Any]:
+        """Fetch a session from the ADK session service.
+        
+        Returns:
+            The ADK session, or None if it does not exist
+        """
+        return await self._session_service.get_session(
+            session_id=session_id,
+            app_name=app_name,
+            user_id=user_id
+        )
+    
+    async def _apply_state_delta(self, session: Any, state_delta: Dict[str, Any]) -> None:
+        """Append a single state-delta event to an already-fetched session.
+        
+        Args:
+            session: The ADK session object to update
+            state_delta: Dictionary of state key-value pairs to apply
+        """
+        # Apply state updates using EventActions
+        from google.adk.events import Event, EventActions
+        
+        # Create event with state changes
+        actions = EventActions(state_delta=state_delta)
+        event = Event(
+            invocation_id=f"state_update_{next(self._state_update_seq)}",
+            author="system",
+            actions=actions,
+            timestamp=time.time()
+        )
+        
+        # Apply changes through ADK's event system
+        await self._session_service.append_event(session, event)
+    
     async def get_session_state(
         self,
         session_id: str,
@@ -233,27 +320,29 @@ class SessionManager:
             Session state dictionary or None if session not found
         """
         try:
-            session = await self._session_service.get_session(
-                session_id=session_id,
-                app_name=app_name,
-                user_id=user_id
-            )
+            session = await self._get_session(session_id, app_name, user_id)
             
             if not session:
-                logger.debug(f"Session not found when getting state: {app_name}:{session_id}")
+                logger.debug("Session not found when getting state: %s:%s", app_name, session_id)
                 return None
             
-            # Return state as dictionary
-            if hasattr(session.state, 'to_dict'):
-                return session.state.to_dict()
-            else:
-                # Fallback for dict-like state objects
-                return dict(session.state)
+            self._note_last_seen(self._make_session_key(app_name, session_id), session)
+            
+            return self._state_as_dict(session)
                 
         except Exception as e:
             logger.error(f"Failed to get session state: {e}", exc_info=True)
             return None
     
+    @staticmethod
+    def _state_as_dict(session: Any) -> Dict[str, Any]:
+        """Return a session's state as a plain dictionary."""
+        if hasattr(session.state, 'to_dict'):
+            return session.state.to_dict()
+        else:
+            # Fallback for dict-like state objects
+            return dict(session.state)
+    
     async def get_state_value(
         self,
         session_id: str,
@@ -275,14 +364,10 @@ class SessionManager:
             Value for the key or default
         """
         try:
-            session = await self._session_service.get_session(
-                session_id=session_id,
-                app_name=app_name,
-                user_id=user_id
-            )
+            session = await self._get_session(session_id, app_name, user_id)
             
             if not session:
-                logger.debug(f"Session not found when getting state value: {app_name}:{session_id}")
+                logger.debug("Session not found when getting state value: %s:%s", app_name, session_id)
                 return default
             
             if hasattr(session.state, 'get'):
@@ -321,12 +406,58 @@ class SessionManager:
             state_updates={key: value}
         )
     
+    async def mutate_state_value(
+        self,
+        session_id: str,
+        app_name: str,
+        user_id: str,
+        key: str,
+        mutator: Callable[[Any], Any],
+        default: Any = None
+    ) -> Any:
+        """Read, transform and write back a state value with a single session fetch.
+        
+        The mutator should return a new value rather than modifying its
+        argument in place; nothing is written when the value is unchanged.
+        
+        Args:
+            session_id: Session identifier
+            app_name: Application name
+            user_id: User identifier
+            key: State key to mutate
+            mutator: Callable receiving the current value and returning the new one
+            default: Value passed to the mutator if the key is not set
+            
+        Returns:
+            The new value, or default if the session was not found or the update failed
+        """
+        try:
+            session = await self._get_session(session_id, app_name, user_id)
+            
+            if not session:
+                logger.debug("Session not found when mutating state value: %s:%s", app_name, session_id)
+                return default
+            
+            current_value = session.state.get(key, default)
+            new_value = mutator(current_value)
+            
+            if new_value != current_value:
+                await self._apply_state_delta(session, {key: new_value})
+                logger.debug("Mutated state key '%s' for session %s:%s", key, app_name, session_id)
+            
+            return new_value
+            
+        except Exception as e:
+            logger.error(f"Failed to mutate state value: {e}", exc_info=True)
+            return default
+    
     async def remove_state_keys(
         self,
         session_id: str,
         app_name: str,
         user_id: str,
-        keys: Union[str, list]
+        keys: Union[str, list],
+        session: Optional[Any] = None
     ) -> bool:
         """Remove specific keys from session state.
         
@@ -335,6 +466,7 @@ class SessionManager:
             app_name: Application name
             user_id: User identifier
             keys: Single key or list of keys to remove
+            session: Already-fetched ADK session, to skip fetching it again
             
         Returns:
             True if successful, False otherwise
@@ -343,8 +475,14 @@ class SessionManager:
             if isinstance(keys, str):
                 keys = [keys]
             
-            # Get current state
-            current_state = await self.get_session_state(session_id, app_name, user_id)
+            # Get current state; the fetched session is reused for the update
+            if session is None:
+                session = await self._get_session(session_id, app_name, user_id)
+            if not session:
+                logger.debug("Session not found when removing state keys: %s:%s", app_name, session_id)
+                return False
+            
+            current_state = self._state_as_dict(session)
             if not current_state:
                 return False
             
@@ -352,14 +490,15 @@ class SessionManager:
             state_delta = {key: None for key in keys if key in current_state}
             
             if not state_delta:
-                logger.info(f"No keys to remove from session {app_name}:{session_id}")
+                logger.info("No keys to remove from session %s:%s", app_name, session_id)
                 return True
             
             return await self.update_session_state(
                 session_id=session_id,
                 app_name=app_name,
                 user_id=user_id,
-                state_updates=state_delta
+                state_updates=state_delta,
+                session=session
             )
             
         except Exception as e:
@@ -385,25 +524,30 @@ class SessionManager:
             True if successful, False otherwise
         """
         try:
-            current_state = await self.get_session_state(session_id, app_name, user_id)
-            if not current_state:
+            # Fetched once; remove_state_keys and the update reuse it
+            session = await self._get_session(session_id, app_name, user_id)
+            if not session:
+                logger.debug("Session not found when clearing state: %s:%s", app_name, session_id)
                 return False
             
-            preserve_prefixes = preserve_prefixes or []
+            current_state = self._state_as_dict(session)
+            if not current_state:
+                return False
             
-            # Determine which keys to remove
-            keys_to_remove = []
-            for key in current_state.keys():
-                should_preserve = any(key.startswith(prefix) for prefix in preserve_prefixes)
-                if not should_preserve:
-                    keys_to_remove.append(key)
+            # Determine which keys to remove; str.startswith checks every prefix at once
+            if preserve_prefixes:
+                prefixes = tuple(preserve_prefixes)
+                keys_to_remove = [key for key in current_state if not key.startswith(prefixes)]
+            else:
+                keys_to_remove = list(current_state)
             
             if keys_to_remove:
                 return await self.remove_state_keys(
                     session_id=session_id,
                     app_name=app_name,
                     user_id=user_id,
-                    keys=keys_to_remove
+                    keys=keys_to_remove,
+                    session=session
                 )
             
             return True
@@ -433,9 +577,15 @@ class SessionManager:
             True if successful, False otherwise
         """
         try:
+            session = None
             if not overwrite_existing:
-                # Only set values that don't already exist
-                current_state = await self.get_session_state(session_id, app_name, user_id)
+                # Only set values that don't already exist; the fetched session is reused for the update
+                session = await self._get_session(session_id, app_name, user_id)
+                if not session:
+                    logger.debug("Session not found when initializing state: %s:%s", app_name, session_id)
+                    return False
+                
+                current_state = self._state_as_dict(session)
                 if current_state:
                     # Filter out keys that already exist
                     filtered_state = {
@@ -443,7 +593,7 @@ class SessionManager:
                         if key not in current_state
                     }
                     if not filtered_state:
-                        logger.info(f"No new state values to initialize for session {app_name}:{session_id}")
+                        logger.info("No new state values to initialize for session %s:%s", app_name, session_id)
                         return True
                     initial_state = filtered_state
             
@@ -451,7 +601,8 @@ class SessionManager:
                 session_id=session_id,
                 app_name=app_name,
                 user_id=user_id,
-                state_updates=initial_state
+                state_updates=initial_state,
+                session=session
             )
             
         except Exception as e:
@@ -476,56 +627,187 @@ class SessionManager:
         Returns:
             Dictionary mapping session_key to success status
         """
-        results = {}
-        
         if user_id not in self._user_sessions:
-            logger.info(f"No sessions found for user {user_id}")
-            return results
+            logger.info("No sessions found for user %s", user_id)
+            return {}
         
-        for session_key in self._user_sessions[user_id]:
-            app_name, session_id = session_key.split(':', 1)
-            
-            # Apply filter if specified
-            if app_name_filter and app_name != app_name_filter:
-                continue
-            
-            success = await self.update_session_state(
-                session_id=session_id,
-                app_name=app_name,
-                user_id=user_id,
-                state_updates=state_updates
-            )
-            
-            results[session_key] = success
+        if app_name_filter:
+            # Indexed by app, so only matching sessions are visited
+            session_keys = self._user_app_sessions.get((user_id, app_name_filter), ())
+        else:
+            session_keys = self._user_sessions[user_id]
+        
+        targets = []
+        for session_key in session_keys:
+            app_name, session_id = self._split_session_key(session_key)
+            targets.append((session_key, app_name, session_id))
+        
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SESSION_CALLS)
+        
+        async def update(app_name: str, session_id: str) -> bool:
+            async with semaphore:
+                return await self.update_session_state(
+                    session_id=session_id,
+                    app_name=app_name,
+                    user_id=user_id,
+                    state_updates=state_updates
+                )
+        
+        # update_session_state reports failures as False rather than raising
+        successes = await asyncio.gather(
+            *(update(app_name, session_id) for _, app_name, session_id in targets)
+        )
         
-        return results
+        return {
+            session_key: success
+            for (session_key, _, _), success in zip(targets, successes)
+        }
     
     # ===== EXISTING METHODS (unchanged) =====
     
     def _track_session(self, session_key: str, user_id: str):
         """Track a session key for enumeration."""
-        self._session_keys.add(session_key)
+        if session_key not in self._session_keys:
+            # Parsed once here so enumeration never has to split keys again
+            app_name, _, session_id = session_key.partition(':')
+            self._session_key_parts[session_key] = (app_name, session_id)
+            # Added before pushing so a heap rebuild triggered by the push keeps it
+            self._session_keys.add(session_key)
+            # Due at the next cleanup unless a last_update_time is observed first
+            self._push_deadline(session_key, 0.0)
+        self._session_users[session_key] = user_id
 
-        if user_id not in self._user_sessions:
-            self._user_sessions[user_id] = set()
-        self._user_sessions[user_id].add(session_key)
+        self._user_sessions.setdefault(user_id, set()).add(session_key)
+        app_name = self._split_session_key(session_key)[0]
+        self._user_app_sessions.setdefault((user_id, app_name), set()).add(session_key)
 
     def _untrack_session(self, session_key: str, user_id: str):
         """Remove session tracking."""
         self._session_keys.discard(session_key)
+        if self._session_users.get(session_key) == user_id:
+            del self._session_users[session_key]
+        self._last_seen.pop(session_key, None)
         self._processed_message_ids.pop(session_key, None)
+        self._last_processed_message_id.pop(session_key, None)
+        self._message_tail_hints.pop(session_key, None)
+
+        app_name, session_id = self._split_session_key(session_key)
+        self._session_key_parts.pop(session_key, None)
+        if self._session_owners.get(session_id) == (app_name, user_id):
+            del self._session_owners[session_id]
 
-        if user_id in self._user_sessions:
-            self._user_sessions[user_id].discard(session_key)
-            if not self._user_sessions[user_id]:
+        dead_refs = False
+        for callback_ref in list(self._expire_callbacks):
+            callback = callback_ref()
+            if callback is None:
+                dead_refs = True
+                continue
+            try:
+                callback(session_id, app_name, user_id)
+            except Exception as e:
+                logger.error(f"Session expire callback failed for {session_key}: {e}")
+        if dead_refs:
+            self._expire_callbacks = [ref for ref in self._expire_callbacks if ref() is not None]
+
+        user_keys = self._user_sessions.get(user_id)
+        if user_keys is not None:
+            user_keys.discard(session_key)
+            if not user_keys:
                 del self._user_sessions[user_id]
+        app_keys = self._user_app_sessions.get((user_id, app_name))
+        if app_keys is not None:
+            app_keys.discard(session_key)
+            if not app_keys:
+                del self._user_app_sessions[(user_id, app_name)]
+
+    def on_session_expire(self, callback: Callable[[str, str, str], None]):
+        """Register a callback invoked whenever a session stops being tracked.
+
+        The callback receives (session_id, app_name, user_id) after the session
+        expires or is deleted. Bound methods are held weakly, so registering
+        one does not keep its object alive; it is dropped once collected.
+
+        Args:
+            callback: Function to call on session removal
+        """
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            callback_ref = weakref.WeakMethod(callback)
+        else:
+            def callback_ref(callback=callback):
+                return callback
+        self._expire_callbacks.append(callback_ref)
+
+    def remove_session_expire_callback(self, callback: Callable[[str, str, str], None]):
+        """Unregister a callback previously passed to on_session_expire."""
+        self._expire_callbacks = [
+            ref for ref in self._expire_callbacks
+            if ref() is not None and ref() != callback
+        ]
 
     def _make_session_key(self, app_name: str, session_id: str) -> str:
         return f"{app_name}:{session_id}"
 
-    def get_processed_message_ids(self, app_name: str, session_id: str) -> Set[str]:
+    def _split_session_key(self, session_key: str) -> Tuple[str, str]:
+        """Get the (app_name, session_id) pair a session key was built from."""
+        parts = self._session_key_parts.get(session_key)
+        if parts is None:
+            app_name, _, session_id = session_key.partition(':')
+            parts = (app_name, session_id)
+        return parts
+
+    def _note_last_seen(self, session_key: str, session: Any) -> None:
+        """Remember a session's last_update_time so cleanup can skip fresh sessions.
+
+        ADK only moves last_update_time forward, so a cached value is a lower
+        bound: a session seen recently enough cannot have expired yet.
+        """
+        update_time = getattr(session, 'last_update_time', None)
+        if isinstance(update_time, (int, float)) and update_time > self._last_seen.get(session_key, 0):
+            self._last_seen[session_key] = update_time
+            self._push_deadline(session_key, update_time + self._timeout)
+
+    def _is_expired(self, session_key: str, session: Any) -> bool:
+        """Check whether a fetched session is past its timeout and can be removed.
+
+        Sessions with pending tool calls (HITL) are never considered expired.
+        """
+        self._note_last_seen(session_key, session)
+        last_seen = self._last_seen.get(session_key)
+        if last_seen is None or time.time() - last_seen <= self._timeout:
+            return False
+        return not (session.state and session.state.get("pending_tool_calls"))
+
+    def _push_deadline(self, session_key: str, deadline: float) -> None:
+        """Schedule a session to be checked by cleanup once the deadline passes."""
+        heap = self._expiry_heap
+        heapq.heappush(heap, (deadline, session_key))
+        # Every touch leaves an outdated entry behind; rebuild once they dominate
+        if len(heap) > 2 * len(self._session_keys) + 64:
+            timeout = self._timeout
+            heap[:] = [
+                (self._last_seen.get(key, 0) + timeout, key)
+                for key in self._session_keys
+            ]
+            heapq.heapify(heap)
+
+    def get_session_owner(self, session_id: str) -> Optional[Tuple[str, str]]:
+        """Get the (app_name, user_id) pair a tracked session was created for.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Tuple of (app_name, user_id), or None if the session is not tracked
+        """
+        return self._session_owners.get(session_id)
+
+    def get_processed_message_ids(self, app_name: str, session_id: str) -> FrozenSet[str]:
+        """Get a read-only snapshot of the processed message IDs for a session.
+
+        Copies the stored IDs; use is_message_processed() for membership checks.
+        """
         session_key = self._make_session_key(app_name, session_id)
-        return set(self._processed_message_ids.get(session_key, set()))
+        return frozenset(self._processed_message_ids.get(session_key, ()))
 
     def mark_messages_processed(
         self,
@@ -534,41 +816,77 @@ class SessionManager:
         message_ids: Iterable[str],
     ) -> None:
         session_key = self._make_session_key(app_name, session_id)
-        processed_ids = self._processed_message_ids.setdefault(session_key, set())
+        processed_ids = self._processed_message_ids.get(session_key)
+        if processed_ids is None:
+            processed_ids = self._processed_message_ids[session_key] = OrderedDict()
 
+        last_message_id = None
         for message_id in message_ids:
             if message_id:
-                processed_ids.add(message_id)
+                if message_id in processed_ids:
+                    processed_ids.move_to_end(message_id)
+                else:
+                    processed_ids[message_id] = None
+                last_message_id = message_id
+
+        # Forget the least recently marked IDs once over the cap
+        max_ids = self._max_processed_ids
+        while len(processed_ids) > max_ids:
+            processed_ids.popitem(last=False)
+
+        if last_message_id is not None:
+            self._last_processed_message_id[session_key] = last_message_id
+
+    def get_last_processed_message_id(self, app_name: str, session_id: str) -> Optional[str]:
+        """Get the ID most recently marked as processed for a session, if any."""
+        return self._last_processed_message_id.get(self._make_session_key(app_name, session_id))
+
+    def is_message_processed(self, app_name: str, session_id: str, message_id: str) -> bool:
+        """Check a single message ID without copying the processed set."""
+        session_key = self._make_session_key(app_name, session_id)
+        return message_id in self._processed_message_ids.get(session_key, ())
+
+    def get_message_tail_hint(self, app_name: str, session_id: str) -> Optional[Tuple[int, str]]:
+        """Get the (index, message_id) of the last message seen in the previous request."""
+        return self._message_tail_hints.get(self._make_session_key(app_name, session_id))
+
+    def set_message_tail_hint(self, app_name: str, session_id: str, index: int, message_id: str) -> None:
+        """Remember where the previous request's message list ended.
+
+        Frontends resend the whole conversation with new messages appended, so
+        the next request can start looking for unseen messages after this index.
+        """
+        self._message_tail_hints[self._make_session_key(app_name, session_id)] = (index, message_id)
     
     async def _remove_oldest_user_session(self, user_id: str):
-        """Remove the oldest session for a user based on lastUpdateTime."""
+        """Remove the oldest session for a user based on lastUpdateTime.
+        
+        The oldest session is picked from the locally cached update times, so
+        only the session being removed is fetched. Sessions never observed with
+        an update time count as oldest.
+        """
         if user_id not in self._user_sessions:
             return
         
-        oldest_session = None
-        oldest_time = float('inf')
+        last_seen = self._last_seen
+        candidates = sorted(self._user_sessions[user_id], key=lambda key: last_seen.get(key, 0))
         
-        # Find oldest session by checking ADK's lastUpdateTime
-        for session_key in self._user_sessions[user_id]:
-            app_name, session_id = session_key.split(':', 1)
+        for session_key in candidates:
+            app_name, session_id = self._split_session_key(session_key)
             try:
-                session = await self._session_service.get_session(
-                    session_id=session_id,
-                    app_name=app_name,
-                    user_id=user_id
-                )
-                if session and hasattr(session, 'last_update_time'):
-                    update_time = session.last_update_time
-                    if update_time < oldest_time:
-                        oldest_time = update_time
-                        oldest_session = session
+                session = await self._get_session(session_id, app_name, user_id)
             except Exception as e:
                 logger.error(f"Error checking session {session_key}: {e}")
-        
-        if oldest_session:
-            session_key = self._make_session_key(oldest_session.app_name, oldest_session.id)
-            await self._delete_session(oldest_session)
-            logger.info(f"Removed oldest session for user {user_id}: {session_key}")
+                continue
+            
+            if not session:
+                # Already gone from ADK; untracking it frees the slot
+                self._untrack_session(session_key, user_id)
+                return
+            
+            await self._delete_session(session)
+            logger.info("Removed oldest session for user %s: %s", user_id, session_key)
+            return
     
     async def _delete_session(self, session):
         """Delete a session using the session object directly.
@@ -583,11 +901,11 @@ class SessionManager:
         session_key = f"{session.app_name}:{session.id}"
         
         # If memory service is available, add session to memory before deletion
-        logger.debug(f"Deleting session {session_key}, memory_service: {self._memory_service is not None}")
+        logger.debug("Deleting session %s, memory_service: %s", session_key, self._memory_service is not None)
         if self._memory_service:
             try:
                 await self._memory_service.add_session_to_memory(session)
-                logger.debug(f"Added session {session_key} to memory before deletion")
+                logger.debug("Added session %s to memory before deletion", session_key)
             except Exception as e:
                 logger.error(f"Failed to add session {session_key} to memory: {e}")
         
@@ -597,28 +915,35 @@ class SessionManager:
                 app_name=session.app_name,
                 user_id=session.user_id
             )
-            logger.debug(f"Deleted session: {session_key}")
+            logger.debug("Deleted session: %s", session_key)
         except Exception as e:
             logger.error(f"Failed to delete session {session_key}: {e}")
         
         self._untrack_session(session_key, session.user_id)
     
     def _start_cleanup_task(self):
-        """Start the cleanup task if not already running."""
+        """Start the cleanup task if not already running.
+        
+        Idempotent: the check and the task creation happen without yielding to
+        the event loop, so concurrent callers cannot start a second loop. A task
+        that has finished (e.g. it belonged to a closed event loop) is replaced.
+        """
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
         try:
             loop = asyncio.get_running_loop()
             self._cleanup_task = loop.create_task(self._cleanup_loop())
-            logger.debug(f"Started session cleanup task {id(self._cleanup_task)} for SessionManager {id(self)}")
+            logger.debug("Started session cleanup task %s for SessionManager %s", id(self._cleanup_task), id(self))
         except RuntimeError:
             logger.debug("No event loop, cleanup will start later")
     
     async def _cleanup_loop(self):
         """Periodically clean up expired sessions."""
-        logger.debug(f"Cleanup loop started for SessionManager {id(self)}")
+        logger.debug("Cleanup loop started for SessionManager %s", id(self))
         while True:
             try:
                 await asyncio.sleep(self._cleanup_interval)
-                logger.debug(f"Running cleanup on SessionManager {id(self)}")
+                logger.debug("Running cleanup on SessionManager %s", id(self))
                 await self._cleanup_expired_sessions()
             except asyncio.CancelledError:
                 logger.info("Cleanup task cancelled")
@@ -627,41 +952,66 @@ class SessionManager:
                 logger.error(f"Cleanup error: {e}", exc_info=True)
     
     async def _cleanup_expired_sessions(self):
-        """Find and remove expired sessions based on lastUpdateTime."""
+        """Find and remove expired sessions based on lastUpdateTime.
+        
+        Sessions are fetched concurrently (bounded by
+        _MAX_CONCURRENT_SESSION_CALLS), then checked, then deleted concurrently.
+        """
         current_time = time.time()
-        expired_count = 0
         
-        # Check all tracked sessions
-        for session_key in list(self._session_keys):  # Copy to avoid modification during iteration
-            app_name, session_id = session_key.split(':', 1)
-            
-            # Find user_id for this session
-            user_id = None
-            for uid, keys in self._user_sessions.items():
-                if session_key in keys:
-                    user_id = uid
-                    break
-            
-            if not user_id:
+        # Pop the sessions whose deadline has passed; sessions seen recently enough
+        # to still be live are never visited. Filtering and owner lookup happen in
+        # the same pass, with the lookups bound to locals for large backlogs
+        heap = self._expiry_heap
+        heappop = heapq.heappop
+        last_seen_get = self._last_seen.get
+        session_keys = self._session_keys
+        session_users_get = self._session_users.get
+        timeout = self._timeout
+        due: Dict[str, str] = {}  # session_key -> user_id, in deadline order
+        while heap and heap[0][0] < current_time:
+            session_key = heappop(heap)[1]
+            if session_key in due or session_key not in session_keys:
+                continue
+            if current_time - last_seen_get(session_key, 0) > timeout:
+                user_id = session_users_get(session_key)
+                if user_id:
+                    due[session_key] = user_id
+        
+        candidates = list(due.items())
+        
+        if not candidates:
+            return
+        
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SESSION_CALLS)
+        
+        async def fetch(session_key: str, user_id: str):
+            app_name, session_id = self._split_session_key(session_key)
+            async with semaphore:
+                return await self._get_session(session_id, app_name, user_id)
+        
+        sessions = await asyncio.gather(
+            *(fetch(session_key, user_id) for session_key, user_id in candidates),
+            return_exceptions=True
+        )
+        
+        expired_sessions = []
+        for (session_key, user_id), session in zip(candidates, sessions):
+            if isinstance(session, Exception):
+                logger.error(f"Error checking session {session_key}: {session}")
                 continue
             
             try:
-                session = await self._session_service.get_session(
-                    session_id=session_id,
-                    app_name=app_name,
-                    user_id=user_id
-                )
-                
                 if session and hasattr(session, 'last_update_time'):
+                    self._note_last_seen(session_key, session)
                     age = current_time - session.last_update_time
                     if age > self._timeout:
                         # Check for pending tool calls before deletion (HITL scenarios)
                         pending_calls = session.state.get("pending_tool_calls", []) if session.state else []
                         if pending_calls:
-                            logger.info(f"Preserving expired session {session_key} - has {len(pending_calls)} pending tool calls (HITL)")
+                            logger.info("Preserving expired session %s - has %s pending tool calls (HITL)", session_key, len(pending_calls))
                         else:
-                            await self._delete_session(session)
-                            expired_count += 1
+                            expired_sessions.append(session)
                 elif not session:
                     # Session doesn't exist, just untrack it
                     self._untrack_session(session_key, user_id)
@@ -669,8 +1019,40 @@ class SessionManager:
             except Exception as e:
                 logger.error(f"Error checking session {session_key}: {e}")
         
+        if not expired_sessions:
+            self._requeue_survivors(candidates, current_time)
+            return
+        
+        async def delete(session):
+            async with semaphore:
+                await self._delete_session(session)
+        
+        results = await asyncio.gather(
+            *(delete(session) for session in expired_sessions),
+            return_exceptions=True
+        )
+        expired_count = 0
+        for session, result in zip(expired_sessions, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error deleting session {session.app_name}:{session.id}: {result}")
+            else:
+                expired_count += 1
+        
         if expired_count > 0:
-            logger.info(f"Cleaned up {expired_count} expired sessions")
+            logger.info("Cleaned up %s expired sessions", expired_count)
+        
+        self._requeue_survivors(candidates, current_time)
+    
+    def _requeue_survivors(self, candidates: List[Tuple[str, str]], current_time: float) -> None:
+        """Reschedule checked sessions that are still tracked.
+        
+        Sessions kept for pending tool calls, or whose fetch or delete failed,
+        are due again at the next cleanup.
+        """
+        for session_key, _ in candidates:
+            if session_key in self._session_keys:
+                deadline = self._last_seen.get(session_key, 0) + self._timeout
+                self._push_deadline(session_key, max(deadline, current_time))
     
     def get_session_count(self) -> int:
         """Get total number of tracked sessions."""
@@ -2,8 +2,9 @@
 
 """Conversion utilities between AG-UI and ADK formats."""
 
-from typing import List, Dict, Any, Optional
-import json
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, Tuple
+import copy
 import logging
 
 from ag_ui.core import (
@@ -13,82 +14,155 @@ from ag_ui.core import (
 from google.adk.events import Event as ADKEvent
 from google.genai import types
 
+from .serialization import json_dumps, json_loads
+
 logger = logging.getLogger(__name__)
 
+# JSON Patch operations that map onto a state delta entry
+_STATE_PATCH_OPS = frozenset(("add", "replace", "remove"))
+
+# Distinct tool-call argument strings whose parsed form is remembered
+_TOOL_ARGUMENTS_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_TOOL_ARGUMENTS_CACHE_SIZE)
+def _parse_cached_tool_arguments(arguments: str) -> Tuple[Any, bool]:
+    """Parse tool-call arguments once per distinct string.
+
+    Chat histories replay the same tool calls every turn, so results are
+    memoized. Returns the shared parsed value and whether it is safe to hand
+    out as-is: flat objects are, because FunctionCall copies the top-level dict
+    on validation; nested containers are not.
+    """
+    parsed = json_loads(arguments)
+    if isinstance(parsed, dict):
+        shareable = not any(isinstance(value, (dict, list)) for value in parsed.values())
+    else:
+        shareable = not isinstance(parsed, list)
+    return parsed, shareable
+
+
+def _parse_tool_arguments(arguments: Any) -> Any:
+    """Parse AG-UI tool-call arguments given as a JSON string; pass anything else through."""
+    if not isinstance(arguments, str):
+        return arguments
+    parsed, shareable = _parse_cached_tool_arguments(arguments)
+    return parsed if shareable else copy.deepcopy(parsed)
+
+
+def _user_content(message: Message) -> Optional[types.Content]:
+    """Build ADK content for a user or system message."""
+    flattened_content = flatten_message_content(message.content)
+    if not flattened_content:
+        return None
+    return types.Content(
+        role=message.role,
+        parts=[types.Part(text=flattened_content)]
+    )
+
+
+def _assistant_content(message: AssistantMessage) -> Optional[types.Content]:
+    """Build ADK content for an assistant message's text and tool calls."""
+    # Resolved once rather than per tool call
+    part_cls = types.Part
+    function_call_cls = types.FunctionCall
+    parts = []
+    append_part = parts.append
+
+    # Add text content if present
+    if message.content:
+        append_part(part_cls(text=flatten_message_content(message.content)))
+    
+    # Add tool calls if present
+    if message.tool_calls:
+        for tool_call in message.tool_calls:
+            append_part(part_cls(
+                function_call=function_call_cls(
+                    name=tool_call.function.name,
+                    args=_parse_tool_arguments(tool_call.function.arguments),
+                    id=tool_call.id
+                )
+            ))
+    
+    if not parts:
+        return None
+    return types.Content(
+        role="model",  # ADK uses "model" for assistant
+        parts=parts
+    )
+
+
+def _tool_content(message: ToolMessage) -> types.Content:
+    """Build ADK content for a tool message; tool messages become function responses."""
+    return types.Content(
+        role="function",
+        parts=[types.Part(
+            function_response=types.FunctionResponse(
+                name=message.tool_call_id, 
+                response={"result": message.content} if isinstance(message.content, str) else message.content,
+                id=message.tool_call_id
+            )
+        )]
+    )
+
+
+def _no_content(message: Message) -> None:
+    """Other message types carry no content ADK can use."""
+    return None
+
+
+# Message class -> builder of its ADK content, looked up by exact type;
+# subclasses are resolved through the MRO on first sight and cached here
+_CONTENT_BUILDERS: Dict[type, Callable[[Any], Optional[types.Content]]] = {
+    UserMessage: _user_content,
+    SystemMessage: _user_content,
+    AssistantMessage: _assistant_content,
+    ToolMessage: _tool_content,
+}
+
+
+def _resolve_content_builder(message_cls: type) -> Callable[[Any], Optional[types.Content]]:
+    """Find and cache the content builder for a message class not seen before."""
+    builder = _no_content
+    for base in message_cls.__mro__[1:]:
+        if base in _CONTENT_BUILDERS:
+            builder = _CONTENT_BUILDERS[base]
+            break
+    _CONTENT_BUILDERS[message_cls] = builder
+    return builder
+
+
+def _message_to_event(message: Message) -> Optional[ADKEvent]:
+    """Convert one AG-UI message to an ADK event, or None if its data is invalid."""
+    try:
+        # Convert content based on message type
+        message_cls = type(message)
+        builder = _CONTENT_BUILDERS.get(message_cls) or _resolve_content_builder(message_cls)
+        return ADKEvent(
+            id=message.id,
+            author=message.role,
+            content=builder(message)
+        )
+    except ValueError as e:
+        # Malformed tool-call JSON or content the ADK models reject; anything
+        # else is a bug and propagates to the caller
+        logger.error(f"Error converting message {message.id}: {e}")
+        return None
+
 
 def convert_ag_ui_messages_to_adk(messages: List[Message]) -> List[ADKEvent]:
     """Convert AG-UI messages to ADK events.
     
+    Messages with invalid data (such as malformed tool-call arguments) are
+    logged and skipped.
+    
     Args:
         messages: List of AG-UI messages
         
     Returns:
         List of ADK events
     """
-    adk_events = []
-    
-    for message in messages:
-        try:
-            # Create base event
-            event = ADKEvent(
-                id=message.id,
-                author=message.role,
-                content=None
-            )
-            
-            # Convert content based on message type
-            if isinstance(message, (UserMessage, SystemMessage)):
-                flattened_content = flatten_message_content(message.content)
-                if flattened_content:
-                    event.content = types.Content(
-                        role=message.role,
-                        parts=[types.Part(text=flattened_content)]
-                    )
-
-            elif isinstance(message, AssistantMessage):
-                parts = []
-
-                # Add text content if present
-                if message.content:
-                    parts.append(types.Part(text=flatten_message_content(message.content)))
-                
-                # Add tool calls if present
-                if message.tool_calls:
-                    for tool_call in message.tool_calls:
-                        parts.append(types.Part(
-                            function_call=types.FunctionCall(
-                                name=tool_call.function.name,
-                                args=json.loads(tool_call.function.arguments) if isinstance(tool_call.function.arguments, str) else tool_call.function.arguments,
-                                id=tool_call.id
-                            )
-                        ))
-                
-                if parts:
-                    event.content = types.Content(
-                        role="model",  # ADK uses "model" for assistant
-                        parts=parts
-                    )
-            
-            elif isinstance(message, ToolMessage):
-                # Tool messages become function responses
-                event.content = types.Content(
-                    role="function",
-                    parts=[types.Part(
-                        function_response=types.FunctionResponse(
-                            name=message.tool_call_id, 
-                            response={"result": message.content} if isinstance(message.content, str) else message.content,
-                            id=message.tool_call_id
-                        )
-                    )]
-                )
-            
-            adk_events.append(event)
-            
-        except Exception as e:
-            logger.error(f"Error converting message {message.id}: {e}")
-            continue
-    
-    return adk_events
+    return [event for event in map(_message_to_event, messages) if event is not None]
 
 
 def convert_adk_event_to_ag_ui_message(event: ADKEvent) -> Optional[Message]:
@@ -120,17 +194,22 @@ def convert_adk_event_to_ag_ui_message(event: ADKEvent) -> Optional[Message]:
             # Extract text and tool calls
             text_parts = []
             tool_calls = []
+            append_text = text_parts.append
+            append_tool_call = tool_calls.append
             
             for part in event.content.parts:
-                if part.text:
-                    text_parts.append(part.text)
-                elif part.function_call:
-                    tool_calls.append(ToolCall(
-                        id=getattr(part.function_call, 'id', event.id),
+                text = part.text
+                if text:
+                    append_text(text)
+                    continue
+                function_call = part.function_call
+                if function_call:
+                    append_tool_call(ToolCall(
+                        id=getattr(function_call, 'id', event.id),
                         type="function",
                         function=FunctionCall(
-                            name=part.function_call.name,
-                            arguments=json.dumps(part.function_call.args) if hasattr(part.function_call, 'args') else "{}"
+                            name=function_call.name,
+                            arguments=json_dumps(function_call.args) if hasattr(function_call, 'args') else "{}"
                         )
                     ))
             
@@ -138,15 +217,33 @@ def convert_adk_event_to_ag_ui_message(event: ADKEvent) -> Optional[Message]:
                 id=event.id,
                 role="assistant",
                 content="\n".join(text_parts) if text_parts else None,
-                tool_calls=tool_calls if tool_calls else None
+                tool_calls=tool_calls or None
             )
         
-    except Exception as e:
+    except (TypeError, ValueError) as e:
+        # Unserializable function-call args or values the AG-UI models reject
         logger.error(f"Error converting ADK event {event.id}: {e}")
     
     return None
 
 
+def state_key_to_json_pointer(key: Any) -> str:
+    """Build the JSON Pointer (RFC 6901) for a top-level state key."""
+    key = str(key)
+    if "~" in key or "/" in key:
+        key = key.replace("~", "~0").replace("/", "~1")
+    return f"/{key}"
+
+
+def json_pointer_to_state_key(path: str) -> str:
+    """Recover the top-level state key from a JSON Pointer (RFC 6901)."""
+    if path.startswith("/"):
+        path = path[1:]
+    if "~" in path:
+        path = path.replace("~1", "/").replace("~0", "~")
+    return path
+
+
 def convert_state_to_json_patch(state_delta: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Convert a state delta to JSON Patch format (RFC 6902).
     
@@ -156,26 +253,12 @@ def convert_state_to_json_patch(state_delta: Dict[str, Any]) -> List[Dict[str, A
     Returns:
         List of JSON Patch operations
     """
-    patches = []
-    
-    for key, value in state_delta.items():
-        # Determine operation type
-        if value is None:
-            # Remove operation
-            patches.append({
-                "op": "remove",
-                "path": f"/{key}"
-            })
-        else:
-            # Add/replace operation
-            # We use "replace" as it works for both existing and new keys
-            patches.append({
-                "op": "replace",
-                "path": f"/{key}",
-                "value": value
-            })
-    
-    return patches
+    # "replace" is used for every non-None value as it works for both existing and new keys
+    return [
+        {"op": "remove", "path": state_key_to_json_pointer(key)} if value is None
+        else {"op": "replace", "path": state_key_to_json_pointer(key), "value": value}
+        for key, value in state_delta.items()
+    ]
 
 
 def convert_json_patch_to_state(patches: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -191,16 +274,12 @@ def convert_json_patch_to_state(patches: List[Dict[str, Any]]) -> Dict[str, Any]
     
     for patch in patches:
         op = patch.get("op")
-        path = patch.get("path", "")
-        
-        # Extract key from path (remove leading slash)
-        key = path.lstrip("/")
-        
-        if op == "remove":
-            state_delta[key] = None
-        elif op in ["add", "replace"]:
-            state_delta[key] = patch.get("value")
         # Ignore other operations for now (copy, move, test)
+        if op not in _STATE_PATCH_OPS:
+            continue
+        
+        key = json_pointer_to_state_key(patch.get("path", ""))
+        state_delta[key] = None if op == "remove" else patch.get("value")
     
     return state_delta
 
@@ -219,15 +298,19 @@ def extract_text_from_content(content: types.Content) -> str:
 
 
 def flatten_message_content(content: Any) -> str:
-    if content is None:
-        return ""
+    """Flatten AG-UI message content to plain text.
 
+    Strings, the common case, are returned unchanged. For multimodal lists
+    only the text parts are kept, joined by newlines.
+    """
     if isinstance(content, str):
         return content
 
+    if content is None:
+        return ""
+
     if isinstance(content, list):
-        text_parts = [part.text for part in content if isinstance(part, TextInputContent) and part.text]
-        return "\n".join(text_parts)
+        return "\n".join([part.text for part in content if isinstance(part, TextInputContent) and part.text])
 
     return str(content)
 
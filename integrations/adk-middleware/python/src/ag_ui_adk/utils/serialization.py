@@ -0,0 +1,59 @@
+# src/utils/serialization.py
+
+"""JSON helpers that serialize with orjson when it is installed, falling back to the stdlib.
+
+orjson is optional (the ``fast`` extra). Both paths produce the same output:
+compact separators with non-ASCII characters left unescaped. Parsing always
+uses the stdlib, since orjson turns integers wider than 64 bits into floats
+and rejects ``NaN``/``Infinity``.
+"""
+
+from typing import Any
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads = json.loads
+
+
+def _numpy_default(obj: Any) -> Any:
+    """Convert numpy arrays and scalars to plain Python values for serialization.
+
+    Checked by module name so numpy never has to be imported here.
+    """
+    if type(obj).__module__.partition(".")[0] == "numpy":
+        if hasattr(obj, "tolist"):
+            return obj.tolist()  # arrays, and scalars (which return a Python scalar)
+        if hasattr(obj, "item"):
+            return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    """Serialize with the stdlib in the same format orjson produces."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_numpy_default)
+
+
+if orjson is not None:
+    _orjson_dumps = orjson.dumps
+    # Tool arguments built by Python tools may carry numpy scalars and arrays
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string.
+
+        numpy values are serialized natively. Values orjson rejects
+        (non-string keys, integers wider than 64 bits) are serialized with
+        the stdlib instead.
+        """
+        try:
+            return _orjson_dumps(obj, default=_numpy_default, option=_ORJSON_OPTIONS).decode()
+        except TypeError:  # orjson.JSONEncodeError is a TypeError
+            return _stdlib_dumps(obj)
+else:
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string; numpy values become lists and scalars."""
+        return _stdlib_dumps(obj)
@@ -12,7 +12,7 @@ from ag_ui_adk import ADKAgent, SessionManager
 from ag_ui_adk.event_translator import EventTranslator
 from ag_ui.core import (
     RunAgentInput, EventType, UserMessage, Context,
-    RunStartedEvent, RunFinishedEvent, TextMessageChunkEvent, SystemMessage,
+    RunStartedEvent, RunFinishedEvent, TextMessageChunkEvent, SystemMessage, Tool,
     TextMessageContentEvent
 )
 from google.adk.agents import Agent
@@ -166,6 +166,55 @@ class TestADKAgent:
             assert any(event.type == EventType.RUN_ERROR for event in events)
             mock_runner.close.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_runner_cached_for_base_agent_only(self, adk_agent, mock_agent):
+        """Runners for the base agent are reused; modified agent copies are not cached."""
+        with patch('ag_ui_adk.adk_agent.Runner') as mock_runner_cls:
+            mock_runner_cls.side_effect = lambda **kwargs: AsyncMock()
+
+            first = adk_agent._create_runner(mock_agent, "test_user", "test_app")
+            second = adk_agent._create_runner(mock_agent, "other_user", "test_app")
+            other_app = adk_agent._create_runner(mock_agent, "test_user", "other_app")
+            copy_runner = adk_agent._create_runner(Mock(spec=Agent), "test_user", "test_app")
+
+            assert first is second
+            assert other_app is not first
+            assert copy_runner is not first
+            assert len(adk_agent._runner_cache) == 2
+
+            await adk_agent.close()
+
+        first.close.assert_awaited_once()
+        other_app.close.assert_awaited_once()
+        assert adk_agent._runner_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_runner_cache_evicts_least_recently_used(self, adk_agent, mock_agent):
+        """Evicted runners are closed, but only once no run is using them."""
+        with patch('ag_ui_adk.adk_agent.Runner') as mock_runner_cls, \
+             patch('ag_ui_adk.adk_agent._RUNNER_CACHE_SIZE', 1):
+            mock_runner_cls.side_effect = lambda **kwargs: AsyncMock()
+
+            idle = adk_agent._create_runner(mock_agent, "test_user", "app_a")
+            await adk_agent._release_runner(idle, "app_a")
+            idle.close.assert_not_awaited()
+
+            busy = adk_agent._create_runner(mock_agent, "test_user", "app_b")
+            await adk_agent._close_evicted_runners()
+            idle.close.assert_awaited_once()
+
+            # Evicting a runner mid-run defers closing it to the run's release
+            latest = adk_agent._create_runner(mock_agent, "test_user", "app_c")
+            assert adk_agent._evicted_runners == []
+            busy.close.assert_not_awaited()
+            await adk_agent._release_runner(busy, "app_b")
+            busy.close.assert_awaited_once()
+
+            assert list(adk_agent._runner_cache) == ["app_c"]
+            await adk_agent.close()
+
+        latest.close.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_turn_complete_falls_back_to_streaming_translator(
         self,
@@ -280,6 +329,49 @@ class TestADKAgent:
         assert translate_calls == 1
         assert lro_calls == 0
 
+    @pytest.mark.asyncio
+    async def test_event_translator_is_reset_and_reused(self, adk_agent, sample_input):
+        """Ensure background runs reuse a pooled, reset event translator."""
+
+        translators = []
+
+        async def fake_translate(self, adk_event, thread_id, run_id):
+            translators.append(self)
+            self._last_streamed_text = "hello"
+            yield TextMessageChunkEvent(
+                type=EventType.TEXT_MESSAGE_CHUNK,
+                message_id=adk_event.id,
+                delta="chunk"
+            )
+
+        adk_event = SimpleNamespace(
+            id="event-chunk",
+            content=SimpleNamespace(parts=[SimpleNamespace(text="hello")]),
+            partial=True,
+            long_running_tool_ids=[],
+            is_final_response=lambda: False
+        )
+
+        class FakeRunner:
+            async def run_async(self, *args, **kwargs):
+                yield adk_event
+
+        with patch("ag_ui_adk.adk_agent.EventTranslator.translate", new=fake_translate), \
+             patch.object(adk_agent, "_create_runner", return_value=FakeRunner()):
+            for _ in range(2):
+                await adk_agent._run_adk_in_background(
+                    input=sample_input,
+                    adk_agent=adk_agent._adk_agent,
+                    user_id="test_user",
+                    app_name="test_app",
+                    event_queue=asyncio.Queue(),
+                )
+
+        assert len(translators) == 2
+        assert translators[0] is translators[1]
+        assert translators[0]._last_streamed_text is None
+        assert list(adk_agent._translator_pool) == [translators[0]]
+
     @pytest.mark.asyncio
     async def test_streaming_finish_reason_fallback(self, adk_agent, sample_input):
         """Ensure streaming translator handles final responses missing finish_reason."""
@@ -319,7 +411,10 @@ class TestADKAgent:
         lro_event.get_function_calls = Mock(return_value=[])
         lro_event.get_function_responses = Mock(return_value=[])
 
-        events_to_yield = [streaming_event, lro_event]
+        # Anything after the long-running call must not be processed
+        trailing_event = SimpleNamespace(**{**vars(streaming_event), "id": "event-after-lro"})
+
+        events_to_yield = [streaming_event, lro_event, trailing_event]
 
         class DummyRunner:
             async def run_async(self, *args, **kwargs):
@@ -362,7 +457,7 @@ class TestADKAgent:
             async for event in adk_agent.run(sample_input):
                 emitted_events.append(event)
 
-        # Assert streaming translator was used for the first event
+        # Assert streaming translator was used for the first event only
         assert translate_spy.call_count == 1
         assert translate_spy.adk_events[0] is streaming_event
 
@@ -419,6 +514,178 @@ class TestADKAgent:
         assert len(events[1].message) > 0
         assert events[1].code == 'BACKGROUND_EXECUTION_ERROR'
 
+    @pytest.mark.asyncio
+    async def test_stream_events_ends_when_task_finishes_without_sentinel(self, adk_agent):
+        """Test that streaming stops once the task is done even without a None sentinel."""
+        from ag_ui_adk.execution_state import ExecutionState
+
+        event_queue = asyncio.Queue()
+        event = TextMessageContentEvent(
+            type=EventType.TEXT_MESSAGE_CONTENT, message_id="msg", delta="hi"
+        )
+
+        async def producer():
+            await event_queue.put(event)
+
+        execution = ExecutionState(
+            task=asyncio.create_task(producer()),
+            thread_id="test_thread",
+            event_queue=event_queue
+        )
+
+        events = [e async for e in adk_agent._stream_events(execution)]
+
+        assert events == [event]
+        assert execution.is_complete
+
+    @pytest.mark.asyncio
+    async def test_stream_events_times_out(self, adk_agent):
+        """Test that a stalled execution yields a timeout error."""
+        from ag_ui_adk.execution_state import ExecutionState
+
+        adk_agent._execution_timeout = 0.05
+        task = asyncio.create_task(asyncio.sleep(10))
+        execution = ExecutionState(
+            task=task,
+            thread_id="test_thread",
+            event_queue=asyncio.Queue()
+        )
+
+        try:
+            events = [e async for e in adk_agent._stream_events(execution)]
+        finally:
+            task.cancel()
+
+        assert len(events) == 1
+        assert events[0].type == EventType.RUN_ERROR
+        assert events[0].code == "EXECUTION_TIMEOUT"
+
+    @pytest.mark.asyncio
+    async def test_extractors_called_once_per_run(self, sample_input):
+        """App and user extractors are resolved once and threaded through the run."""
+        agent = Mock(spec=Agent)
+        agent.name = "extractor_agent"
+        app_extractor = Mock(return_value="extracted_app")
+        user_extractor = Mock(return_value="extracted_user")
+        adk_agent = ADKAgent(
+            adk_agent=agent,
+            app_name_extractor=app_extractor,
+            user_id_extractor=user_extractor,
+            use_in_memory_services=True
+        )
+
+        run_kwargs = {}
+
+        async def mock_run(**kwargs):
+            run_kwargs.update(kwargs)
+            kwargs["event_queue"].put_nowait(None)
+
+        with patch.object(adk_agent, "_run_adk_in_background", side_effect=mock_run):
+            events = [e async for e in adk_agent.run(sample_input)]
+
+        assert events[-1].type == EventType.RUN_FINISHED
+        assert run_kwargs["app_name"] == "extracted_app"
+        assert run_kwargs["user_id"] == "extracted_user"
+        app_extractor.assert_called_once()
+        user_extractor.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_events_drains_queued_events_without_waiting(self, adk_agent):
+        """Test that already-queued events are drained after a single awaited get."""
+        from ag_ui_adk.execution_state import ExecutionState
+
+        event_queue = asyncio.Queue()
+        queued = [
+            TextMessageContentEvent(message_id="m1", delta=str(i))
+            for i in range(3)
+        ]
+        for event in queued:
+            event_queue.put_nowait(event)
+        event_queue.put_nowait(None)
+
+        task = asyncio.create_task(asyncio.sleep(10))
+        execution = ExecutionState(task=task, thread_id="test_thread", event_queue=event_queue)
+
+        try:
+            with patch.object(event_queue, "get", wraps=event_queue.get) as mock_get:
+                events = [e async for e in adk_agent._stream_events(execution)]
+        finally:
+            task.cancel()
+
+        assert events == queued
+        assert mock_get.call_count == 1
+        assert execution.is_complete is True
+
+    @pytest.mark.asyncio
+    async def test_finished_execution_state_is_reused(self, adk_agent, sample_input):
+        """Test that released execution states are pooled and handed out again."""
+        async def mock_run(**kwargs):
+            await kwargs["event_queue"].put(None)
+
+        with patch.object(adk_agent, "_run_adk_in_background", side_effect=mock_run):
+            first = await adk_agent._start_background_execution(sample_input)
+            events = [e async for e in adk_agent._stream_events(first)]
+            assert events == []
+
+            adk_agent._release_execution(first)
+            assert adk_agent._execution_pool == [first]
+
+            second = await adk_agent._start_background_execution(sample_input)
+            await second.task
+
+        assert second is first
+        assert adk_agent._execution_pool == []
+        assert second.thread_id == sample_input.thread_id
+        assert second.is_complete is False
+
+    @pytest.mark.asyncio
+    async def test_convert_latest_message_uses_known_user_message(self, adk_agent, sample_input):
+        """Test that a caller-supplied latest user message skips the message scan."""
+        latest = UserMessage(id="msg2", role="user", content="Latest question")
+
+        content = await adk_agent._convert_latest_message(
+            sample_input, [], latest_user_message=latest
+        )
+
+        assert content.role == "user"
+        assert content.parts[0].text == "Latest question"
+
+    def test_session_lookup_cache_is_bounded_and_evicted_on_expire(self, adk_agent):
+        """Test LRU eviction of session metadata and cleanup on session expiry."""
+        adk_agent._session_lookup_cache_size = 2
+        adk_agent._cache_session_metadata("s1", "app", "u1")
+        adk_agent._cache_session_metadata("s2", "app", "u2")
+
+        # Touch s1 so s2 becomes the least recently used entry
+        assert adk_agent._get_session_metadata("s1")["user_id"] == "u1"
+        adk_agent._cache_session_metadata("s3", "app", "u3")
+        assert list(adk_agent._session_lookup_cache) == ["s1", "s3"]
+
+        adk_agent._session_manager._untrack_session("app:s1", "u1")
+        assert list(adk_agent._session_lookup_cache) == ["s3"]
+
+    def test_session_metadata_flyweights_are_bounded(self, adk_agent):
+        """Test that shared metadata mappings do not grow past the cache size."""
+        adk_agent._session_lookup_cache_size = 2
+        for i in range(5):
+            adk_agent._cache_session_metadata(f"s{i}", "app", f"u{i}")
+
+        assert len(adk_agent._metadata_flyweights) <= 2
+        assert list(adk_agent._session_lookup_cache) == ["s3", "s4"]
+        assert adk_agent._get_session_metadata("s4")["user_id"] == "u4"
+
+    def test_session_metadata_is_shared_per_app_and_user(self, adk_agent):
+        """Test that sessions with the same owner share one read-only metadata mapping."""
+        first = adk_agent._cache_session_metadata("s1", "app", "user")
+        second = adk_agent._cache_session_metadata("s2", "app", "user")
+        other = adk_agent._cache_session_metadata("s3", "app", "other_user")
+
+        assert first is second
+        assert other is not first
+        assert dict(first) == {"app_name": "app", "user_id": "user"}
+        with pytest.raises(TypeError):
+            first["user_id"] = "someone_else"
+
     @pytest.mark.asyncio
     async def test_cleanup(self, adk_agent):
         """Test cleanup method."""
@@ -426,8 +693,7 @@ class TestADKAgent:
         mock_execution = Mock()
         mock_execution.cancel = AsyncMock()
 
-        async with adk_agent._execution_lock:
-            adk_agent._active_executions["test_thread"] = mock_execution
+        adk_agent._active_executions["test_thread"] = mock_execution
 
         await adk_agent.close()
 
@@ -732,3 +998,115 @@ class TestADKAgent:
         assert captured_agent.instruction == "You are a math tutor."
 
 
+
+    @pytest.mark.asyncio
+    async def test_system_message_agent_copy_is_cached(self):
+        """Test that repeated SystemMessages reuse one modified agent copy."""
+        mock_agent = Agent(name="test_agent", instruction="You are a helpful assistant.")
+
+        adk_agent = ADKAgent(adk_agent=mock_agent, app_name="test_app", user_id="test_user")
+
+        def make_input(content):
+            return RunAgentInput(
+                thread_id="test_thread",
+                run_id="test_run",
+                messages=[
+                    SystemMessage(id="sys_1", role="system", content=content),
+                    UserMessage(id="msg_1", role="user", content="Hello")
+                ],
+                context=[],
+                state={},
+                tools=[],
+                forwarded_props={}
+            )
+
+        captured_agents = []
+
+        async def mock_run_background(input, adk_agent, user_id, app_name, event_queue):
+            captured_agents.append(adk_agent)
+            await event_queue.put(None)
+
+        with patch.object(adk_agent, '_run_adk_in_background', side_effect=mock_run_background):
+            for content in ("Be concise.", "Be concise.", "Be verbose."):
+                await adk_agent._start_background_execution(make_input(content))
+                await asyncio.sleep(0.01)
+
+        assert captured_agents[0] is captured_agents[1]
+        assert captured_agents[2] is not captured_agents[0]
+        assert captured_agents[2].instruction == "You are a helpful assistant.\n\nBe verbose."
+        assert mock_agent.instruction == "You are a helpful assistant."
+        assert len(adk_agent._agent_copy_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_frontend_tools_shadowed_by_backend_tools_are_dropped(self):
+        """Test that input tools named like backend tools or transfer_to_agent are not proxied."""
+        def get_weather(city: str) -> str:
+            """Return the weather for a city."""
+            return "sunny"
+
+        mock_agent = Agent(name="test_agent", tools=[get_weather])
+        adk_agent = ADKAgent(adk_agent=mock_agent, app_name="test_app", user_id="test_user")
+
+        tool_input = RunAgentInput(
+            thread_id="test_thread",
+            run_id="test_run",
+            messages=[UserMessage(id="msg_1", role="user", content="Hello")],
+            context=[],
+            state={},
+            tools=[
+                Tool(name=name, description=name, parameters={"type": "object", "properties": {}})
+                for name in ("get_weather", "transfer_to_agent", "show_chart")
+            ],
+            forwarded_props={}
+        )
+
+        captured_agent = None
+
+        async def mock_run_background(input, adk_agent, user_id, app_name, event_queue):
+            nonlocal captured_agent
+            captured_agent = adk_agent
+            await event_queue.put(None)
+
+        with patch.object(adk_agent, '_run_adk_in_background', side_effect=mock_run_background):
+            await adk_agent._start_background_execution(tool_input)
+            await asyncio.sleep(0.01)
+
+        assert captured_agent.tools[0] is get_weather
+        toolset = captured_agent.tools[-1]
+        assert [tool.name for tool in toolset.ag_ui_tools] == ["show_chart"]
+
+    @pytest.mark.asyncio
+    async def test_instruction_provider_wrapper_is_reused(self):
+        """Test that the same provider and SystemMessage reuse one instruction wrapper."""
+        def instruction_provider(context) -> str:
+            return "You are a helpful assistant."
+
+        mock_agent = Agent(name="test_agent", instruction=instruction_provider)
+        adk_agent = ADKAgent(adk_agent=mock_agent, app_name="test_app", user_id="test_user")
+
+        system_input = RunAgentInput(
+            thread_id="test_thread",
+            run_id="test_run",
+            messages=[
+                SystemMessage(id="sys_1", role="system", content="Be concise."),
+                UserMessage(id="msg_1", role="user", content="Hello")
+            ],
+            context=[],
+            state={},
+            tools=[],
+            forwarded_props={}
+        )
+
+        instructions = []
+
+        async def mock_run_background(input, adk_agent, user_id, app_name, event_queue):
+            instructions.append(adk_agent.instruction)
+            await event_queue.put(None)
+
+        with patch.object(adk_agent, '_run_adk_in_background', side_effect=mock_run_background):
+            for _ in range(2):
+                await adk_agent._start_background_execution(system_input)
+                await asyncio.sleep(0.01)
+
+        assert instructions[0] is instructions[1]
+        assert instructions[0]({}) == "You are a helpful assistant.\n\nBe concise."
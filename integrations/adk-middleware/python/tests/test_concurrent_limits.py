@@ -229,6 +229,64 @@ class TestConcurrentLimits:
         assert len(error_events) >= 1
         assert "Maximum concurrent executions (0) reached" in error_events[0].message
 
+    @pytest.mark.asyncio
+    async def test_rejected_execution_creates_no_background_task(self, adk_middleware):
+        """Test that requests over the limit never spawn a background task."""
+        for thread_id in ("thread_1", "thread_2"):
+            execution = MagicMock()
+            execution.is_stale.return_value = False
+            adk_middleware._active_executions[thread_id] = execution
+
+        input_data = RunAgentInput(
+            thread_id="thread_3", run_id="run_3",
+            messages=[UserMessage(id="3", role="user", content="Third")],
+            tools=[], context=[], state={}, forwarded_props={}
+        )
+
+        with patch.object(adk_middleware, '_start_background_execution', new_callable=AsyncMock) as start_mock, \
+             patch('asyncio.create_task', wraps=asyncio.create_task) as create_task_mock:
+            events = [event async for event in adk_middleware._start_new_execution(input_data)]
+
+        assert isinstance(events[-1], RunErrorEvent)
+        start_mock.assert_not_awaited()
+        create_task_mock.assert_not_called()
+        assert len(adk_middleware._active_executions) == 2
+
+    @pytest.mark.asyncio
+    async def test_background_sweep_cleans_stale_executions(self, adk_middleware):
+        """Test that the periodic sweep frees stale slots without a limit miss."""
+        stale_execution = MagicMock()
+        stale_execution.is_stale.return_value = True
+        stale_execution.cancel = AsyncMock()
+        adk_middleware._active_executions["stale_thread"] = stale_execution
+
+        # First sleep returns immediately, the second stops the loop
+        with patch('asyncio.sleep', AsyncMock(side_effect=[None, asyncio.CancelledError()])):
+            await adk_middleware._sweep_loop()
+
+        assert "stale_thread" not in adk_middleware._active_executions
+        stale_execution.cancel.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sweep_task_started_once_and_stopped_on_close(self, adk_middleware, sample_input):
+        """Test that the sweep starts with the first execution and stops on close."""
+        async def mock_run_adk_in_background(*args, **kwargs):
+            await kwargs['event_queue'].put(None)
+
+        with patch.object(adk_middleware, '_run_adk_in_background', side_effect=mock_run_adk_in_background):
+            async for _ in adk_middleware._start_new_execution(sample_input):
+                pass
+            sweep_task = adk_middleware._sweep_task
+            async for _ in adk_middleware._start_new_execution(sample_input):
+                pass
+
+        assert sweep_task is not None
+        assert adk_middleware._sweep_task is sweep_task
+
+        await adk_middleware.close()
+        assert sweep_task.done()
+        assert adk_middleware._sweep_task is None
+
     @pytest.mark.asyncio
     async def test_execution_completion_frees_slot(self, adk_middleware):
         """Test that completing an execution frees up a slot."""
@@ -279,11 +337,10 @@ class TestConcurrentLimits:
         )
 
         # Manually trigger the cleanup logic from the finally block
-        async with adk_middleware._execution_lock:
-            if input_data.thread_id in adk_middleware._active_executions:
-                execution = adk_middleware._active_executions[input_data.thread_id]
-                if execution.is_complete and not execution.has_pending_tools():
-                    del adk_middleware._active_executions[input_data.thread_id]
+        if input_data.thread_id in adk_middleware._active_executions:
+            execution = adk_middleware._active_executions[input_data.thread_id]
+            if execution.is_complete and not execution.has_pending_tools():
+                del adk_middleware._active_executions[input_data.thread_id]
 
         # Should still be in active executions
         assert "thread_1" in adk_middleware._active_executions
@@ -359,4 +416,25 @@ class TestConcurrentLimits:
 
             # Old stale executions should be gone
             assert "stale_0" not in adk_middleware._active_executions
-            assert "stale_1" not in adk_middleware._active_executions
\ No newline at end of file
+            assert "stale_1" not in adk_middleware._active_executions
+
+    @pytest.mark.asyncio
+    async def test_cleanup_keeps_execution_that_replaced_this_run(self, adk_middleware, sample_input):
+        """Test that a finishing run never unregisters a newer execution for its thread."""
+        newer_execution = MagicMock()
+
+        async def mock_run_adk_in_background(*args, **kwargs):
+            await kwargs['event_queue'].put(None)
+
+        async def has_pending_while_replaced(thread_id):
+            # A new run for the same thread registers itself while we await
+            adk_middleware._active_executions[thread_id] = newer_execution
+            return False
+
+        with patch.object(adk_middleware, '_run_adk_in_background', side_effect=mock_run_adk_in_background), \
+             patch.object(adk_middleware, '_has_pending_tool_calls', side_effect=has_pending_while_replaced):
+            async for _ in adk_middleware._start_new_execution(sample_input):
+                pass
+
+        assert adk_middleware._active_executions[sample_input.thread_id] is newer_execution
+        assert adk_middleware._execution_pool == []
@@ -179,6 +179,33 @@ class TestEventTranslatorComprehensive:
         assert content["result"]["structuredContent"] is None
         assert [item["text"] for item in content["result"]["content"]] == repeated_text_entries
 
+    @pytest.mark.asyncio
+    async def test_translate_function_response_with_shared_and_cyclic_values(self, translator):
+        """Shared values are serialized each time; cycles are broken with str()."""
+
+        @dataclass
+        class Node:
+            name: str
+            children: list
+
+        shared = Node(name="shared", children=[])
+        cyclic = [1]
+        cyclic.append(cyclic)
+
+        function_response = SimpleNamespace(
+            id="tool-cyclic-1",
+            response={"left": shared, "right": shared, "cycle": cyclic},
+        )
+
+        events = []
+        async for event in translator._translate_function_response([function_response]):
+            events.append(event)
+
+        content = json.loads(events[0].content)
+        assert content["left"] == {"name": "shared", "children": []}
+        assert content["right"] == content["left"]
+        assert content["cycle"] == [1, "[1, [...]]"]
+
     @pytest.mark.asyncio
     async def test_translate_state_delta_event(self, translator, mock_adk_event):
         """Test state delta event creation."""
@@ -593,11 +620,7 @@ class TestEventTranslatorComprehensive:
         mock_function_call.args = {"param1": "value1"}
         mock_function_call.id = "call_123"
 
-        events = []
-        async for event in translator._translate_function_calls(
-             [mock_function_call]
-        ):
-            events.append(event)
+        events = translator._translate_function_calls([mock_function_call])
 
         assert len(events) == 3  # START, ARGS, END
         assert isinstance(events[0], ToolCallStartEvent)
@@ -608,9 +631,28 @@ class TestEventTranslatorComprehensive:
         assert events[0].tool_call_id == "call_123"
         assert events[0].tool_call_name == "test_function"
         assert events[1].tool_call_id == "call_123"
-        assert events[1].delta == '{"param1": "value1"}'
+        assert events[1].delta == '{"param1":"value1"}'
         assert events[2].tool_call_id == "call_123"
 
+    @pytest.mark.asyncio
+    async def test_translate_function_calls_args_match_history_conversion(self, translator):
+        """Test that live tool call args serialize the same as converted history."""
+        from google.genai import types
+        from ag_ui_adk.utils.converters import convert_adk_event_to_ag_ui_message
+
+        function_call = types.FunctionCall(id="call_1", name="test_function", args={"a": 1, "s": "é"})
+        events = translator._translate_function_calls([function_call])
+
+        history_event = ADKEvent(
+            id="evt_1",
+            author="model",
+            content=types.Content(role="model", parts=[types.Part(function_call=function_call)])
+        )
+        message = convert_adk_event_to_ag_ui_message(history_event)
+
+        assert events[1].delta == '{"a":1,"s":"é"}'
+        assert events[1].delta == message.tool_calls[0].function.arguments
+
     @pytest.mark.asyncio
     async def test_translate_function_calls_no_id(self, translator, mock_adk_event):
         """Test function call translation without ID."""
@@ -620,19 +662,26 @@ class TestEventTranslatorComprehensive:
         # No id attribute
         delattr(mock_function_call, 'id')
 
-        with patch('uuid.uuid4') as mock_uuid:
-            mock_uuid.return_value = "generated_id"
+        events = translator._translate_function_calls([mock_function_call])
 
-            events = []
-            async for event in translator._translate_function_calls(
-                 [mock_function_call]
-            ):
-                events.append(event)
+        assert len(events) == 3
+        generated_id = events[0].tool_call_id
+        assert generated_id.startswith(f"{translator._id_prefix}-")
+        assert events[1].tool_call_id == generated_id
+        assert events[2].tool_call_id == generated_id
+
+    @pytest.mark.asyncio
+    async def test_translate_function_calls_real_call_without_id(self, translator):
+        """Test that a FunctionCall whose id is None gets a generated ID."""
+        from google.genai import types
+
+        events = translator._translate_function_calls([types.FunctionCall(name="t", args={"a": 1})])
 
         assert len(events) == 3
-        assert events[0].tool_call_id == "generated_id"
-        assert events[1].tool_call_id == "generated_id"
-        assert events[2].tool_call_id == "generated_id"
+        generated_id = events[0].tool_call_id
+        assert generated_id.startswith(f"{translator._id_prefix}-")
+        assert events[1].tool_call_id == generated_id
+        assert events[2].tool_call_id == generated_id
 
     @pytest.mark.asyncio
     async def test_translate_function_calls_no_args(self, translator, mock_adk_event):
@@ -643,11 +692,7 @@ class TestEventTranslatorComprehensive:
         # No args attribute
         delattr(mock_function_call, 'args')
 
-        events = []
-        async for event in translator._translate_function_calls(
-            [mock_function_call]
-        ):
-            events.append(event)
+        events = translator._translate_function_calls([mock_function_call])
 
         assert len(events) == 2  # START, END (no ARGS)
         assert isinstance(events[0], ToolCallStartEvent)
@@ -661,11 +706,7 @@ class TestEventTranslatorComprehensive:
         mock_function_call.args = "string_args"
         mock_function_call.id = "call_123"
 
-        events = []
-        async for event in translator._translate_function_calls(
-             [mock_function_call]
-        ):
-            events.append(event)
+        events = translator._translate_function_calls([mock_function_call])
 
         assert len(events) == 3
         assert events[1].delta == "string_args"
@@ -683,11 +724,7 @@ class TestEventTranslatorComprehensive:
         mock_function_call2.args = {"param2": "value2"}
         mock_function_call2.id = "call_2"
 
-        events = []
-        async for event in translator._translate_function_calls(
-             [mock_function_call1, mock_function_call2]
-        ):
-            events.append(event)
+        events = translator._translate_function_calls([mock_function_call1, mock_function_call2])
 
         assert len(events) == 6  # 3 events per function call
 
@@ -812,6 +849,15 @@ class TestEventTranslatorComprehensive:
         assert "/key.with.dots" in paths
         assert "/key with spaces" in paths
 
+    def test_create_state_delta_event_escapes_json_pointer_characters(self, translator):
+        """Test '~' and '/' in keys are escaped per RFC 6901."""
+        state_delta = {"a/b": 1, "c~d": 2, "~/": 3}
+
+        event = translator._create_state_delta_event(state_delta, "thread_1", "run_1")
+
+        paths = [patch["path"] for patch in event.delta]
+        assert paths == ["/a~1b", "/c~0d", "/~0~1"]
+
     @pytest.mark.asyncio
     async def test_force_close_streaming_message_with_open_stream(self, translator):
         """Test force closing an open streaming message."""
@@ -861,6 +907,17 @@ class TestEventTranslatorComprehensive:
         assert translator._streaming_message_id is None
         assert translator._active_tool_calls == {}
 
+    def test_generated_ids_unique_across_reset(self, translator):
+        """Test generated IDs stay unique within a run and after a reset."""
+        first_run = [translator._next_id() for _ in range(3)]
+        assert len(set(first_run)) == 3
+
+        translator.reset()
+
+        second_run = [translator._next_id() for _ in range(3)]
+        assert len(set(second_run)) == 3
+        assert not set(first_run) & set(second_run)
+
     @pytest.mark.asyncio
     async def test_streaming_state_management(self, translator, mock_adk_event_with_content):
         """Test streaming state management across multiple events."""
@@ -968,11 +1025,7 @@ class TestEventTranslatorComprehensive:
         # Before translation
         assert len(translator._active_tool_calls) == 0
 
-        events = []
-        async for event in translator._translate_function_calls(
-             [mock_function_call]
-        ):
-            events.append(event)
+        events = translator._translate_function_calls([mock_function_call])
 
         # After translation, should be cleaned up
         assert len(translator._active_tool_calls) == 0
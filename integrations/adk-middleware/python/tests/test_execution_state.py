@@ -6,7 +6,7 @@ import asyncio
 import time
 from unittest.mock import MagicMock
 
-from ag_ui_adk.execution_state import ExecutionState
+from ag_ui_adk.execution_state import ExecutionState, EventQueue
 
 
 class TestExecutionState:
@@ -130,4 +130,62 @@ class TestExecutionState:
         time.sleep(0.01)  # Small delay
         time2 = execution_state.get_execution_time()
 
-        assert time2 > time1
\ No newline at end of file
+        assert time2 > time1
+
+    def test_reset_and_reuse(self, mock_task):
+        """Test that a reset state drains its queue and can be rebound."""
+        queue = EventQueue()
+        queue.put_nowait("stale_event")
+        queue.put_nowait(None)
+        execution_state = ExecutionState(task=mock_task, thread_id="old_thread", event_queue=queue)
+        execution_state.is_complete = True
+        execution_state.add_pending_tool_call("call_1")
+
+        execution_state.reset()
+
+        assert execution_state.task is None
+        assert execution_state.thread_id is None
+        assert execution_state.is_complete is False
+        assert execution_state.has_pending_tool_calls() is False
+        assert queue.empty()
+        assert execution_state.get_status() == "idle"
+        assert "status='idle'" in repr(execution_state)
+
+        new_task = MagicMock()
+        execution_state.reuse(task=new_task, thread_id="new_thread")
+
+        assert execution_state.task is new_task
+        assert execution_state.thread_id == "new_thread"
+        assert execution_state.event_queue is queue
+        assert execution_state.get_execution_time() < 1
+
+
+class TestEventQueue:
+    """Test cases for EventQueue class."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_returned_in_order(self):
+        """Test that queued events come back FIFO and empty raises QueueEmpty."""
+        queue = EventQueue()
+        queue.put_nowait("first")
+        await queue.put("second")
+
+        assert queue.qsize() == 2
+        assert await queue.get() == "first"
+        assert queue.get_nowait() == "second"
+        assert queue.empty()
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_next_event(self):
+        """Test that get() blocks until a producer adds an event."""
+        queue = EventQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not getter.done()
+
+        queue.put_nowait(None)
+
+        assert await asyncio.wait_for(getter, timeout=1) is None
+        assert queue.empty()
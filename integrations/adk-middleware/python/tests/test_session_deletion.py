@@ -44,6 +44,10 @@ async def test_session_deletion():
     session_key = f"{test_app_name}:{test_session_id}"
     assert session_key in session_manager._session_keys
     print(f"✅ Session tracked: {session_key}")
+    assert session_manager.get_session_owner(test_session_id) == (test_app_name, test_user_id)
+
+    expired = []
+    session_manager.on_session_expire(lambda *args: expired.append(args))
 
     # Create a mock session object for deletion
     mock_session = MagicMock()
@@ -57,6 +61,8 @@ async def test_session_deletion():
     # Verify session is no longer tracked
     assert session_key not in session_manager._session_keys
     print("✅ Session no longer in tracking")
+    assert session_manager.get_session_owner(test_session_id) is None
+    assert expired == [(test_session_id, test_app_name, test_user_id)]
 
     # Verify delete_session was called with correct parameters
     mock_session_service.delete_session.assert_called_once_with(
@@ -5,7 +5,10 @@ import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
+import gc
+import threading
 import time
+import weakref
 
 from ag_ui_adk import SessionManager
 
@@ -165,6 +168,225 @@ class TestSessionMemory:
         # Verify memory service was called during cleanup
         mock_memory_service.add_session_to_memory.assert_called_once_with(old_session)
 
+    @pytest.mark.asyncio
+    async def test_cleanup_fetches_sessions_with_their_owner(self, mock_session_service):
+        """Test that cleanup resolves each session's user through the reverse index."""
+        manager = SessionManager.get_instance(
+            session_service=mock_session_service,
+            auto_cleanup=False
+        )
+
+        manager._track_session("app:session_a", "user_a")
+        manager._track_session("app:session_b", "user_b")
+        mock_session_service.get_session.return_value = None
+
+        await manager._cleanup_expired_sessions()
+
+        fetched = {
+            (call.kwargs["session_id"], call.kwargs["user_id"])
+            for call in mock_session_service.get_session.call_args_list
+        }
+        assert fetched == {("session_a", "user_a"), ("session_b", "user_b")}
+        # Missing sessions are untracked, reverse index included
+        assert manager._session_users == {}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_fetches_sessions_concurrently(self, mock_session_service):
+        """Test that cleanup overlaps its session fetches and survives a failing one."""
+        manager = SessionManager.get_instance(
+            session_service=mock_session_service,
+            session_timeout_seconds=1,
+            auto_cleanup=False
+        )
+
+        for i in range(3):
+            manager._track_session(f"app:session_{i}", "user")
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_session(session_id, app_name, user_id):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if session_id == "session_0":
+                raise RuntimeError("backend unavailable")
+            expired = MagicMock()
+            expired.id = session_id
+            expired.app_name = app_name
+            expired.user_id = user_id
+            expired.last_update_time = time.time() - 10
+            expired.state = {}
+            return expired
+
+        mock_session_service.get_session.side_effect = get_session
+
+        await manager._cleanup_expired_sessions()
+
+        assert max_in_flight == 3
+        assert mock_session_service.delete_session.await_count == 2
+        # The session that failed to load stays tracked for the next cycle
+        assert manager._session_keys == {"app:session_0"}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_skips_sessions_seen_recently(self, mock_session_service):
+        """Test that cleanup does not fetch sessions whose cached update time is fresh."""
+        manager = SessionManager.get_instance(
+            session_service=mock_session_service,
+            session_timeout_seconds=60,
+            auto_cleanup=False
+        )
+
+        fresh_session = MagicMock()
+        fresh_session.last_update_time = time.time()
+        mock_session_service.get_session.return_value = fresh_session
+        await manager.get_or_create_session("fresh", "app", "user")
+        mock_session_service.get_session.reset_mock()
+
+        await manager._cleanup_expired_sessions()
+
+        mock_session_service.get_session.assert_not_called()
+        assert "app:fresh" in manager._session_keys
+
+    @pytest.mark.asyncio
+    async def test_cleanup_rechecks_preserved_sessions_and_bounds_heap(self, mock_session_service):
+        """Test that sessions kept for pending tool calls stay scheduled and touches don't grow the heap."""
+        manager = SessionManager.get_instance(
+            session_service=mock_session_service,
+            session_timeout_seconds=1,
+            auto_cleanup=False
+        )
+
+        hitl_session = MagicMock()
+        hitl_session.last_update_time = time.time() - 10
+        hitl_session.state = {"pending_tool_calls": ["call_1"]}
+        mock_session_service.get_session.return_value = hitl_session
+        manager._track_session("app:hitl", "user")
+
+        await manager._cleanup_expired_sessions()
+        await manager._cleanup_expired_sessions()
+
+        assert mock_session_service.get_session.await_count == 2
+        assert "app:hitl" in manager._session_keys
+
+        touched = MagicMock()
+        for i in range(500):
+            touched.last_update_time = time.time() + i
+            manager._note_last_seen("app:hitl", touched)
+        assert len(manager._expiry_heap) <= 2 * len(manager._session_keys) + 64
+
+    @pytest.mark.asyncio
+    async def test_oldest_session_eviction_fetches_only_the_evicted_session(self, mock_session_service):
+        """Test that the per-user limit picks the oldest session from cached update times."""
+        manager = SessionManager.get_instance(
+            session_service=mock_session_service,
+            max_sessions_per_user=3,
+            auto_cleanup=False
+        )
+
+        now = time.time()
+        for i, age in enumerate([30, 300, 60]):
+            session = MagicMock()
+            session.id = f"session_{i}"
+            session.app_name = "app"
+            session.user_id = "user"
+            session.last_update_time = now - age
+            manager._track_session(f"app:session_{i}", "user")
+            manager._note_last_seen(f"app:session_{i}", session)
+            if i == 1:
+                oldest = session
+
+        mock_session_service.get_session.return_value = oldest
+
+        await manager._remove_oldest_user_session("user")
+
+        mock_session_service.get_session.assert_awaited_once_with(
+            session_id="session_1", app_name="app", user_id="user"
+        )
+        assert manager._user_sessions["user"] == {"app:session_0", "app:session_2"}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_task_started_once_under_concurrency(self, mock_session_service):
+        """Test that concurrent session creation starts a single cleanup task, restarted once done."""
+        manager = SessionManager.get_instance(
+            session_service=mock_session_service,
+            auto_cleanup=True
+        )
+        mock_session_service.get_session.return_value = None
+        mock_session_service.create_session.return_value = MagicMock()
+
+        async def idle_loop():
+            await asyncio.sleep(3600)
+
+        with patch.object(manager, '_cleanup_loop', side_effect=idle_loop) as mock_loop:
+            await asyncio.gather(*(
+                manager.get_or_create_session(f"session_{i}", "app", f"user_{i}")
+                for i in range(5)
+            ))
+            assert mock_loop.call_count == 1
+            first_task = manager._cleanup_task
+
+            # A finished task (e.g. from a closed loop) does not block a restart
+            first_task.cancel()
+            await asyncio.gather(first_task, return_exceptions=True)
+            await manager.get_or_create_session("session_x", "app", "user_x")
+
+            assert mock_loop.call_count == 2
+            assert manager._cleanup_task is not first_task
+
+        await manager.stop_cleanup_task()
+
+    def test_tracked_session_survives_heap_rebuild_on_push(self, mock_session_service):
+        """Test that a new session stays scheduled when its push triggers a rebuild."""
+        manager = SessionManager.get_instance(
+            session_service=mock_session_service,
+            auto_cleanup=False
+        )
+        # Fill the heap with outdated entries right up to the rebuild threshold
+        manager._expiry_heap = [(float(i), "app:stale") for i in range(66)]
+
+        manager._track_session("app:new_session", "user")
+
+        assert len(manager._expiry_heap) == 1
+        assert manager._expiry_heap[0][1] == "app:new_session"
+
+    @pytest.mark.asyncio
+    async def test_expired_tracked_session_replaced_on_access(self, mock_session_service):
+        """Test that an expired tracked session is deleted and recreated when accessed."""
+        manager = SessionManager.get_instance(
+            session_service=mock_session_service,
+            session_timeout_seconds=60,
+            auto_cleanup=True
+        )
+
+        stale_session = MagicMock()
+        stale_session.id = "thread"
+        stale_session.app_name = "app"
+        stale_session.user_id = "user"
+        stale_session.last_update_time = time.time() - 3600
+        stale_session.state = {}
+        fresh_session = MagicMock()
+        fresh_session.last_update_time = time.time()
+        mock_session_service.get_session.return_value = stale_session
+        mock_session_service.create_session.return_value = fresh_session
+        manager._track_session("app:thread", "user")
+
+        session = await manager.get_or_create_session("thread", "app", "user")
+
+        assert session is fresh_session
+        mock_session_service.delete_session.assert_awaited_once_with(
+            session_id="thread", app_name="app", user_id="user"
+        )
+        assert "app:thread" in manager._session_keys
+
+        # Sessions waiting on tool results are resumed even when stale
+        stale_session.state = {"pending_tool_calls": ["call_1"]}
+        mock_session_service.get_session.return_value = stale_session
+        manager._last_seen.pop("app:thread")
+        assert await manager.get_or_create_session("thread", "app", "user") is stale_session
+
     @pytest.mark.asyncio
     async def test_memory_service_during_user_limit_enforcement(self, mock_session_service, mock_memory_service):
         """Test that memory service is used when removing oldest sessions due to user limits."""
@@ -221,6 +443,84 @@ class TestSessionMemory:
 
         assert manager._memory_service is None
 
+    def test_singleton_initialized_once_across_threads(self, mock_session_service):
+        """Test that concurrent first construction initializes the singleton once."""
+        SessionManager.reset_instance()
+        original_initialize = SessionManager._initialize
+        init_calls = []
+
+        def slow_initialize(self, *args, **kwargs):
+            init_calls.append(self)
+            time.sleep(0.01)  # widen the window for a second initializer
+            original_initialize(self, *args, **kwargs)
+
+        barrier = threading.Barrier(8)
+        instances = []
+
+        def construct():
+            barrier.wait()
+            instances.append(SessionManager.get_instance(
+                session_service=mock_session_service,
+                auto_cleanup=False
+            ))
+
+        with patch.object(SessionManager, '_initialize', slow_initialize):
+            threads = [threading.Thread(target=construct) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(init_calls) == 1
+        assert all(instance is instances[0] for instance in instances)
+
+    def test_expire_callback_bound_method_held_weakly(self, mock_session_service):
+        """Test that a registered bound method does not keep its owner alive."""
+        manager = SessionManager.get_instance(
+            session_service=mock_session_service,
+            auto_cleanup=False
+        )
+        calls = []
+
+        class Listener:
+            def on_expire(self, session_id, app_name, user_id):
+                calls.append(session_id)
+
+        kept, dropped = Listener(), Listener()
+        manager.on_session_expire(kept.on_expire)
+        manager.on_session_expire(dropped.on_expire)
+        dropped_ref = weakref.ref(dropped)
+        del dropped
+        gc.collect()
+
+        assert dropped_ref() is None
+
+        manager._track_session("app:session", "user")
+        manager._untrack_session("app:session", "user")
+
+        assert calls == ["session"]
+        assert len(manager._expire_callbacks) == 1
+
+        manager.remove_session_expire_callback(kept.on_expire)
+        assert manager._expire_callbacks == []
+
+    def test_processed_message_ids_bounded_per_session(self, mock_session_service):
+        """Test that only the most recently marked message IDs are remembered."""
+        manager = SessionManager.get_instance(
+            session_service=mock_session_service,
+            auto_cleanup=False,
+            max_processed_message_ids=3
+        )
+
+        manager.mark_messages_processed("app", "thread", ["m1", "m2", "m3"])
+        # Re-marking m1 makes it the most recent, so m2 is evicted next
+        manager.mark_messages_processed("app", "thread", ["m1", "m4"])
+
+        assert manager.get_processed_message_ids("app", "thread") == {"m3", "m1", "m4"}
+        assert not manager.is_message_processed("app", "thread", "m2")
+        assert manager.get_last_processed_message_id("app", "thread") == "m4"
+        assert manager.get_processed_message_ids("app", "other_thread") == set()
+
 
 class TestSessionStateManagement:
     """Test cases for session state management functionality."""
@@ -300,6 +600,41 @@ class TestSessionStateManagement:
             mock_actions.assert_called_once_with(state_delta=state_updates)
             mock_session_service.append_event.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_update_session_state_with_fetched_session(self, manager, mock_session_service, mock_session):
+        """Test that passing an already-fetched session skips the lookup."""
+        result = await manager.update_session_state(
+            session_id="test_session",
+            app_name="test_app",
+            user_id="test_user",
+            state_updates={"key": "value"},
+            session=mock_session
+        )
+
+        assert result is True
+        mock_session_service.get_session.assert_not_called()
+        mock_session_service.append_event.assert_called_once()
+        assert mock_session_service.append_event.call_args.args[0] is mock_session
+
+    @pytest.mark.asyncio
+    async def test_update_session_state_invocation_ids_unique(self, manager, mock_session_service, mock_session):
+        """Test that back-to-back state updates get distinct invocation IDs."""
+        for value in range(3):
+            await manager.update_session_state(
+                session_id="test_session",
+                app_name="test_app",
+                user_id="test_user",
+                state_updates={"counter": value},
+                session=mock_session
+            )
+
+        invocation_ids = [
+            call.args[1].invocation_id
+            for call in mock_session_service.append_event.call_args_list
+        ]
+        assert len(set(invocation_ids)) == 3
+        assert all(invocation_id.startswith("state_update_") for invocation_id in invocation_ids)
+
     @pytest.mark.asyncio
     async def test_update_session_state_session_not_found(self, manager, mock_session_service):
         """Test update when session doesn't exist."""
@@ -458,6 +793,64 @@ class TestSessionStateManagement:
             assert result is True
             mock_actions.assert_called_once_with(state_delta={"new_key": "new_value"})
 
+    # ===== MUTATE STATE VALUE TESTS =====
+
+    @pytest.mark.asyncio
+    async def test_mutate_state_value_single_fetch(self, manager, mock_session_service, mock_session):
+        """Test that mutating a value fetches the session once and writes once."""
+        mock_session_service.get_session.return_value = mock_session
+
+        with patch('google.adk.events.Event') as mock_event, \
+             patch('google.adk.events.EventActions') as mock_actions:
+
+            result = await manager.mutate_state_value(
+                session_id="test_session",
+                app_name="test_app",
+                user_id="test_user",
+                key="counter",
+                mutator=lambda value: value + 1
+            )
+
+            assert result == 43
+            mock_session_service.get_session.assert_called_once()
+            mock_actions.assert_called_once_with(state_delta={"counter": 43})
+            mock_session_service.append_event.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_mutate_state_value_unchanged_skips_write(self, manager, mock_session_service, mock_session):
+        """Test that an unchanged value is not written back."""
+        mock_session_service.get_session.return_value = mock_session
+
+        result = await manager.mutate_state_value(
+            session_id="test_session",
+            app_name="test_app",
+            user_id="test_user",
+            key="missing",
+            mutator=lambda value: [item for item in value if item != "x"],
+            default=[]
+        )
+
+        assert result == []
+        mock_session_service.append_event.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_mutate_state_value_session_not_found(self, manager, mock_session_service):
+        """Test mutating a value when the session does not exist."""
+        mock_session_service.get_session.return_value = None
+        mutator = MagicMock()
+
+        result = await manager.mutate_state_value(
+            session_id="nonexistent",
+            app_name="test_app",
+            user_id="test_user",
+            key="key",
+            mutator=mutator,
+            default="fallback"
+        )
+
+        assert result == "fallback"
+        mutator.assert_not_called()
+
     # ===== REMOVE STATE KEYS TESTS =====
 
     @pytest.mark.asyncio
@@ -465,10 +858,9 @@ class TestSessionStateManagement:
         """Test removing a single state key."""
         mock_session_service.get_session.return_value = mock_session
 
-        with patch.object(manager, 'get_session_state') as mock_get_state, \
-             patch.object(manager, 'update_session_state') as mock_update:
+        with patch.object(manager, 'update_session_state') as mock_update:
 
-            mock_get_state.return_value = {"test": "data", "counter": 42}
+            mock_session.state = {"test": "data", "counter": 42}
             mock_update.return_value = True
 
             result = await manager.remove_state_keys(
@@ -483,18 +875,20 @@ class TestSessionStateManagement:
                 session_id="test_session",
                 app_name="test_app",
                 user_id="test_user",
-                state_updates={"test": None}
+                state_updates={"test": None},
+                session=mock_session
             )
+            # The fetched session is handed to the update instead of being fetched again
+            mock_session_service.get_session.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_remove_state_keys_multiple_keys(self, manager, mock_session_service, mock_session):
         """Test removing multiple state keys."""
         mock_session_service.get_session.return_value = mock_session
 
-        with patch.object(manager, 'get_session_state') as mock_get_state, \
-             patch.object(manager, 'update_session_state') as mock_update:
+        with patch.object(manager, 'update_session_state') as mock_update:
 
-            mock_get_state.return_value = {"test": "data", "counter": 42, "other": "value"}
+            mock_session.state = {"test": "data", "counter": 42, "other": "value"}
             mock_update.return_value = True
 
             result = await manager.remove_state_keys(
@@ -509,7 +903,8 @@ class TestSessionStateManagement:
                 session_id="test_session",
                 app_name="test_app",
                 user_id="test_user",
-                state_updates={"test": None, "counter": None}
+                state_updates={"test": None, "counter": None},
+                session=mock_session
             )
 
     @pytest.mark.asyncio
@@ -517,10 +912,9 @@ class TestSessionStateManagement:
         """Test removing keys that don't exist."""
         mock_session_service.get_session.return_value = mock_session
 
-        with patch.object(manager, 'get_session_state') as mock_get_state, \
-             patch.object(manager, 'update_session_state') as mock_update:
+        with patch.object(manager, 'update_session_state') as mock_update:
 
-            mock_get_state.return_value = {"test": "data"}
+            mock_session.state = {"test": "data"}
             mock_update.return_value = True
 
             result = await manager.remove_state_keys(
@@ -540,10 +934,9 @@ class TestSessionStateManagement:
         """Test clearing all session state."""
         mock_session_service.get_session.return_value = mock_session
 
-        with patch.object(manager, 'get_session_state') as mock_get_state, \
-             patch.object(manager, 'remove_state_keys') as mock_remove:
+        with patch.object(manager, 'remove_state_keys') as mock_remove:
 
-            mock_get_state.return_value = {"test": "data", "counter": 42, "app:setting": "value"}
+            mock_session.state = {"test": "data", "counter": 42, "app:setting": "value"}
             mock_remove.return_value = True
 
             result = await manager.clear_session_state(
@@ -557,18 +950,19 @@ class TestSessionStateManagement:
                 session_id="test_session",
                 app_name="test_app",
                 user_id="test_user",
-                keys=["test", "counter", "app:setting"]
+                keys=["test", "counter", "app:setting"],
+                session=mock_session
             )
+            mock_session_service.get_session.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_clear_session_state_preserve_prefixes(self, manager, mock_session_service, mock_session):
         """Test clearing state while preserving certain prefixes."""
         mock_session_service.get_session.return_value = mock_session
 
-        with patch.object(manager, 'get_session_state') as mock_get_state, \
-             patch.object(manager, 'remove_state_keys') as mock_remove:
+        with patch.object(manager, 'remove_state_keys') as mock_remove:
 
-            mock_get_state.return_value = {"test": "data", "counter": 42, "app:setting": "value"}
+            mock_session.state = {"test": "data", "counter": 42, "app:setting": "value"}
             mock_remove.return_value = True
 
             result = await manager.clear_session_state(
@@ -583,7 +977,8 @@ class TestSessionStateManagement:
                 session_id="test_session",
                 app_name="test_app",
                 user_id="test_user",
-                keys=["test", "counter"]  # app:setting should be preserved
+                keys=["test", "counter"],  # app:setting should be preserved
+                session=mock_session
             )
 
     # ===== INITIALIZE SESSION STATE TESTS =====
@@ -593,10 +988,9 @@ class TestSessionStateManagement:
         """Test initializing session state with only new keys."""
         mock_session_service.get_session.return_value = mock_session
 
-        with patch.object(manager, 'get_session_state') as mock_get_state, \
-             patch.object(manager, 'update_session_state') as mock_update:
+        with patch.object(manager, 'update_session_state') as mock_update:
 
-            mock_get_state.return_value = {"existing": "value"}
+            mock_session.state = {"existing": "value"}
             mock_update.return_value = True
 
             initial_state = {"existing": "old_value", "new_key": "new_value"}
@@ -614,7 +1008,8 @@ class TestSessionStateManagement:
                 session_id="test_session",
                 app_name="test_app",
                 user_id="test_user",
-                state_updates={"new_key": "new_value"}  # Only new keys
+                state_updates={"new_key": "new_value"},
+                session=mock_session  # Only new keys
             )
 
     @pytest.mark.asyncio
@@ -640,7 +1035,8 @@ class TestSessionStateManagement:
                 session_id="test_session",
                 app_name="test_app",
                 user_id="test_user",
-                state_updates=initial_state  # All keys including existing ones
+                state_updates=initial_state,  # All keys including existing ones
+                session=None
             )
 
     # ===== BULK UPDATE USER STATE TESTS =====
@@ -670,9 +1066,8 @@ class TestSessionStateManagement:
     async def test_bulk_update_user_state_with_app_filter(self, manager, mock_session_service):
         """Test bulk updating state with app filter."""
         # Set up user sessions
-        manager._user_sessions = {
-            "test_user": {"app1:session1", "app2:session2"}
-        }
+        manager._track_session("app1:session1", "test_user")
+        manager._track_session("app2:session2", "test_user")
 
         with patch.object(manager, 'update_session_state') as mock_update:
             mock_update.return_value = True
@@ -694,6 +1089,25 @@ class TestSessionStateManagement:
                 state_updates=state_updates
             )
 
+    @pytest.mark.asyncio
+    async def test_bulk_update_user_state_app_filter_after_untrack(self, manager, mock_session_service):
+        """Test that the per-app index forgets untracked sessions."""
+        manager._track_session("app1:session1", "test_user")
+        manager._track_session("app2:session2", "test_user")
+        manager._untrack_session("app1:session1", "test_user")
+
+        assert ("test_user", "app1") not in manager._user_app_sessions
+
+        with patch.object(manager, 'update_session_state') as mock_update:
+            result = await manager.bulk_update_user_state(
+                user_id="test_user",
+                state_updates={"bulk_key": "bulk_value"},
+                app_name_filter="app1"
+            )
+
+        assert result == {}
+        mock_update.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_bulk_update_user_state_no_sessions(self, manager, mock_session_service):
         """Test bulk updating state when user has no sessions."""
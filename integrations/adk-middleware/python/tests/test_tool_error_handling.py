@@ -124,7 +124,9 @@ class TestToolErrorHandling:
 
         with patch.object(adk_middleware, '_stream_events', side_effect=mock_stream_events):
             events = []
-            async for event in adk_middleware._handle_tool_result_submission(input_data):
+            async for event in adk_middleware._handle_tool_result_submission(
+                input_data, tool_messages=input_data.messages
+            ):
                 events.append(event)
 
             # In the all-long-running architecture, tool results always start new executions
@@ -172,7 +174,9 @@ class TestToolErrorHandling:
 
         with patch.object(adk_middleware, '_stream_events', side_effect=mock_stream_events):
             events = []
-            async for event in adk_middleware._handle_tool_result_submission(input_data):
+            async for event in adk_middleware._handle_tool_result_submission(
+                input_data, tool_messages=input_data.messages
+            ):
                 events.append(event)
 
             # The system logs warnings but may not emit error events for unknown tool calls
@@ -286,7 +290,9 @@ class TestToolErrorHandling:
 
         with patch.object(adk_middleware, '_stream_events', side_effect=mock_stream_events):
             events = []
-            async for event in adk_middleware._handle_tool_result_submission(input_data):
+            async for event in adk_middleware._handle_tool_result_submission(
+                input_data, tool_messages=input_data.messages
+            ):
                 events.append(event)
 
             # In all-long-running architecture, tool results always start new executions
@@ -458,7 +464,9 @@ class TestToolErrorHandling:
 
         with patch.object(adk_middleware, '_stream_events', side_effect=mock_stream_events):
             events = []
-            async for event in adk_middleware._handle_tool_result_submission(input_data):
+            async for event in adk_middleware._handle_tool_result_submission(
+                input_data, tool_messages=input_data.messages
+            ):
                 events.append(event)
 
             # In all-long-running architecture, tool results always start new executions
@@ -75,7 +75,9 @@ class TestToolResultFlow:
             forwarded_props={}
         )
 
-        assert await ag_ui_adk._is_tool_result_submission(input_with_tool) is True
+        assert await ag_ui_adk._is_tool_result_submission(
+            input_with_tool, await ag_ui_adk._get_unseen_messages(input_with_tool)
+        ) is True
 
     @pytest.mark.asyncio
     async def test_is_tool_result_submission_with_user_message(self, ag_ui_adk):
@@ -94,7 +96,9 @@ class TestToolResultFlow:
             forwarded_props={}
         )
 
-        assert await ag_ui_adk._is_tool_result_submission(input_without_tool) is False
+        assert await ag_ui_adk._is_tool_result_submission(
+            input_without_tool, await ag_ui_adk._get_unseen_messages(input_without_tool)
+        ) is False
 
     @pytest.mark.asyncio
     async def test_is_tool_result_submission_empty_messages(self, ag_ui_adk):
@@ -109,7 +113,9 @@ class TestToolResultFlow:
             forwarded_props={}
         )
 
-        assert await ag_ui_adk._is_tool_result_submission(empty_input) is False
+        assert await ag_ui_adk._is_tool_result_submission(
+            empty_input, await ag_ui_adk._get_unseen_messages(empty_input)
+        ) is False
 
     @pytest.mark.asyncio
     async def test_is_tool_result_submission_ignores_processed_history(self, ag_ui_adk):
@@ -130,7 +136,76 @@ class TestToolResultFlow:
         app_name = ag_ui_adk._get_app_name(replay_input)
         ag_ui_adk._session_manager.mark_messages_processed(app_name, replay_input.thread_id, ["1", "2"])
 
-        assert await ag_ui_adk._is_tool_result_submission(replay_input) is False
+        assert await ag_ui_adk._is_tool_result_submission(
+            replay_input, await ag_ui_adk._get_unseen_messages(replay_input)
+        ) is False
+
+    @pytest.mark.asyncio
+    async def test_get_unseen_messages_fast_path_when_latest_processed(self, ag_ui_adk):
+        """Skip the processed-ID scan when the latest message was the last one processed."""
+        replay_input = RunAgentInput(
+            thread_id="thread_1",
+            run_id="run_1",
+            messages=[
+                UserMessage(id="1", role="user", content="Do something"),
+                ToolMessage(id="2", role="tool", content='{"result": "success"}', tool_call_id="call_1")
+            ],
+            tools=[],
+            context=[],
+            state={},
+            forwarded_props={}
+        )
+
+        app_name = ag_ui_adk._get_app_name(replay_input)
+        ag_ui_adk._session_manager.mark_messages_processed(app_name, replay_input.thread_id, ["1", "2"])
+
+        with patch.object(ag_ui_adk._session_manager, 'get_processed_message_ids') as mock_get_ids:
+            assert await ag_ui_adk._get_unseen_messages(replay_input) == []
+
+        mock_get_ids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_unseen_messages_checks_only_appended_tail(self, ag_ui_adk):
+        """Only messages appended after the previous request's tail are scanned."""
+        history = [
+            UserMessage(id="1", role="user", content="First"),
+            UserMessage(id="2", role="user", content="Second"),
+        ]
+        first_input = RunAgentInput(
+            thread_id="thread_1", run_id="run_1", messages=history,
+            tools=[], context=[], state={}, forwarded_props={}
+        )
+
+        assert await ag_ui_adk._get_unseen_messages(first_input) == history
+
+        app_name = ag_ui_adk._get_app_name(first_input)
+        ag_ui_adk._session_manager.mark_messages_processed(app_name, "thread_1", ["1", "2"])
+        # A later mark moves the last processed ID away from the tail, so the
+        # latest-message fast path does not apply
+        ag_ui_adk._session_manager.mark_messages_processed(app_name, "thread_1", ["other"])
+
+        appended = UserMessage(id="3", role="user", content="Third")
+        next_input = RunAgentInput(
+            thread_id="thread_1", run_id="run_2", messages=[*history, appended],
+            tools=[], context=[], state={}, forwarded_props={}
+        )
+
+        with patch.object(ag_ui_adk._session_manager, 'get_processed_message_ids') as mock_get_ids:
+            assert await ag_ui_adk._get_unseen_messages(next_input) == [appended]
+
+        mock_get_ids.assert_not_called()
+
+        # A rewritten history no longer matches the hint and falls back to a full scan
+        rewritten_input = RunAgentInput(
+            thread_id="thread_1", run_id="run_3",
+            messages=[UserMessage(id="9", role="user", content="New"), *history[1:], appended],
+            tools=[], context=[], state={}, forwarded_props={}
+        )
+        with patch.object(ag_ui_adk._session_manager, 'get_processed_message_ids') as mock_get_ids:
+            assert await ag_ui_adk._get_unseen_messages(rewritten_input) == [appended]
+
+        # The full scan checks membership directly instead of copying the processed IDs
+        mock_get_ids.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_is_tool_result_submission_multiple_tool_messages(self, ag_ui_adk):
@@ -152,7 +227,9 @@ class TestToolResultFlow:
         app_name = ag_ui_adk._get_app_name(batched_input)
         ag_ui_adk._session_manager.mark_messages_processed(app_name, batched_input.thread_id, ["1"])
 
-        assert await ag_ui_adk._is_tool_result_submission(batched_input) is True
+        assert await ag_ui_adk._is_tool_result_submission(
+            batched_input, await ag_ui_adk._get_unseen_messages(batched_input)
+        ) is True
 
     @pytest.mark.asyncio
     async def test_is_tool_result_submission_new_user_after_tool(self, ag_ui_adk):
@@ -174,7 +251,9 @@ class TestToolResultFlow:
         app_name = ag_ui_adk._get_app_name(batched_input)
         ag_ui_adk._session_manager.mark_messages_processed(app_name, batched_input.thread_id, ["1"])
 
-        assert await ag_ui_adk._is_tool_result_submission(batched_input) is False
+        assert await ag_ui_adk._is_tool_result_submission(
+            batched_input, await ag_ui_adk._get_unseen_messages(batched_input)
+        ) is False
 
     @pytest.mark.asyncio
     async def test_extract_tool_results_single_tool(self, ag_ui_adk):
@@ -195,10 +274,37 @@ class TestToolResultFlow:
         tool_results = await ag_ui_adk._extract_tool_results(input_data, input_data.messages)
 
         assert len(tool_results) == 1
-        assert tool_results[0]['message'].role == "tool"
-        assert tool_results[0]['message'].tool_call_id == "call_1"
-        assert tool_results[0]['message'].content == '{"result": "success"}'
-        assert tool_results[0]['tool_name'] == "unknown"  # No tool_calls in messages
+        assert tool_results[0].message.role == "tool"
+        assert tool_results[0].message.tool_call_id == "call_1"
+        assert tool_results[0].message.content == '{"result": "success"}'
+        assert tool_results[0].tool_name == "unknown"  # No tool_calls in messages
+
+    @pytest.mark.asyncio
+    async def test_extract_tool_results_uses_prebuilt_tool_call_map(self, ag_ui_adk):
+        """Test that a caller-supplied tool call map is used instead of rebuilding one."""
+        input_data = RunAgentInput(
+            thread_id="thread_1",
+            run_id="run_1",
+            messages=[
+                UserMessage(id="1", role="user", content="Hello"),
+                ToolMessage(id="2", role="tool", content='{"result": "success"}', tool_call_id="call_1")
+            ],
+            tools=[],
+            context=[],
+            state={},
+            forwarded_props={}
+        )
+
+        with patch.object(ag_ui_adk, '_build_tool_call_map') as mock_build:
+            tool_results = await ag_ui_adk._extract_tool_results(
+                input_data,
+                input_data.messages,
+                tool_call_map={"call_1": "prebuilt_tool"},
+            )
+
+        mock_build.assert_not_called()
+        assert len(tool_results) == 1
+        assert tool_results[0].tool_name == "prebuilt_tool"
 
     @pytest.mark.asyncio
     async def test_extract_tool_results_multiple_tools(self, ag_ui_adk):
@@ -221,7 +327,7 @@ class TestToolResultFlow:
         tool_results = await ag_ui_adk._extract_tool_results(input_data, unseen_messages)
 
         assert len(tool_results) == 2
-        assert [result['message'].tool_call_id for result in tool_results] == ["call_1", "call_2"]
+        assert [result.message.tool_call_id for result in tool_results] == ["call_1", "call_2"]
 
     @pytest.mark.asyncio
     async def test_extract_tool_results_mixed_messages(self, ag_ui_adk):
@@ -245,9 +351,9 @@ class TestToolResultFlow:
         tool_results = await ag_ui_adk._extract_tool_results(input_data, unseen_messages)
 
         assert len(tool_results) == 1
-        assert tool_results[0]['message'].role == "tool"
-        assert tool_results[0]['message'].tool_call_id == "call_2"
-        assert tool_results[0]['message'].content == '{"result": "done"}'
+        assert tool_results[0].message.role == "tool"
+        assert tool_results[0].message.tool_call_id == "call_2"
+        assert tool_results[0].message.content == '{"result": "done"}'
 
     @pytest.mark.asyncio
     async def test_handle_tool_result_submission_no_active_execution(self, ag_ui_adk):
@@ -265,7 +371,9 @@ class TestToolResultFlow:
         )
 
         events = []
-        async for event in ag_ui_adk._handle_tool_result_submission(input_data):
+        async for event in ag_ui_adk._handle_tool_result_submission(
+            input_data, tool_messages=input_data.messages
+        ):
             events.append(event)
 
         # In all-long-running architecture, tool results without active execution
@@ -289,7 +397,9 @@ class TestToolResultFlow:
         )
 
         events = []
-        async for event in ag_ui_adk._handle_tool_result_submission(input_data):
+        async for event in ag_ui_adk._handle_tool_result_submission(
+            input_data, tool_messages=input_data.messages
+        ):
             events.append(event)
 
         # When there are no tool results, should emit error for missing tool results
@@ -327,7 +437,9 @@ class TestToolResultFlow:
             )
 
             events = []
-            async for event in ag_ui_adk._handle_tool_result_submission(input_data):
+            async for event in ag_ui_adk._handle_tool_result_submission(
+                input_data, tool_messages=input_data.messages
+            ):
                 events.append(event)
 
             # Should receive RUN_STARTED + mock events + RUN_FINISHED (4 total)
@@ -360,7 +472,9 @@ class TestToolResultFlow:
             )
 
             events = []
-            async for event in ag_ui_adk._handle_tool_result_submission(input_data):
+            async for event in ag_ui_adk._handle_tool_result_submission(
+                input_data, tool_messages=input_data.messages
+            ):
                 events.append(event)
 
             # Should emit RUN_STARTED then error event when streaming fails
@@ -388,7 +502,9 @@ class TestToolResultFlow:
         )
 
         events = []
-        async for event in ag_ui_adk._handle_tool_result_submission(input_data):
+        async for event in ag_ui_adk._handle_tool_result_submission(
+            input_data, tool_messages=input_data.messages
+        ):
             events.append(event)
 
         # Should start new execution, handle invalid JSON gracefully, and complete
@@ -396,6 +512,50 @@ class TestToolResultFlow:
         assert len(events) >= 2  # At least RUN_STARTED and some completion
         assert events[0].type == EventType.RUN_STARTED
 
+    @pytest.mark.asyncio
+    async def test_tool_result_content_parsing(self, ag_ui_adk):
+        """Test trivial, blank and regular JSON tool results become function responses."""
+        import asyncio
+        from ag_ui_adk.adk_agent import ToolResult
+
+        contents = ['{}', '   ', '{"result": "ok"}', '{"id": 123456789012345678901234567890}']
+        input_data = RunAgentInput(
+            thread_id="test_thread",
+            run_id="run_1",
+            messages=[
+                ToolMessage(id=str(i), role="tool", content=content, tool_call_id=f"call_{i}")
+                for i, content in enumerate(contents)
+            ],
+            tools=[],
+            context=[],
+            state={},
+            forwarded_props={}
+        )
+        tool_results = [ToolResult(tool_name="test_tool", message=message) for message in input_data.messages]
+
+        captured = {}
+
+        class FakeRunner:
+            async def run_async(self, *args, **kwargs):
+                captured["new_message"] = kwargs["new_message"]
+                return
+                yield  # pragma: no cover - keeps this an async generator
+
+        with patch.object(ag_ui_adk, "_create_runner", return_value=FakeRunner()):
+            await ag_ui_adk._run_adk_in_background(
+                input=input_data,
+                adk_agent=ag_ui_adk._adk_agent,
+                user_id="test_user",
+                app_name="test_app",
+                event_queue=asyncio.Queue(),
+                tool_results=tool_results,
+            )
+
+        responses = [part.function_response.response for part in captured["new_message"].parts]
+        assert responses == [
+            {}, {"success": True, "result": None}, {"result": "ok"}, {"id": 123456789012345678901234567890}
+        ]
+
     @pytest.mark.asyncio
     async def test_handle_tool_result_submission_multiple_results(self, ag_ui_adk):
         """Test handling multiple tool results in one submission preserves all unseen results."""
@@ -416,7 +576,7 @@ class TestToolResultFlow:
 
         tool_results = await ag_ui_adk._extract_tool_results(input_data, input_data.messages)
         assert len(tool_results) == 2
-        assert [result['message'].tool_call_id for result in tool_results] == ["call_1", "call_2"]
+        assert [result.message.tool_call_id for result in tool_results] == ["call_1", "call_2"]
 
     @pytest.mark.asyncio
     async def test_tool_result_flow_integration(self, ag_ui_adk):
@@ -439,7 +599,7 @@ class TestToolResultFlow:
 
         # In the all-long-running architecture, tool result inputs are processed as new executions
         # Mock the background execution to avoid ADK library errors
-        async def mock_start_new_execution(input_data, *, tool_results=None, message_batch=None):
+        async def mock_start_new_execution(input_data, *, tool_results=None, message_batch=None, **kwargs):
             yield RunStartedEvent(
                 type=EventType.RUN_STARTED,
                 thread_id=input_data.thread_id,
@@ -480,7 +640,7 @@ class TestToolResultFlow:
 
         start_calls = []
 
-        async def mock_start_new_execution(input_data, *, tool_results=None, message_batch=None):
+        async def mock_start_new_execution(input_data, *, tool_results=None, message_batch=None, **kwargs):
             start_calls.append((tool_results, message_batch))
             yield RunStartedEvent(
                 type=EventType.RUN_STARTED,
@@ -518,7 +678,7 @@ class TestToolResultFlow:
         assert len(start_calls) == 2
         first_tool_results, first_batch = start_calls[0]
         assert first_tool_results is not None and len(first_tool_results) == 1
-        assert first_tool_results[0]['message'].tool_call_id == "call_1"
+        assert first_tool_results[0].message.tool_call_id == "call_1"
         assert first_batch == [input_data.messages[0]]
 
         second_tool_results, second_batch = start_calls[1]
@@ -573,12 +733,12 @@ class TestToolResultFlow:
 
         start_calls = []
 
-        async def mock_start_new_execution(input_data, *, tool_results=None, message_batch=None):
+        async def mock_start_new_execution(input_data, *, tool_results=None, message_batch=None, **kwargs):
             start_calls.append((tool_results, message_batch))
 
             call_id = None
             if tool_results:
-                call_id = tool_results[0]['message'].tool_call_id
+                call_id = tool_results[0].message.tool_call_id
             elif message_batch:
                 for message in message_batch:
                     tool_calls = getattr(message, "tool_calls", None)
@@ -632,7 +792,7 @@ class TestToolResultFlow:
         first_tool_results, first_batch = start_calls[0]
         assert first_tool_results is not None
         assert first_batch is None
-        assert first_tool_results[0]['message'].id == "tool_result"
+        assert first_tool_results[0].message.id == "tool_result"
 
         assert pending_mock.await_count == 1
         pending_call = pending_mock.await_args_list[0]
@@ -659,7 +819,7 @@ class TestToolResultFlow:
 
         call_sequence = []
 
-        async def mock_start_new_execution(input_data, *, tool_results=None, message_batch=None):
+        async def mock_start_new_execution(input_data, *, tool_results=None, message_batch=None, **kwargs):
             call_sequence.append(("start", tool_results, message_batch))
             yield RunStartedEvent(
                 type=EventType.RUN_STARTED,
@@ -734,7 +894,7 @@ class TestToolResultFlow:
             RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id="thread_1", run_id="run_1")
         ]
 
-        async def mock_start_new_execution(input_data, *, tool_results=None, message_batch=None):
+        async def mock_start_new_execution(input_data, *, tool_results=None, message_batch=None, **kwargs):
             for event in mock_events:
                 yield event
 
@@ -181,4 +181,58 @@ class TestHITLToolTracking:
             # Execution should NOT be cleaned up due to pending tool call
             assert "test_thread" in adk_middleware._active_executions
             execution = adk_middleware._active_executions["test_thread"]
-            assert execution.is_complete
\ No newline at end of file
+            assert execution.is_complete
+
+    @pytest.mark.asyncio
+    async def test_pending_tool_calls_are_deduplicated(self, adk_middleware):
+        """Test that re-adding a pending tool call leaves the stored list unchanged."""
+        await adk_middleware._ensure_session_exists(
+            app_name="test_app",
+            user_id="test_user",
+            session_id="test_thread",
+            initial_state={}
+        )
+
+        for tool_call_id in ("call_1", "call_2", "call_1"):
+            await adk_middleware._add_pending_tool_call_with_context(
+                "test_thread", tool_call_id, "test_app", "test_user"
+            )
+
+        pending = await adk_middleware._session_manager.get_state_value(
+            session_id="test_thread",
+            app_name="test_app",
+            user_id="test_user",
+            key="pending_tool_calls"
+        )
+        assert pending == ["call_1", "call_2"]
+
+        removed = await adk_middleware._remove_pending_tool_calls("test_thread", {"call_1", "missing"})
+        assert removed == {"call_1"}
+        assert await adk_middleware._has_pending_tool_calls("test_thread")
+
+    @pytest.mark.asyncio
+    async def test_pending_tool_call_batch_uses_single_state_update(self, adk_middleware):
+        """Test that a batch of tool calls is recorded with one state mutation."""
+        await adk_middleware._ensure_session_exists(
+            app_name="test_app",
+            user_id="test_user",
+            session_id="test_thread",
+            initial_state={}
+        )
+        session_manager = adk_middleware._session_manager
+
+        with patch.object(
+            session_manager, 'mutate_state_value', wraps=session_manager.mutate_state_value
+        ) as mutate_mock:
+            await adk_middleware._add_pending_tool_calls_with_context(
+                "test_thread", ["call_1", "call_2", "call_3"], "test_app", "test_user"
+            )
+
+        assert mutate_mock.await_count == 1
+        pending = await session_manager.get_state_value(
+            session_id="test_thread",
+            app_name="test_app",
+            user_id="test_user",
+            key="pending_tool_calls"
+        )
+        assert pending == ["call_1", "call_2", "call_3"]
@@ -5,7 +5,10 @@ import pytest
 import json
 from unittest.mock import MagicMock, patch, PropertyMock
 
-from ag_ui.core import UserMessage, AssistantMessage, SystemMessage, ToolMessage, ToolCall, FunctionCall
+from ag_ui.core import (
+    UserMessage, AssistantMessage, SystemMessage, ToolMessage, ToolCall, FunctionCall,
+    TextInputContent, BinaryInputContent
+)
 from google.adk.events import Event as ADKEvent
 from google.genai import types
 
@@ -15,8 +18,10 @@ from ag_ui_adk.utils.converters import (
     convert_state_to_json_patch,
     convert_json_patch_to_state,
     extract_text_from_content,
+    flatten_message_content,
     create_error_message
 )
+from ag_ui_adk.utils.serialization import json_dumps, json_loads
 
 
 class TestConvertAGUIMessagesToADK:
@@ -109,6 +114,49 @@ class TestConvertAGUIMessagesToADK:
         assert func_part.function_call.args == {"location": "New York"}
         assert func_part.function_call.id == "call_123"
 
+    def test_replayed_tool_call_arguments_are_not_shared(self):
+        """Test that converting the same tool call twice yields independent args."""
+        def convert(arguments):
+            assistant_msg = AssistantMessage(
+                id="assistant_replay",
+                role="assistant",
+                tool_calls=[ToolCall(
+                    id="call_replay",
+                    type="function",
+                    function=FunctionCall(name="lookup", arguments=arguments)
+                )]
+            )
+            return convert_ag_ui_messages_to_adk([assistant_msg])[0].content.parts[0].function_call.args
+
+        for arguments in ('{"city": "Paris"}', '{"filters": {"city": "Paris"}}'):
+            first = convert(arguments)
+            first["mutated"] = True
+            for value in first.values():
+                if isinstance(value, dict):
+                    value["mutated"] = True
+
+            assert "mutated" not in json.dumps(convert(arguments))
+
+    def test_nested_tool_call_arguments_parsed_once(self):
+        """Test that replayed nested arguments come from the cache, not a re-parse."""
+        assistant_msg = AssistantMessage(
+            id="assistant_nested",
+            role="assistant",
+            tool_calls=[ToolCall(
+                id="call_nested",
+                type="function",
+                function=FunctionCall(name="search", arguments='{"query": {"terms": ["parse", "once"]}}')
+            )]
+        )
+
+        with patch('ag_ui_adk.utils.converters.json_loads', side_effect=json.loads) as mock_loads:
+            first = convert_ag_ui_messages_to_adk([assistant_msg])[0].content.parts[0].function_call.args
+            second = convert_ag_ui_messages_to_adk([assistant_msg])[0].content.parts[0].function_call.args
+
+        assert mock_loads.call_count == 1
+        assert first == second == {"query": {"terms": ["parse", "once"]}}
+        assert first["query"] is not second["query"]
+
     def test_convert_assistant_message_with_dict_tool_args(self):
         """Test converting tool calls with dict arguments (not JSON string)."""
         tool_call = ToolCall(
@@ -215,6 +263,18 @@ class TestConvertAGUIMessagesToADK:
         assert adk_events[1].id == "2"
         assert adk_events[2].id == "3"
 
+    def test_convert_message_subclass_uses_base_conversion(self):
+        """Test that subclasses of AG-UI message types convert like their base class."""
+        class TaggedUserMessage(UserMessage):
+            pass
+
+        adk_events = convert_ag_ui_messages_to_adk([
+            TaggedUserMessage(id="tagged", role="user", content="Hello")
+        ])
+
+        assert len(adk_events) == 1
+        assert adk_events[0].content.parts[0].text == "Hello"
+
     @patch('ag_ui_adk.utils.converters.logger')
     def test_convert_with_exception_handling(self, mock_logger):
         """Test that exceptions during conversion are logged and skipped."""
@@ -232,6 +292,35 @@ class TestConvertAGUIMessagesToADK:
             mock_logger.error.assert_called_once()
             assert "Error converting message bad" in str(mock_logger.error.call_args)
 
+    @patch('ag_ui_adk.utils.converters.logger')
+    def test_convert_skips_malformed_tool_arguments(self, mock_logger):
+        """Test that a message with invalid tool-call JSON is logged and skipped."""
+        messages = [
+            AssistantMessage(
+                id="bad_args",
+                role="assistant",
+                tool_calls=[ToolCall(
+                    id="call_bad",
+                    type="function",
+                    function=FunctionCall(name="lookup", arguments="{not json")
+                )]
+            ),
+            UserMessage(id="good", role="user", content="Hello")
+        ]
+
+        adk_events = convert_ag_ui_messages_to_adk(messages)
+
+        assert [event.id for event in adk_events] == ["good"]
+        assert "Error converting message bad_args" in str(mock_logger.error.call_args)
+
+    def test_convert_propagates_unexpected_errors(self):
+        """Test that errors other than invalid data are not swallowed."""
+        with patch('ag_ui_adk.utils.converters.ADKEvent') as mock_adk_event:
+            mock_adk_event.side_effect = RuntimeError("unexpected")
+
+            with pytest.raises(RuntimeError):
+                convert_ag_ui_messages_to_adk([UserMessage(id="1", role="user", content="Hi")])
+
 
 class TestConvertADKEventToAGUIMessage:
     """Tests for convert_adk_event_to_ag_ui_message function."""
@@ -316,7 +405,7 @@ class TestConvertADKEventToAGUIMessage:
         assert tool_call.id == "call_123"
         assert tool_call.type == "function"
         assert tool_call.function.name == "get_weather"
-        assert tool_call.function.arguments == '{"location": "Boston"}'
+        assert tool_call.function.arguments == '{"location":"Boston"}'
 
     def test_convert_assistant_event_with_text_and_function_call(self):
         """Test converting assistant event with both text and function call."""
@@ -528,6 +617,25 @@ class TestStateConversionFunctions:
         assert state_delta["user/name"] == "Bob"
         assert state_delta["config/theme"] == "dark"
 
+    def test_convert_json_patch_to_state_strips_single_leading_slash(self):
+        """Test that only the root slash is removed from patch paths."""
+        patches = [
+            {"op": "replace", "path": "//slashed", "value": 1},
+            {"op": "add", "path": "bare", "value": 2}
+        ]
+
+        assert convert_json_patch_to_state(patches) == {"/slashed": 1, "bare": 2}
+
+    def test_convert_json_patch_to_state_unescapes_pointers(self):
+        """Test that RFC 6901 escapes in patch paths are decoded into state keys."""
+        patches = [
+            {"op": "replace", "path": "/a~1b", "value": 1},
+            {"op": "add", "path": "/tilde~0key", "value": 2},
+            {"op": "remove", "path": "/~01"}
+        ]
+
+        assert convert_json_patch_to_state(patches) == {"a/b": 1, "tilde~key": 2, "~1": None}
+
     def test_convert_json_patch_to_state_with_unsupported_ops(self):
         """Test converting patches with unsupported operations."""
         patches = [
@@ -564,6 +672,15 @@ class TestStateConversionFunctions:
         assert state_delta["good"] == "value"
         assert state_delta[""] == "empty_path"  # Empty path becomes empty key
 
+    def test_roundtrip_conversion_escapes_pointer_characters(self):
+        """Test that keys containing '/' and '~' are escaped and survive a roundtrip."""
+        original_state = {"a/b": 1, "c~d": None}
+
+        patches = convert_state_to_json_patch(original_state)
+
+        assert [patch["path"] for patch in patches] == ["/a~1b", "/c~0d"]
+        assert convert_json_patch_to_state(patches) == original_state
+
     def test_roundtrip_conversion(self):
         """Test that state -> patches -> state works correctly."""
         original_state = {
@@ -650,6 +767,17 @@ class TestUtilityFunctions:
 
         assert result == ""
 
+    def test_flatten_message_content(self):
+        """Test flattening string, empty and multimodal message content."""
+        assert flatten_message_content("Hello") == "Hello"
+        assert flatten_message_content(None) == ""
+        assert flatten_message_content([
+            TextInputContent(type="text", text="First"),
+            BinaryInputContent(type="binary", mime_type="image/png", url="https://example.com/a.png"),
+            TextInputContent(type="text", text=""),
+            TextInputContent(type="text", text="Second"),
+        ]) == "First\nSecond"
+
     def test_create_error_message_basic(self):
         """Test creating error message from exception."""
         error = ValueError("Something went wrong")
@@ -692,4 +820,87 @@ class TestUtilityFunctions:
 
         result = create_error_message(error)
 
-        assert result == "ValueError: "
\ No newline at end of file
+        assert result == "ValueError: "
+
+    def test_json_dumps_compact_and_falls_back_for_unsupported_values(self):
+        """Test JSON serialization helper output and stdlib fallback."""
+        assert json_dumps({"location": "Boston", "days": 3}) == '{"location":"Boston","days":3}'
+        assert json_dumps({"city": "Zürich"}) == '{"city":"Zürich"}'
+        # Non-string keys and integers wider than 64 bits still serialize
+        assert json.loads(json_dumps({1: 2 ** 70})) == {"1": 2 ** 70}
+        assert json_loads('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_json_dumps_stdlib_path_matches_orjson_format(self):
+        """Test that the stdlib fallback produces the same output format."""
+        from ag_ui_adk.utils.serialization import _stdlib_dumps
+
+        value = {"city": "Zürich", "days": [1, 2], "nested": {"ok": True, "none": None}}
+        assert _stdlib_dumps(value) == '{"city":"Zürich","days":[1,2],"nested":{"ok":true,"none":null}}'
+        assert _stdlib_dumps(value) == json_dumps(value)
+
+    def test_json_dumps_stdlib_path_converts_numpy_values(self):
+        """Test that the stdlib path converts numpy-like values without numpy installed."""
+        from ag_ui_adk.utils.serialization import _stdlib_dumps
+
+        class FakeArray:
+            __module__ = "numpy"
+
+            def tolist(self):
+                return [1, 2]
+
+        class FakeScalar:
+            __module__ = "numpy.core"
+
+            def item(self):
+                return 0.5
+
+        assert _stdlib_dumps({"values": FakeArray(), "scale": FakeScalar()}) == '{"values":[1,2],"scale":0.5}'
+        assert json_dumps({"values": FakeArray()}) == '{"values":[1,2]}'
+
+        with pytest.raises(TypeError):
+            _stdlib_dumps({"value": object()})
+
+    def test_json_dumps_serializes_numpy_values(self):
+        """Test that numpy values in tool arguments serialize when orjson is available."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("orjson")
+
+        assert json.loads(json_dumps({"values": np.array([1, 2]), "scale": np.float64(0.5)})) == {
+            "values": [1, 2],
+            "scale": 0.5
+        }
+
+    def test_json_loads_keeps_wide_integers_and_non_finite_numbers(self):
+        """Test that parsing matches the stdlib whether or not orjson is installed."""
+        assert json_loads('{"id": 123456789012345678901234567890}') == {"id": 123456789012345678901234567890}
+        assert json_loads('[NaN, Infinity]')[1] == float("inf")
+
+        messages = [
+            AssistantMessage(
+                id="1",
+                role="assistant",
+                tool_calls=[ToolCall(
+                    id="call_1",
+                    type="function",
+                    function=FunctionCall(name="lookup", arguments='{"id": 123456789012345678901234567890}')
+                )]
+            )
+        ]
+        adk_messages = convert_ag_ui_messages_to_adk(messages)
+        assert adk_messages[0].content.parts[0].function_call.args == {"id": 123456789012345678901234567890}
+
+    def test_serialization_without_orjson(self):
+        """Test the helpers when orjson is not installed."""
+        import importlib
+        import sys
+        from ag_ui_adk.utils import serialization
+
+        with patch.dict(sys.modules, {"orjson": None}):
+            fallback = importlib.reload(serialization)
+            try:
+                assert fallback.orjson is None
+                assert fallback.json_dumps({"city": "Zürich", "days": [1, 2]}) == '{"city":"Zürich","days":[1,2]}'
+                assert fallback.json_dumps({1: 2 ** 70}) == '{"1":1180591620717411303424}'
+                assert fallback.json_loads('{"id": 123456789012345678901234567890}') == {"id": 123456789012345678901234567890}
+            finally:
+                importlib.reload(serialization)